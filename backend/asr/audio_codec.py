@@ -0,0 +1,107 @@
+# backend/asr/audio_codec.py
+
+"""
+audio_chunk 바이너리 PCM 프레임 형식
+
+    offset  size  필드
+    0       2     magic        b"AP"
+    2       1     version      1
+    3       1     format       0 = int16 LE, 1 = float32 LE
+    4       4     sample_rate  uint32 LE
+    8       4     seq          uint32 LE (세션 내 증가하는 순번)
+    12      ...   PCM 샘플 (mono)
+
+float32 프레임은 np.frombuffer로 복사 없이 그대로 파이프라인까지 전달되며,
+int16 프레임은 float32 변환 한 번만 수행합니다(페이로드는 JSON float 리스트 대비 약 1/4~1/8).
+기존 JSON float 리스트와 헤더 없는 float32 바이트도 계속 허용합니다.
+magic(b"AP")으로 시작하지만 헤더가 올바르지 않은 프레임은 헤더 없는 형식으로 해석하지 않고
+AudioFrameError로 거부합니다(헤더 12바이트가 샘플로 섞여 잡음이 되지 않도록).
+"""
+
+import struct
+from typing import NamedTuple
+
+import numpy as np
+
+MAGIC = b"AP"
+VERSION = 1
+HEADER = struct.Struct("<2sBBII")
+TARGET_SAMPLE_RATE = 16000
+
+FORMAT_INT16 = 0
+FORMAT_FLOAT32 = 1
+_DTYPES = {
+    FORMAT_INT16: np.dtype("<i2"),
+    FORMAT_FLOAT32: np.dtype("<f4"),
+}
+
+class AudioFrameError(ValueError):
+    """잘못된 audio_chunk 프레임 (프로토콜 오류)"""
+
+class AudioFrame(NamedTuple):
+    samples: np.ndarray
+    sample_rate: int
+    seq: int | None
+
+def encode_audio_frame(samples: np.ndarray, seq: int, sample_rate: int = TARGET_SAMPLE_RATE, fmt: int = FORMAT_INT16) -> bytes:
+    """테스트/도구용 인코더 (클라이언트와 동일한 형식)"""
+    if fmt == FORMAT_INT16:
+        pcm = np.clip(np.asarray(samples, dtype=np.float32) * 32767, -32768, 32767).astype("<i2")
+    else:
+        pcm = np.asarray(samples, dtype="<f4")
+    return HEADER.pack(MAGIC, VERSION, fmt, sample_rate, seq) + pcm.tobytes()
+
+def decode_audio_frame(data) -> AudioFrame:
+    """
+    audio_chunk 페이로드를 16kHz float32 배열로 변환합니다.
+    - 헤더가 있는 바이너리 프레임
+    - 헤더 없는 float32 바이트 (기존 /asr/ws/inference 형식)
+    - JSON float 리스트 (기존 audio_chunk 형식)
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        buf = memoryview(data)
+        header = _parse_header(buf)
+        if header is None:
+            return AudioFrame(_frombuffer(buf, np.dtype("<f4"), 0), TARGET_SAMPLE_RATE, None)
+
+        fmt, sample_rate, seq = header
+        samples = _frombuffer(buf, _DTYPES[fmt], HEADER.size)
+        if fmt == FORMAT_INT16:
+            samples = np.multiply(samples, 1 / 32768, dtype=np.float32)
+        if sample_rate != TARGET_SAMPLE_RATE:
+            samples = _resample(samples, sample_rate, TARGET_SAMPLE_RATE)
+        return AudioFrame(samples, sample_rate, seq)
+
+    return AudioFrame(np.asarray(data, dtype=np.float32), TARGET_SAMPLE_RATE, None)
+
+def _parse_header(buf: memoryview):
+    """magic이 없으면 None (헤더 없는 형식), magic이 있는데 헤더가 잘못되었으면 AudioFrameError"""
+    if bytes(buf[:2]) != MAGIC:
+        return None
+    if len(buf) < HEADER.size:
+        raise AudioFrameError(f"프레임 헤더가 잘렸습니다 ({len(buf)}바이트).")
+    magic, version, fmt, sample_rate, seq = HEADER.unpack_from(buf)
+    if version != VERSION:
+        raise AudioFrameError(f"지원하지 않는 프레임 버전입니다: {version}")
+    if fmt not in _DTYPES:
+        raise AudioFrameError(f"지원하지 않는 PCM 형식입니다: {fmt}")
+    if sample_rate == 0:
+        raise AudioFrameError("sample_rate가 0입니다.")
+    if (len(buf) - HEADER.size) % _DTYPES[fmt].itemsize:
+        raise AudioFrameError(f"PCM 페이로드 길이가 {_DTYPES[fmt].itemsize}바이트 단위가 아닙니다.")
+    return fmt, sample_rate, seq
+
+def _frombuffer(buf: memoryview, dtype: np.dtype, offset: int) -> np.ndarray:
+    if (len(buf) - offset) % dtype.itemsize:
+        raise AudioFrameError(f"PCM 페이로드 길이가 {dtype.itemsize}바이트 단위가 아닙니다.")
+    samples = np.frombuffer(buf, dtype=dtype, offset=offset)
+    # 빅엔디언 플랫폼에서만 변환이 필요하며, 리틀엔디언에서는 복사 없이 그대로 반환
+    return samples if samples.dtype.isnative else samples.astype(dtype.newbyteorder("="))
+
+def _resample(samples: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
+    """선형 보간 리샘플링 (클라이언트가 16kHz로 보내면 발생하지 않음)"""
+    if len(samples) == 0:
+        return samples
+    n_out = int(round(len(samples) * dst_rate / src_rate))
+    x_out = np.linspace(0, len(samples) - 1, n_out, dtype=np.float64)
+    return np.interp(x_out, np.arange(len(samples)), samples).astype(np.float32)
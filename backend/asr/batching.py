@@ -0,0 +1,182 @@
+# backend/asr/batching.py
+
+import asyncio
+import threading
+
+import numpy as np
+
+class _Request:
+    __slots__ = ("audio", "language", "key", "future")
+
+    def __init__(self, audio, language, key, future):
+        self.audio = audio
+        self.language = language
+        self.key = key
+        self.future = future
+
+class _Group:
+    __slots__ = ("audio", "language", "requests")
+
+    def __init__(self, audio, language, requests):
+        self.audio = audio
+        self.language = language
+        self.requests = requests
+
+class BatchScheduler:
+    """
+    모델 하나에 대한 동적 마이크로 배칭 스케줄러.
+
+    max_wait_ms 동안(또는 max_batch_size에 도달할 때까지) 들어온 요청을 모으고,
+    같은 key(Socket.IO sid)로 쌓인 청크는 하나의 오디오로 이어 붙여 한 번만 전사합니다.
+    WhisperPipeline에는 배치 차원이 없으므로 나머지 요청은 하나씩 워커에 넘기고,
+    끝나는 대로 각 요청의 future를 채웁니다(다른 sid의 전사를 기다리지 않음).
+    합쳐진 요청들은 모두 같은 결과 객체를 받습니다.
+    """
+
+    def __init__(self, model_id: str, worker, infer, max_batch_size: int = 8, max_wait_ms: float = 10):
+        self.model_id = model_id
+        self.worker = worker
+        self.infer = infer
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+
+        self._queue: asyncio.Queue | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._closed = False
+        # 큐에서 꺼냈지만 아직 워커에 넘기지 못한 요청 (언로드 시 실패 처리)
+        self._held: list[_Request] = []
+
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "batches": 0,
+            "requests": 0,
+            "coalesced": 0,
+            "max_batch_seen": 0,
+        }
+
+    async def submit(self, audio, language, key=None):
+        if self._closed:
+            raise RuntimeError(f"모델 {self.model_id}의 배치 스케줄러가 종료되었습니다.")
+        self._ensure_started()
+        future = self._loop.create_future()
+        self._queue.put_nowait(_Request(audio, language, key, future))
+        return await future
+
+    def _ensure_started(self):
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        # 워커 동시성만큼만 동시에 흘려보내고, 나머지는 큐에 남겨 다음 배치에서 합침
+        self._slots = asyncio.Semaphore(self.worker.concurrency)
+        self._task = self._loop.create_task(self._collect())
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            self._held = batch
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                try:
+                    if remaining <= 0:
+                        batch.append(self._queue.get_nowait())
+                    else:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                    break
+
+            groups = _coalesce([r for r in batch if not r.future.done()])
+            if not groups:
+                self._held = []
+                continue
+            with self._stats_lock:
+                self._stats["batches"] += 1
+                self._stats["requests"] += len(batch)
+                self._stats["coalesced"] += len(batch) - len(groups)
+                self._stats["max_batch_seen"] = max(self._stats["max_batch_seen"], len(groups))
+
+            for group in groups:
+                await self._slots.acquire()
+                loop.create_task(self._dispatch(group))
+            self._held = []
+
+    async def _dispatch(self, group: _Group):
+        try:
+            result = await self.worker.submit(self.infer, self.model_id, group.audio, group.language)
+        except asyncio.CancelledError:
+            # 워커 종료(shutdown(cancel_futures=True))로 실행되지 못한 작업
+            error = RuntimeError(f"모델 {self.model_id}의 추론이 취소되었습니다.")
+            for req in group.requests:
+                _fail(req.future, error)
+            raise
+        except Exception as e:
+            for req in group.requests:
+                _fail(req.future, e)
+        else:
+            for req in group.requests:
+                _resolve(req.future, result)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """스케줄러 종료. 다른 스레드(모델 언로드 라우트)에서 호출될 수 있음"""
+        self._closed = True
+        if self._loop is None or self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._cancel)
+
+    def _cancel(self):
+        if self._task:
+            self._task.cancel()
+        error = RuntimeError(f"모델 {self.model_id}이 언로드되었습니다.")
+        # 슬롯을 기다리던 그룹 등 이미 큐에서 꺼낸 요청
+        for req in self._held:
+            _fail(req.future, error)
+        self._held = []
+        while self._queue and not self._queue.empty():
+            _fail(self._queue.get_nowait().future, error)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            batches = self._stats["batches"]
+            return {
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait * 1000,
+                "pending": self._queue.qsize() if self._queue else 0,
+                **self._stats,
+                "avg_batch_size": round(self._stats["requests"] / batches, 2) if batches else None,
+            }
+
+def _coalesce(requests: list[_Request]) -> list[_Group]:
+    """같은 key/언어로 들어온 청크를 도착 순서대로 하나의 오디오로 합침"""
+    groups: list[_Group] = []
+    by_key: dict = {}
+    for req in requests:
+        group_key = (req.key, req.language) if req.key is not None else None
+        group = by_key.get(group_key) if group_key is not None else None
+        if group is None:
+            group = _Group(None, req.language, [])
+            groups.append(group)
+            if group_key is not None:
+                by_key[group_key] = group
+        group.requests.append(req)
+
+    for group in groups:
+        if len(group.requests) == 1:
+            group.audio = group.requests[0].audio
+        else:
+            group.audio = np.concatenate([np.asarray(r.audio, dtype=np.float32) for r in group.requests])
+    return groups
+
+def _resolve(future: asyncio.Future, value):
+    if not future.done():
+        future.set_result(value)
+
+def _fail(future: asyncio.Future, error: Exception):
+    if not future.done():
+        future.set_exception(error)
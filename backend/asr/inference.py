@@ -0,0 +1,106 @@
+# backend/asr/inference.py
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+class InferenceWorker:
+    """
+    모델 하나에 대응하는 추론 전용 스레드 풀.
+
+    OpenVINO 추론은 GIL을 해제하므로 스레드 풀로도 이벤트 루프를 막지 않고 실행할 수 있습니다.
+    모델마다 별도 큐(executor)를 두어 한 모델의 적체가 다른 모델에 영향을 주지 않습니다.
+    """
+
+    def __init__(self, model_id: str, concurrency: int = 1, history: int = 200):
+        self.model_id = model_id
+        self.concurrency = max(1, concurrency)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.concurrency,
+            thread_name_prefix=f"asr-infer-{model_id[:8]}"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._latencies = deque(maxlen=history)   # 실제 추론 시간(ms)
+        self._waits = deque(maxlen=history)       # 큐 대기 시간(ms)
+
+    async def submit(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        enqueued_at = time.perf_counter()
+        state = "queued"
+        with self._lock:
+            self._queued += 1
+
+        def _job():
+            nonlocal state
+            begin = time.perf_counter()
+            with self._lock:
+                if state != "queued":
+                    return None
+                state = "started"
+                self._queued -= 1
+                self._running += 1
+                self._waits.append((begin - enqueued_at) * 1000)
+            ok = False
+            try:
+                result = fn(*args, **kwargs)
+                ok = True
+                return result
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._latencies.append((time.perf_counter() - begin) * 1000)
+                    if ok:
+                        self._completed += 1
+                    else:
+                        self._failed += 1
+
+        try:
+            return await loop.run_in_executor(self._executor, _job)
+        except RuntimeError as e:
+            if "shutdown" in str(e):
+                raise RuntimeError(f"모델 {self.model_id}의 추론 워커가 종료되었습니다.") from e
+            raise
+        finally:
+            # 실행되지 못하고 취소/거부된 작업은 대기열 집계에서 제외
+            with self._lock:
+                if state == "queued":
+                    state = "abandoned"
+                    self._queued -= 1
+
+    def shutdown(self):
+        """대기 중인 작업은 취소하고, 실행 중인 추론이 끝날 때까지 기다림"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            waits = list(self._waits)
+            return {
+                "model_id": self.model_id,
+                "concurrency": self.concurrency,
+                "queue_depth": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "failed": self._failed,
+                "latency_avg_ms": _avg(latencies),
+                "latency_p50_ms": _percentile(latencies, 0.50),
+                "latency_p95_ms": _percentile(latencies, 0.95),
+                "queue_wait_avg_ms": _avg(waits),
+            }
+
+def _avg(values) -> float | None:
+    if not values:
+        return None
+    return round(sum(values) / len(values), 2)
+
+def _percentile(sorted_values, q: float) -> float | None:
+    if not sorted_values:
+        return None
+    idx = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return round(sorted_values[idx], 2)
@@ -1,5 +1,6 @@
 # backend/asr/model_manager.py
 
+import os
 import uuid
 import gc
 import time
@@ -8,11 +9,23 @@ import openvino_genai
 import azure.cognitiveservices.speech as speechsdk
 
 from backend.asr.schemas import ModelRegister
+from backend.asr.inference import InferenceWorker
+from backend.asr.batching import BatchScheduler
 from backend.db.database import save_model_to_db, update_model_loaded_status, update_model_status
 
+# 모델별 동시 추론 수 (WhisperPipeline은 인스턴스 단위 동시 호출을 보장하지 않으므로 기본 1)
+INFER_CONCURRENCY = int(os.getenv("ASR_INFER_CONCURRENCY", 1))
+
+# 동시 요청 마이크로 배칭 설정
+BATCHING_ENABLED = os.getenv("ASR_BATCHING", "1") == "1"
+BATCH_MAX_SIZE = int(os.getenv("ASR_BATCH_MAX_SIZE", 8))
+BATCH_MAX_WAIT_MS = float(os.getenv("ASR_BATCH_MAX_WAIT_MS", 10))
+
 class ModelManager:
     def __init__(self):
         self.models = {}
+        self.workers: dict[str, InferenceWorker] = {}
+        self.batchers: dict[str, BatchScheduler] = {}
         self._initialize_models()
 
     def _initialize_models(self):
@@ -57,6 +70,7 @@ class ModelManager:
                 # Whisper (OpenVINO)
                 inst = openvino_genai.WhisperPipeline(info.path, device=info.device)
                 model["instance"] = inst
+                self._start_worker(model_id)
                 print(f'[DEBUG] Whisper (OpenVINO) 모델 {model_id} 로드 완료')
             
             elif fw == "azure":
@@ -86,6 +100,7 @@ class ModelManager:
             fw = info.framework.lower()
 
             if fw == 'openvino':
+                self._stop_worker(model_id)
                 openvino_genai.openvino.shutdown()
                 gc.collect()
                 model["instance"] = None
@@ -134,13 +149,61 @@ class ModelManager:
             return "error"
         return "idle"
     
+    def _start_worker(self, model_id):
+        self._stop_worker(model_id)
+        worker = InferenceWorker(model_id, concurrency=INFER_CONCURRENCY)
+        self.workers[model_id] = worker
+        if BATCHING_ENABLED:
+            self.batchers[model_id] = BatchScheduler(
+                model_id,
+                worker,
+                self.infer,
+                max_batch_size=BATCH_MAX_SIZE,
+                max_wait_ms=BATCH_MAX_WAIT_MS,
+            )
+
+    def _stop_worker(self, model_id):
+        batcher = self.batchers.pop(model_id, None)
+        if batcher:
+            batcher.close()
+        worker = self.workers.pop(model_id, None)
+        if worker:
+            worker.shutdown()
+
+    async def infer_async(self, model_id, audio, language, key=None):
+        """
+        모델 전용 추론 워커에서 infer()를 실행하고 결과를 기다립니다.
+        이벤트 루프(LLM 스트리밍, Socket.IO heartbeat)를 막지 않습니다.
+        배칭이 켜져 있으면 동시 요청을 모아서 처리하며, key(sid)가 같은 청크는 합쳐집니다.
+        """
+        batcher = self.batchers.get(model_id)
+        if batcher is not None:
+            return await batcher.submit(audio, language, key=key)
+
+        worker = self.workers.get(model_id)
+        if worker is None:
+            raise RuntimeError(f"모델 {model_id}의 추론 워커가 없습니다. 모델이 로드되었는지 확인하세요.")
+        return await worker.submit(self.infer, model_id, audio, language)
+
+    def get_inference_stats(self):
+        stats = []
+        for model_id, worker in list(self.workers.items()):
+            entry = worker.stats()
+            batcher = self.batchers.get(model_id)
+            entry["batching"] = batcher.stats() if batcher else None
+            stats.append(entry)
+        return stats
+
     def infer(self, model_id, audio, language):
         model = self.models.get(model_id)
+        if not model or model['instance'] is None:
+            raise RuntimeError(f"모델 {model_id}이 로드되지 않았습니다.")
         info = model['info']
         fw = info.framework.lower()
         inst = model['instance']
         if fw == 'openvino':
-            np_audio = np.array(audio, dtype=np.float32)
+            # float32 배열이면 복사 없이 그대로 사용
+            np_audio = np.asarray(audio, dtype=np.float32)
             result = inst.generate(np_audio, language=language)
             return result.texts
         elif fw == 'azure':
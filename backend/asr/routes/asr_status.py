@@ -2,6 +2,8 @@
 
 from fastapi import APIRouter
 from backend.db.database import get_connection
+from backend.db.pool import get_pool_stats
+from backend.db.log_sink import log_sink
 
 router = APIRouter()
 
@@ -92,4 +94,12 @@ def get_loaded_model_info():
         return { "loaded": False, "error": str(e) }
     finally:
         if 'conn' in locals() and conn:
-            conn.close()
\ No newline at end of file
+            conn.close()
+
+@router.get("/asr/db/pool")
+def get_db_pool_stats():
+    return {"pools": get_pool_stats()}
+
+@router.get("/asr/db/log-sink")
+def get_log_sink_stats():
+    return log_sink.stats()
@@ -1,11 +1,12 @@
 # backend/asr/service.py
 
 from fastapi import WebSocket, WebSocketDisconnect, APIRouter, Body
-import numpy as np
 
 from backend.asr.model_manager import model_manager
 from backend.asr.schemas import ModelRegister
-from backend.db.database import delete_model_from_db, get_models_from_db, save_result_to_db, save_log_to_db
+from backend.asr.audio_codec import AudioFrameError, decode_audio_frame
+from backend.db.database import delete_model_from_db, get_models_from_db, save_log_to_db
+from backend.db import aio as adb
 
 router = APIRouter()
 
@@ -50,7 +51,7 @@ async def save_transcription(
     language: str = Body('ko')
 ):
     try:
-        save_result_to_db(model_name=model, text=text, language=language)
+        await adb.save_result_to_db(model_name=model, text=text, language=language)
         save_log_to_db(
             log_type='DB',
             message=f'Saved transcription result to DB (model={model})',
@@ -65,6 +66,10 @@ async def save_transcription(
         )
         raise
 
+@router.get('/inference/stats')
+def get_inference_stats():
+    return {'workers': model_manager.get_inference_stats()}
+
 @router.get('/models')
 def list_models():
     models = get_models_from_db()
@@ -75,6 +80,8 @@ def list_models():
 @router.delete('/models/{model_id}')
 def delete_model(model_id: str):
     if model_id in model_manager.models:
+        if model_manager.models[model_id]['loaded']:
+            model_manager.unload_model(model_id)
         del model_manager.models[model_id]
     delete_model_from_db(model_id)
     return {'status': 'deleted', 'model_id': model_id}
@@ -95,7 +102,6 @@ async def websocket_inference(websocket: WebSocket, model_id: str):
         await websocket.close()
         return
     
-    inst = entry["instance"]
     fw = entry["info"].framework.lower()
 
     if fw == 'openvino':
@@ -104,8 +110,12 @@ async def websocket_inference(websocket: WebSocket, model_id: str):
         try:
             while True:
                 audio_bytes = await websocket.receive_bytes()
-                audio_np = np.frombuffer(audio_bytes, dtype=np.float32)
-                texts = inst['pipeline'].generate(audio_np, language='<|ko|>').texts
+                try:
+                    frame = decode_audio_frame(audio_bytes)
+                except AudioFrameError as e:
+                    await websocket.send_text(f'error: 잘못된 오디오 프레임 - {e}')
+                    continue
+                texts = await model_manager.infer_async(model_id, frame.samples, language='<|ko|>')
                 for t in texts:
                     await websocket.send_text(t)
         except WebSocketDisconnect:
@@ -2,17 +2,36 @@
 
 import asyncio
 import azure.cognitiveservices.speech as speechsdk
-import numpy as np
 
 from backend.sio import sio
 from backend.db.database import save_log_to_db
 from backend.asr.model_manager import model_manager
+from backend.asr.streaming import StreamingTranscriber
+from backend.asr.audio_codec import AudioFrameError, decode_audio_frame
 from backend.utils.encryption import decrypt
 from backend.utils.device_resolver import resolve_input_device_id
 
 # sid 별 SpeechRecognizer 및 done_future 저장
 recognizers = {}
 
+# 로컬 모델 스트리밍 전사 (서버 측 VAD + rolling window)
+# 구간이 겹치는 partial 창이 합쳐지지 않도록 key 없이 추론
+stream_transcriber = StreamingTranscriber(
+    infer=lambda model_id, audio, language: model_manager.infer_async(model_id, audio, language),
+    emit=lambda event, payload, sid: sio.emit(event, payload, to=sid),
+)
+
+# sid 별 마지막으로 처리한 바이너리 프레임 순번
+last_seq: dict[str, int] = {}
+# sid 별 마지막으로 전송한 전사 결과 (배칭에서 합쳐진 청크의 중복 전송 방지)
+last_transcript: dict[str, list] = {}
+
+def forget_session(sid: str):
+    """연결 해제 시 sid에 묶인 전사 상태 정리"""
+    stream_transcriber.discard(sid)
+    last_seq.pop(sid, None)
+    last_transcript.pop(sid, None)
+
 # Whisper / HuggingFace용 로컬 모델 처리 메커니즘
 @sio.on('start_transcribe')
 async def start_transcribe(sid, data):
@@ -27,7 +46,14 @@ async def start_transcribe(sid, data):
         await sio.emit('transcript', {'text': '❌ 모델이 로드되지 않았습니다.'}, to=sid)
         return
     
-    await sio.save_session(sid, {'model_id': model_id})
+    streaming = bool(data.get("streaming", False))
+    last_seq.pop(sid, None)
+    await sio.save_session(sid, {'model_id': model_id, 'streaming': streaming})
+
+    if streaming:
+        stream_transcriber.start(sid, model_id, language=data.get("language", "<|ko|>"))
+    else:
+        stream_transcriber.discard(sid)
 
     await sio.emit('transcript', {'text': '🎙 전사 준비 완료'}, to=sid)
 
@@ -170,19 +196,36 @@ async def audio_chunk(sid, data):
         return
     
     try:
-        audio_np = np.array(data, dtype=np.float32)
+        frame = decode_audio_frame(data)
+
+        # 순서가 뒤바뀌었거나 중복된 프레임은 버림
+        if frame.seq is not None:
+            if sid in last_seq and frame.seq <= last_seq[sid]:
+                return
+            last_seq[sid] = frame.seq
+
+        if session.get("streaming") and stream_transcriber.has(sid):
+            await stream_transcriber.feed(sid, frame.samples)
+            return
 
-        texts = model_manager.infer(model_id, audio_np, language="<|ko|>")
+        texts = await model_manager.infer_async(model_id, frame.samples, language="<|ko|>", key=sid)
         # print("[DEBUG] 전사 결과: ", texts)
-        if texts:
+        # 배칭에서 합쳐진 청크들은 같은 결과 객체를 받으므로 한 번만 전송
+        if texts and last_transcript.get(sid) is not texts:
+            last_transcript[sid] = texts
             await sio.emit('transcript', {'text': texts[0]}, to=sid)
+    except AudioFrameError as e:
+        print(f"[WARN] 잘못된 오디오 프레임 ({sid}): {e}")
+        await sio.emit('transcript', {'text': '⚠️ 잘못된 오디오 프레임입니다.'}, to=sid)
     except Exception as e:
         # print(f"[ERROR] audio_chunk 처리 중 오류: {e}")
         await sio.emit('transcript', {'text': '❌ 전사 실패'}, to=sid)
 
 @sio.on('stop_transcribe')
-async def stop_transcribe(sid):
+async def stop_transcribe(sid, data=None):
     print(f'[SOCKET] stop_transcribe 요청 받음 from {sid}')
+    # 진행 중인 발화가 있으면 final로 마무리
+    await stream_transcriber.stop(sid)
 
 # Azure 전사 중단
 @sio.on('stop_azure_mic')
@@ -0,0 +1,245 @@
+# backend/asr/streaming.py
+
+import asyncio
+import os
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+# 스트리밍 전사 설정
+STREAM_WINDOW_SEC = float(os.getenv("ASR_STREAM_WINDOW_SEC", 8.0))       # partial 전사 창 길이
+STREAM_HOP_SEC = float(os.getenv("ASR_STREAM_HOP_SEC", 1.0))             # partial 전사 간격 (창끼리 겹침)
+STREAM_MAX_SEGMENT_SEC = float(os.getenv("ASR_STREAM_MAX_SEGMENT_SEC", 25.0))  # Whisper 30초 제한 이내
+STREAM_END_SILENCE_MS = float(os.getenv("ASR_STREAM_END_SILENCE_MS", 600))
+
+class EnergyVAD:
+    """
+    RMS 에너지 기반 음성 구간 검출기.
+    비음성 프레임으로 배경 잡음 수준을 추적하고, 잡음 대비 ratio배 이상이면 음성으로 판단합니다.
+    """
+
+    def __init__(self, ratio: float = 3.0, min_rms: float = 0.01, noise_alpha: float = 0.05):
+        self.ratio = ratio
+        self.min_rms = min_rms
+        self.noise_alpha = noise_alpha
+        self.noise_floor = min_rms / ratio
+
+    def is_speech(self, frame: np.ndarray) -> bool:
+        rms = float(np.sqrt(np.mean(np.square(frame, dtype=np.float32))))
+        threshold = max(self.min_rms, self.noise_floor * self.ratio)
+        voiced = rms >= threshold
+        if not voiced:
+            self.noise_floor += self.noise_alpha * (rms - self.noise_floor)
+        return voiced
+
+class PcmRingBuffer:
+    """고정 크기 float32 PCM 링 버퍼"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._buf = np.zeros(capacity, dtype=np.float32)
+        self._pos = 0
+        self._filled = 0
+
+    def write(self, samples: np.ndarray):
+        n = len(samples)
+        if n >= self.capacity:
+            self._buf[:] = samples[-self.capacity:]
+            self._pos = 0
+            self._filled = self.capacity
+            return
+        end = self._pos + n
+        if end <= self.capacity:
+            self._buf[self._pos:end] = samples
+        else:
+            split = self.capacity - self._pos
+            self._buf[self._pos:] = samples[:split]
+            self._buf[:n - split] = samples[split:]
+        self._pos = end % self.capacity
+        self._filled = min(self.capacity, self._filled + n)
+
+    def latest(self, n: int) -> np.ndarray:
+        """가장 최근 n개 샘플을 연속된 배열로 반환"""
+        n = min(n, self._filled)
+        start = self._pos - n
+        if start >= 0:
+            return self._buf[start:self._pos].copy()
+        return np.concatenate((self._buf[start:], self._buf[:self._pos]))
+
+class StreamingSession:
+    """
+    세션(sid) 하나의 스트리밍 전사 상태.
+
+    feed()로 들어온 PCM을 프레임 단위로 VAD 처리하고,
+    - 발화 중에는 hop 간격마다 최근 window 길이 구간을 ('partial', ...) 이벤트로
+    - 발화가 끝나거나 최대 길이에 도달하면 전체 구간을 ('final', ...) 이벤트로
+    반환합니다. 실제 전사는 호출자가 수행합니다.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = SAMPLE_RATE,
+        window_sec: float = STREAM_WINDOW_SEC,
+        hop_sec: float = STREAM_HOP_SEC,
+        max_segment_sec: float = STREAM_MAX_SEGMENT_SEC,
+        end_silence_ms: float = STREAM_END_SILENCE_MS,
+        frame_ms: float = 30,
+        start_frames: int = 3,
+        preroll_ms: float = 200,
+        vad: EnergyVAD | None = None,
+    ):
+        self.sample_rate = sample_rate
+        self.frame_len = int(sample_rate * frame_ms / 1000)
+        self.window = int(sample_rate * window_sec)
+        self.hop = int(sample_rate * hop_sec)
+        self.max_segment = int(sample_rate * max_segment_sec)
+        self.preroll = int(sample_rate * preroll_ms / 1000)
+        self.start_frames = start_frames
+        self.end_frames = max(1, int(end_silence_ms / frame_ms))
+        self.vad = vad or EnergyVAD()
+
+        self.ring = PcmRingBuffer(self.max_segment + self.preroll + self.frame_len)
+        self._carry = np.zeros(0, dtype=np.float32)
+
+        self.in_speech = False
+        self.segment_id = 0
+        self._segment_samples = 0
+        self._since_partial = 0
+        self._voiced_run = 0
+        self._silence_run = 0
+
+    def feed(self, audio) -> list[tuple[str, int, np.ndarray]]:
+        audio = np.asarray(audio, dtype=np.float32)
+        if self._carry.size:
+            audio = np.concatenate((self._carry, audio))
+
+        events = []
+        partial = None
+        n_frames = len(audio) // self.frame_len
+
+        for i in range(n_frames):
+            frame = audio[i * self.frame_len:(i + 1) * self.frame_len]
+            self.ring.write(frame)
+            voiced = self.vad.is_speech(frame)
+
+            if not self.in_speech:
+                self._voiced_run = self._voiced_run + 1 if voiced else 0
+                if self._voiced_run >= self.start_frames:
+                    self.in_speech = True
+                    self.segment_id += 1
+                    self._segment_samples = self._voiced_run * self.frame_len + self.preroll
+                    self._since_partial = 0
+                    self._silence_run = 0
+                continue
+
+            self._segment_samples += self.frame_len
+            self._since_partial += self.frame_len
+            self._silence_run = 0 if voiced else self._silence_run + 1
+
+            if self._silence_run >= self.end_frames or self._segment_samples >= self.max_segment:
+                partial = None
+                events.append(self._finalize())
+            elif self._since_partial >= self.hop:
+                self._since_partial = 0
+                # 한 번의 feed에서 여러 partial이 생기면 가장 최근 것만 사용
+                partial = ("partial", self.segment_id, self.ring.latest(min(self._segment_samples, self.window)))
+
+        self._carry = audio[n_frames * self.frame_len:].copy()
+        if partial is not None:
+            events.append(partial)
+        return events
+
+    def flush(self) -> list[tuple[str, int, np.ndarray]]:
+        """진행 중인 발화를 final로 마무리"""
+        if not self.in_speech:
+            return []
+        return [self._finalize()]
+
+    def _finalize(self):
+        event = ("final", self.segment_id, self.ring.latest(self._segment_samples))
+        self.in_speech = False
+        self._voiced_run = 0
+        self._silence_run = 0
+        self._segment_samples = 0
+        return event
+
+class _SessionState:
+    __slots__ = ("session", "model_id", "language", "partial_busy", "final_lock", "finalized_id")
+
+    def __init__(self, session, model_id, language):
+        self.session = session
+        self.model_id = model_id
+        self.language = language
+        self.partial_busy = False
+        self.final_lock = asyncio.Lock()
+        self.finalized_id = 0
+
+class StreamingTranscriber:
+    """
+    sid별 StreamingSession을 관리하고 이벤트를 전사해
+    Azure 경로와 동일하게 'recognizing'(partial) / 'recognized'(final)로 내보냅니다.
+    """
+
+    def __init__(self, infer, emit):
+        # infer(model_id, audio, language) -> list[str] (awaitable)
+        # emit(event, payload, sid) (awaitable)
+        self._infer = infer
+        self._emit = emit
+        self._sessions: dict[str, _SessionState] = {}
+
+    def start(self, sid: str, model_id: str, language: str, sample_rate: int = SAMPLE_RATE):
+        self._sessions[sid] = _SessionState(StreamingSession(sample_rate=sample_rate), model_id, language)
+
+    def has(self, sid: str) -> bool:
+        return sid in self._sessions
+
+    async def feed(self, sid: str, audio):
+        state = self._sessions.get(sid)
+        if state is None:
+            return
+        await self._handle(sid, state, state.session.feed(audio))
+
+    async def stop(self, sid: str):
+        state = self._sessions.pop(sid, None)
+        if state is not None:
+            await self._handle(sid, state, state.session.flush())
+
+    def discard(self, sid: str):
+        self._sessions.pop(sid, None)
+
+    async def _handle(self, sid, state: _SessionState, events):
+        for kind, segment_id, audio in events:
+            if kind == "partial":
+                # 이전 partial 전사가 끝나지 않았으면 건너뜀 (적체 방지)
+                if not state.partial_busy:
+                    state.partial_busy = True
+                    asyncio.create_task(self._run_partial(sid, state, segment_id, audio))
+            else:
+                await self._run_final(sid, state, segment_id, audio)
+
+    async def _run_partial(self, sid, state: _SessionState, segment_id, audio):
+        try:
+            text = await self._transcribe(state, audio)
+            # 이미 final이 나간 구간의 늦은 partial은 버림
+            if text and segment_id > state.finalized_id:
+                await self._emit('recognizing', {'text': text}, sid)
+        except Exception as e:
+            print(f"[WARN] partial 전사 실패 ({sid}): {e}")
+        finally:
+            state.partial_busy = False
+
+    async def _run_final(self, sid, state: _SessionState, segment_id, audio):
+        async with state.final_lock:
+            state.finalized_id = max(state.finalized_id, segment_id)
+            try:
+                text = await self._transcribe(state, audio)
+            except Exception as e:
+                print(f"[ERROR] final 전사 실패 ({sid}): {e}")
+                return
+            if text:
+                await self._emit('recognized', {'text': text}, sid)
+
+    async def _transcribe(self, state: _SessionState, audio) -> str:
+        texts = await self._infer(state.model_id, audio, state.language)
+        return " ".join(t.strip() for t in (texts or []) if t and t.strip())
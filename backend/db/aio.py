@@ -0,0 +1,81 @@
+# backend/db/aio.py
+
+"""
+backend.db.database 함수들의 비동기 버전.
+
+pymysql 호출을 전용 스레드 풀에서 실행하므로 async 핸들러(WebSocket, Socket.IO)에서
+await 하더라도 이벤트 루프가 막히지 않습니다.
+
+사용 예)
+    from backend.db import aio as adb
+    model = await adb.get_llm_model_by_id(model_id)
+
+로그 적재(save_log_to_db, insert_mcp_log)는 log_sink 큐에 넣기만 하므로
+async 핸들러에서도 동기 함수를 그대로 호출하면 됩니다.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.db import database
+from .config import POOL_CONFIG
+
+# 커넥션 풀 크기만큼만 스레드를 두어 풀 대기로 스레드가 묶이지 않도록 함
+_executor = ThreadPoolExecutor(
+    max_workers=POOL_CONFIG['max_size'],
+    thread_name_prefix='db-io'
+)
+
+async def run_db(func, *args, **kwargs):
+    """임의의 동기 DB 함수를 DB 전용 스레드 풀에서 실행"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
+
+def _offload(func):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run_db(func, *args, **kwargs)
+    return wrapper
+
+def shutdown_executor():
+    _executor.shutdown(wait=True)
+
+# ── ASR ──────────────────────────────────────────────────────
+save_result_to_db = _offload(database.save_result_to_db)
+save_model_to_db = _offload(database.save_model_to_db)
+delete_model_from_db = _offload(database.delete_model_from_db)
+update_model_loaded_status = _offload(database.update_model_loaded_status)
+update_model_status = _offload(database.update_model_status)
+get_models_from_db = _offload(database.get_models_from_db)
+
+# ── 번역 ──────────────────────────────────────────────────────
+save_translation_result = _offload(database.save_translation_result)
+save_cached_translations = _offload(database.save_cached_translations)
+get_translations_by_originals = _offload(database.get_translations_by_originals)
+get_recent_translations = _offload(database.get_recent_translations)
+
+# ── LLM ──────────────────────────────────────────────────────
+save_llm_interaction = _offload(database.save_llm_interaction)
+save_llm_feedback = _offload(database.save_llm_feedback)
+get_llm_interactions = _offload(database.get_llm_interactions)
+get_llm_session_history = _offload(database.get_llm_session_history)
+get_emotion_training_samples = _offload(database.get_emotion_training_samples)
+get_llm_summary = _offload(database.get_llm_summary)
+save_llm_summary = _offload(database.save_llm_summary)
+save_llm_model_to_db = _offload(database.save_llm_model_to_db)
+get_llm_models_from_db = _offload(database.get_llm_models_from_db)
+get_llm_model_by_id = _offload(database.get_llm_model_by_id)
+update_llm_model_in_db = _offload(database.update_llm_model_in_db)
+delete_llm_model_from_db = _offload(database.delete_llm_model_from_db)
+update_llm_model_params = _offload(database.update_llm_model_params)
+
+# ── MCP ──────────────────────────────────────────────────────
+list_mcp_servers = _offload(database.list_mcp_servers)
+get_mcp_server = _offload(database.get_mcp_server)
+create_mcp_server = _offload(database.create_mcp_server)
+update_mcp_server = _offload(database.update_mcp_server)
+delete_mcp_server = _offload(database.delete_mcp_server)
+get_prompt_templates_by_ids = _offload(database.get_prompt_templates_by_ids)
+get_prompt_template_rows_by_ids = _offload(database.get_prompt_template_rows_by_ids)
+get_tools_by_ids = _offload(database.get_tools_by_ids)
@@ -9,4 +9,20 @@ DB_CONFIG = {
     'database': 'arielle',
     'port': 3306,
     'charset': 'utf8mb4'
-}
\ No newline at end of file
+}
+
+# 커넥션 풀 설정
+POOL_CONFIG = {
+    'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+    'min_idle': int(os.environ.get('DB_POOL_MIN_IDLE', 1)),
+    'max_idle_time': float(os.environ.get('DB_POOL_MAX_IDLE_TIME', 300)),   # 초
+    'checkout_timeout': float(os.environ.get('DB_POOL_CHECKOUT_TIMEOUT', 10)),  # 초
+    'ping_interval': float(os.environ.get('DB_POOL_PING_INTERVAL', 30)),    # 초
+}
+
+# 로그 버퍼 설정 (asr_logs / mcp_logs)
+LOG_SINK_CONFIG = {
+    'max_queue': int(os.environ.get('LOG_SINK_MAX_QUEUE', 10000)),
+    'batch_size': int(os.environ.get('LOG_SINK_BATCH_SIZE', 200)),
+    'flush_interval': float(os.environ.get('LOG_SINK_FLUSH_INTERVAL', 1.0)),  # 초
+}
@@ -3,14 +3,19 @@
 import json
 import pymysql
 import pymysql.cursors
-from .config import DB_CONFIG
+from .pool import get_pool
+from .log_sink import log_sink
 from datetime import datetime
 from typing import List, Optional 
 
 from backend.utils.encryption import encrypt
 
 def get_connection():
-    return pymysql.connect(**DB_CONFIG)
+    """
+    커넥션 풀에서 커넥션을 대여합니다.
+    반환된 커넥션의 close()는 실제 종료 대신 풀 반납으로 동작합니다.
+    """
+    return get_pool().get_connection()
 
 def _get_logo_by_model_name(model_name: str):
     logo_map = {
@@ -27,7 +32,7 @@ def _get_logo_by_model_name(model_name: str):
 def save_result_to_db(model_name: str, text: str, language: str = 'ko'):
     conn = None
     try:
-        conn = pymysql.connect(**DB_CONFIG)
+        conn = get_connection()
         with conn.cursor() as cursor:
             sql = """
                 INSERT INTO asr_records (model, transcription, language, created_at)
@@ -152,37 +157,104 @@ def get_models_from_db():
 # ── ASR 로그 저장 ──────────────────────────────────────────────────────
 
 def save_log_to_db(log_type: str, message: str, source: str = 'SYSTEM'):
+    """
+    asr_logs 로그 적재 (버퍼링)
+    실제 INSERT는 log_sink 백그라운드 스레드에서 묶어서 처리됩니다.
+    """
+    if not log_sink.log("asr_logs", log_type, source, message):
+        print(f'[WARN] 로그 버퍼가 가득 차 로그가 버려졌습니다: {log_type} | {source}')
+        return
+    print(f'[LOG] {log_type} | {source} | {message}')
+
+# ── 번역 결과 저장 ──────────────────────────────────────────────────────
+
+def save_translation_result(client_id: str, original: str, translated: str, target_lang: str, source_type: str):
     conn = None
     try:
-        print(f'[DEBUG] log_type={log_type}, source={source} ({len(source)}), message={message}')
         conn = get_connection()
         with conn.cursor() as cursor:
-            sql = "INSERT INTO asr_logs (type, source, message) VALUES (%s, %s, %s)"
-            cursor.execute(sql, (log_type, source, message))
+            sql = """
+                INSERT INTO translation_results (client_id, original, translated, target_lang, source_type, created_at)
+                VALUES (%s, %s, %s, %s, %s, NOW())
+            """
+            cursor.execute(sql, (client_id, original, translated, target_lang, source_type))
         conn.commit()
-        print(f'[LOG] {log_type} | {source} | {message}')
+        print("\033[94m" + "[DB] 번역 결과가 저장되었습니다.\n")
     except Exception as e:
-        print(f'[ERROR] 로그 저장 실패: {e}')
+        print("\033[91m" + f"[ERROR] 번역 결과 저장 실패: {e}" + "\033[0m")
     finally:
         if conn:
             conn.close()
 
-# ── 번역 결과 저장 ──────────────────────────────────────────────────────
-
-def save_translation_result(client_id: str, original: str, translated: str, target_lang: str, source_type: str):
+def save_cached_translations(rows: list[tuple[str, str, str, str, str]]):
+    """
+    번역 캐시가 새로 번역한 결과 일괄 저장 (client_id, 원문, 원본 언어, 대상 언어, 번역문)
+    """
+    if not rows:
+        return
     conn = None
     try:
         conn = get_connection()
         with conn.cursor() as cursor:
             sql = """
-                INSERT INTO translation_results (client_id, original, translated, target_lang, source_type, created_at)
-                VALUES (%s, %s, %s, %s, %s, NOW())
+                INSERT INTO translation_results (client_id, original, source_lang, target_lang, translated, source_type, created_at)
+                VALUES (%s, %s, %s, %s, %s, 'Cache', NOW())
             """
-            cursor.execute(sql, (client_id, original, translated, target_lang, source_type))
+            cursor.executemany(sql, rows)
         conn.commit()
-        print("\033[94m" + "[DB] 번역 결과가 저장되었습니다.\n")
     except Exception as e:
-        print("\033[91m" + f"[ERROR] 번역 결과 저장 실패: {e}" + "\033[0m")
+        print("\033[91m" + f"[ERROR] 번역 캐시 저장 실패: {e}" + "\033[0m")
+    finally:
+        if conn:
+            conn.close()
+
+def get_translations_by_originals(originals: list[str], source_lang: str, target_langs: list[str]) -> list[dict]:
+    """
+    원문/원본 언어/대상 언어가 일치하는 저장된 번역 결과 조회 (최신순)
+    """
+    if not originals or not target_langs:
+        return []
+    conn = None
+    try:
+        conn = get_connection()
+        with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            sql = f"""
+                SELECT original, target_lang, translated
+                FROM translation_results
+                WHERE original IN ({', '.join(['%s'] * len(originals))})
+                  AND source_lang = %s
+                  AND target_lang IN ({', '.join(['%s'] * len(target_langs))})
+                ORDER BY created_at DESC
+            """
+            cursor.execute(sql, (*originals, source_lang, *target_langs))
+            return cursor.fetchall()
+    except Exception as e:
+        print("\033[91m" + f"[ERROR] 번역 결과 조회 실패: {e}" + "\033[0m")
+        return []
+    finally:
+        if conn:
+            conn.close()
+
+def get_recent_translations(limit: int = 1000) -> list[dict]:
+    """
+    원본 언어가 기록된 최근 번역 결과(limit 개) 조회
+    """
+    conn = None
+    try:
+        conn = get_connection()
+        with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            sql = """
+                SELECT original, source_lang, target_lang, translated
+                FROM translation_results
+                WHERE source_lang IS NOT NULL
+                ORDER BY created_at DESC
+                LIMIT %s
+            """
+            cursor.execute(sql, (limit,))
+            return cursor.fetchall()
+    except Exception as e:
+        print("\033[91m" + f"[ERROR] 최근 번역 결과 조회 실패: {e}" + "\033[0m")
+        return []
     finally:
         if conn:
             conn.close()
@@ -197,17 +269,15 @@ def save_llm_interaction(
     ja_translate_response: str,
     emotion: str,
     tone: str,
+    session_id: str | None = None,
+    emotion_source: str | None = None,
 ) -> int:
     conn = None
     try:
         conn = get_connection()
         with conn.cursor() as cursor:
-            sql = """
-                INSERT INTO llm_interactions 
-                (model_name, request, response, translate_response, ja_translate_response, emotion, tone)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """
-            cursor.execute(sql, (
+            columns = ["model_name", "request", "response", "translate_response", "ja_translate_response", "emotion", "tone"]
+            values = [
                 model_name,
                 request,
                 response,
@@ -215,7 +285,19 @@ def save_llm_interaction(
                 ja_translate_response,
                 emotion,
                 tone,
-            ))
+            ]
+            if session_id is not None:
+                columns.append("session_id")
+                values.append(session_id)
+            if emotion_source is not None:
+                columns.append("emotion_source")
+                values.append(emotion_source)
+            sql = f"""
+                INSERT INTO llm_interactions 
+                ({', '.join(columns)})
+                VALUES ({', '.join(['%s'] * len(values))})
+            """
+            cursor.execute(sql, values)
             interaction_id = cursor.lastrowid
         conn.commit()
         print("\033[94m" + "[DB] LLM interaction이 저장되었습니다.\n")
@@ -272,6 +354,103 @@ def get_llm_interactions(limit: int = 100):
         if conn:
             conn.close()
 
+def get_llm_session_history(session_id: str, limit: int = 32) -> list[dict]:
+    """
+    세션의 최근 대화(limit 턴)를 오래된 순으로 조회
+    """
+    conn = None
+    try:
+        conn = get_connection()
+        with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            sql = """
+                SELECT request, response FROM (
+                    SELECT id, request, response
+                    FROM llm_interactions
+                    WHERE session_id = %s
+                    ORDER BY id DESC
+                    LIMIT %s
+                ) recent
+                ORDER BY id ASC
+            """
+            cursor.execute(sql, (session_id, limit))
+            return cursor.fetchall()
+    except Exception as e:
+        print("\033[91m" + f"[ERROR] 세션 이력 조회 실패: {e}" + "\033[0m")
+        return []
+    finally:
+        if conn:
+            conn.close()
+
+def get_emotion_training_samples(limit: int = 5000) -> list[dict]:
+    """
+    감정/톤 라벨이 있는 최근 응답 조회 (로컬 감정 분류기 학습용)
+    분류기 자신의 예측이 다시 학습되지 않도록 LLM 분석기가 붙인 라벨만 사용합니다.
+    emotion_source가 NULL인 행은 컬럼 추가 이전(LLM 분석기만 있던 때)의 기록입니다.
+    neutral도 하나의 클래스로 학습하되, 이전 기록의 neutral은 분석 실패 기본값과
+    구분할 수 없으므로 emotion_source = 'llm'인 행만 사용합니다.
+    """
+    conn = None
+    try:
+        conn = get_connection()
+        with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            sql = """
+                SELECT response, emotion, tone
+                FROM llm_interactions
+                WHERE emotion IS NOT NULL
+                  AND (emotion_source = 'llm' OR (emotion_source IS NULL AND emotion <> 'neutral'))
+                ORDER BY created_at DESC
+                LIMIT %s
+            """
+            cursor.execute(sql, (limit,))
+            return cursor.fetchall()
+    except Exception as e:
+        print("\033[91m" + f"[ERROR] 감정 학습 데이터 조회 실패: {e}" + "\033[0m")
+        return []
+    finally:
+        if conn:
+            conn.close()
+
+def get_llm_summary(model_id: int, session_id: str = '') -> Optional[dict]:
+    """
+    모델/세션의 누적 대화 요약 조회
+    """
+    conn = None
+    try:
+        conn = get_connection()
+        with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute("""
+                SELECT summary, turns, last_interaction_id, updated_at
+                FROM llm_summaries
+                WHERE model_id = %s AND session_id = %s
+            """, (model_id, session_id))
+            return cursor.fetchone()
+    except Exception as e:
+        print("\033[91m" + f"[ERROR] 대화 요약 조회 실패: {e}" + "\033[0m")
+        return None
+    finally:
+        if conn:
+            conn.close()
+
+def save_llm_summary(model_id: int, session_id: str, summary: str, turns: int, last_interaction_id: int | None = None):
+    conn = None
+    try:
+        conn = get_connection()
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO llm_summaries (model_id, session_id, summary, turns, last_interaction_id)
+                VALUES (%s, %s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE
+                    summary = VALUES(summary),
+                    turns = VALUES(turns),
+                    last_interaction_id = VALUES(last_interaction_id)
+            """, (model_id, session_id, summary, turns, last_interaction_id))
+        conn.commit()
+    except Exception as e:
+        print("\033[91m" + f"[ERROR] 대화 요약 저장 실패: {e}" + "\033[0m")
+    finally:
+        if conn:
+            conn.close()
+
 # ── LLM 서버 CRUD 함수 ──────────────────────────────────────────────────────
 
 def save_llm_model_to_db(model_info):
@@ -484,42 +663,60 @@ def delete_mcp_server(alias: str):
         conn.close()
 
 def insert_mcp_log(type: str, source: str, message: str):
+    """
+    mcp_logs 로그 적재 (버퍼링)
+    """
+    log_sink.log("mcp_logs", type, source, message)
+
+def get_tools_by_ids(tool_ids: list[int]) -> list[dict]:
+    if not tool_ids:
+        return []
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
-            cursor.execute('''
-                INSERT INTO mcp_logs (type, source, message)
-                VALUES (%s, %s, %s)
-            ''', (type, source, message))
-        conn.commit()
+            q = f"SELECT id, name, type, command, enabled, cache_ttl FROM mcp_tools WHERE id IN ({','.join(['%s'] * len(tool_ids))})"
+            cursor.execute(q, tuple(tool_ids))
+            return [
+                {"id": r[0], "name": r[1], "type": r[2], "command": r[3], "enabled": r[4], "cache_ttl": r[5]}
+                for r in cursor.fetchall()
+            ]
     finally:
         conn.close()
 
 # ── MCP 파라미터 ──────────────────────────────────────────────────────
-def get_prompt_templates_by_ids(ids: list[int]) -> list[str]:
-    from ..utils.prompt_utils import apply_variables
+def get_prompt_template_rows_by_ids(ids: list[int]) -> list[dict]:
+    """
+    변수 치환 전의 프롬프트 템플릿 조회 ({"template", "variables"})
+    """
+    if not ids:
+        return []
     conn = get_connection()
     try:
         with conn.cursor(pymysql.cursors.DictCursor) as cursor:
-            if not ids:
-                return []
             format_strings = ','.join(['%s'] * len(ids))
             cursor.execute(f"""
                 SELECT template, variables FROM mcp_prompts
                 WHERE id IN ({format_strings}) AND enabled = 1
             """, ids)
-            rows = cursor.fetchall()
-            prompts = []
-            for row in rows:
-                template = row['template']
-                vars = json.loads(row['variables'] or "[]")
-
-                values = {
-                    "time": datetime.now().strftime("%H:%M"),
-                    "user_name": "다엘",
-                    "date": datetime.now().strftime("%Y-%m-%d")
-                }
-                prompts.append(apply_variables(template, vars, values))
-            return prompts
+            return [
+                {"template": row['template'], "variables": json.loads(row['variables'] or "[]")}
+                for row in cursor.fetchall()
+            ]
     finally:
         conn.close()
+
+def render_prompt_template(row: dict, include_volatile: bool = True) -> str:
+    """
+    템플릿에 현재 시각 등 요청 시점의 변수 값을 적용.
+    include_volatile=False면 time/date는 치환하지 않고 {time}/{date} 그대로 둡니다.
+    """
+    from ..utils.prompt_utils import apply_variables
+    values = {"user_name": "다엘"}
+    if include_volatile:
+        values["time"] = datetime.now().strftime("%H:%M")
+        values["date"] = datetime.now().strftime("%Y-%m-%d")
+    variables = [v for v in row['variables'] if v in values]
+    return apply_variables(row['template'], variables, values)
+
+def get_prompt_templates_by_ids(ids: list[int]) -> list[str]:
+    return [render_prompt_template(row) for row in get_prompt_template_rows_by_ids(ids)]
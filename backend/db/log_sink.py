@@ -0,0 +1,164 @@
+# backend/db/log_sink.py
+
+import atexit
+import queue
+import threading
+import time
+from datetime import datetime
+
+from .config import LOG_SINK_CONFIG
+
+# 로그 테이블 별 INSERT 문 (timestamp는 적재 시점이 아닌 발생 시점으로 기록)
+_INSERT_SQL = {
+    "asr_logs": "INSERT INTO asr_logs (type, source, message, timestamp) VALUES (%s, %s, %s, %s)",
+    "mcp_logs": "INSERT INTO mcp_logs (type, source, message, timestamp) VALUES (%s, %s, %s, %s)",
+}
+
+_STOP = object()
+
+class LogSink:
+    """
+    asr_logs / mcp_logs 용 버퍼링 로그 적재기.
+
+    log()는 큐에 넣기만 하고 즉시 반환하며, 백그라운드 스레드가
+    batch_size 또는 flush_interval 기준으로 multi-row INSERT를 수행합니다.
+    큐가 가득 차면 호출자를 막지 않고 해당 로그를 버린 뒤 dropped로 집계합니다.
+    """
+
+    def __init__(self, max_queue: int = 10000, batch_size: int = 200, flush_interval: float = 1.0):
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "enqueued": 0,
+            "written": 0,
+            "dropped": 0,
+            "failed": 0,
+            "flushes": 0,
+            "last_flush_ms": 0.0,
+            "last_batch_size": 0,
+        }
+
+    def log(self, table: str, log_type: str, source: str, message: str) -> bool:
+        if table not in _INSERT_SQL:
+            raise ValueError(f"지원하지 않는 로그 테이블입니다: {table}")
+        if self._closed:
+            self._count("dropped")
+            return False
+
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((table, (log_type, source, message, datetime.now())))
+        except queue.Full:
+            self._count("dropped")
+            return False
+
+        self._count("enqueued")
+        return True
+
+    # ── 백그라운드 적재 ──────────────────────────────────────────────────────
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="log-sink", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        stopping = False
+
+        while not stopping:
+            timeout = max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+            except queue.Empty:
+                pass
+
+            # 종료 요청 시 남은 항목까지 모두 비움
+            if stopping:
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not _STOP:
+                        batch.append(item)
+
+            if batch and (stopping or len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._flush(batch)
+                batch = []
+
+            if time.monotonic() >= deadline:
+                deadline = time.monotonic() + self.flush_interval
+
+    def _flush(self, batch: list):
+        from .database import get_connection
+
+        rows_by_table: dict[str, list] = {}
+        for table, row in batch:
+            rows_by_table.setdefault(table, []).append(row)
+
+        start = time.perf_counter()
+        for table, rows in rows_by_table.items():
+            conn = None
+            try:
+                conn = get_connection()
+                with conn.cursor() as cursor:
+                    # pymysql은 INSERT ... VALUES 문의 executemany를 multi-row INSERT로 변환함
+                    cursor.executemany(_INSERT_SQL[table], rows)
+                conn.commit()
+                self._count("written", len(rows))
+            except Exception as e:
+                self._count("failed", len(rows))
+                print(f'[ERROR] 로그 일괄 저장 실패 ({table}, {len(rows)}건): {e}')
+            finally:
+                if conn:
+                    conn.close()
+
+        with self._stats_lock:
+            self._stats["flushes"] += 1
+            self._stats["last_flush_ms"] = round((time.perf_counter() - start) * 1000, 3)
+            self._stats["last_batch_size"] = len(batch)
+
+    # ── 종료 / 메트릭 ──────────────────────────────────────────────────────
+
+    def shutdown(self, timeout: float = 5.0):
+        """남은 로그를 모두 기록한 뒤 백그라운드 스레드를 종료"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is None:
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(timeout=timeout)
+
+    def _count(self, key: str, n: int = 1):
+        with self._stats_lock:
+            self._stats[key] += n
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                **self._stats,
+                "queued": self._queue.qsize(),
+                "capacity": self._queue.maxsize,
+            }
+
+log_sink = LogSink(**LOG_SINK_CONFIG)
+atexit.register(log_sink.shutdown)
@@ -0,0 +1,236 @@
+# backend/db/pool.py
+
+import threading
+import time
+from collections import deque
+
+import pymysql
+from pymysql.constants import SERVER_STATUS
+
+from .config import DB_CONFIG, POOL_CONFIG
+
+class PoolTimeoutError(RuntimeError):
+    """커넥션 풀에서 제한 시간 안에 커넥션을 얻지 못했을 때 발생"""
+
+class PooledConnection:
+    """
+    풀에서 대여한 pymysql 커넥션 래퍼.
+    기존 코드의 conn.close() 호출은 실제 종료 대신 풀 반납으로 동작합니다.
+    """
+
+    def __init__(self, pool: "ConnectionPool", raw: pymysql.connections.Connection):
+        self._pool = pool
+        self._raw = raw
+        self._released = False
+
+    def close(self):
+        if not self._released:
+            self._released = True
+            self._pool._release(self._raw)
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __del__(self):
+        # close() 없이 버려진 커넥션도 풀 슬롯을 돌려받도록 처리
+        try:
+            if not self._released:
+                self._released = True
+                self._pool._release(self._raw, reuse=False)
+        except Exception:
+            pass
+
+class ConnectionPool:
+    """
+    크기가 제한된 스레드 안전 MySQL 커넥션 풀.
+    - 대여 시 일정 시간 이상 유휴 상태였던 커넥션은 ping으로 상태를 확인합니다.
+    - max_idle_time을 넘긴 유휴 커넥션은 min_idle 개수만 남기고 정리합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        db_config: dict,
+        max_size: int = 10,
+        min_idle: int = 1,
+        max_idle_time: float = 300,
+        checkout_timeout: float = 10,
+        ping_interval: float = 30,
+    ):
+        self.name = name
+        self.db_config = db_config
+        self.max_size = max(1, max_size)
+        self.min_idle = max(0, min(min_idle, self.max_size))
+        self.max_idle_time = max_idle_time
+        self.checkout_timeout = checkout_timeout
+        self.ping_interval = ping_interval
+
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._idle: deque = deque()   # (raw, last_used) — 오른쪽이 가장 최근
+        self._in_use = 0
+
+        self._stats = {
+            "checkouts": 0,
+            "created": 0,
+            "reused": 0,
+            "closed": 0,
+            "reaped": 0,
+            "ping_failures": 0,
+            "timeouts": 0,
+            "wait_time_total_ms": 0.0,
+            "wait_time_max_ms": 0.0,
+        }
+
+    # ── 대여 / 반납 ──────────────────────────────────────────────────────
+
+    def get_connection(self) -> PooledConnection:
+        start = time.perf_counter()
+        if not self._slots.acquire(timeout=self.checkout_timeout):
+            with self._lock:
+                self._stats["timeouts"] += 1
+            raise PoolTimeoutError(
+                f"[DB POOL:{self.name}] {self.checkout_timeout}초 안에 커넥션을 얻지 못했습니다."
+            )
+
+        waited_ms = (time.perf_counter() - start) * 1000
+        try:
+            raw = self._checkout_idle()
+            if raw is None:
+                raw = pymysql.connect(**self.db_config)
+                with self._lock:
+                    self._stats["created"] += 1
+            else:
+                with self._lock:
+                    self._stats["reused"] += 1
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._in_use += 1
+            self._stats["checkouts"] += 1
+            self._stats["wait_time_total_ms"] += waited_ms
+            self._stats["wait_time_max_ms"] = max(self._stats["wait_time_max_ms"], waited_ms)
+
+        return PooledConnection(self, raw)
+
+    def _checkout_idle(self):
+        while True:
+            with self._lock:
+                expired = self._reap_locked()
+                raw, last_used = self._idle.pop() if self._idle else (None, 0.0)
+            self._close_expired(expired)
+            if raw is None:
+                return None
+
+            if time.monotonic() - last_used < self.ping_interval:
+                return raw
+
+            try:
+                raw.ping(reconnect=False)
+                return raw
+            except Exception:
+                with self._lock:
+                    self._stats["ping_failures"] += 1
+                self._close_raw(raw)
+
+    def _release(self, raw, reuse: bool = True):
+        try:
+            if reuse and raw.open:
+                # 커밋되지 않은 트랜잭션(SELECT 스냅샷 포함)이 다음 사용자에게 넘어가지 않도록 정리
+                if raw.server_status & SERVER_STATUS.SERVER_STATUS_IN_TRANS:
+                    raw.rollback()
+            else:
+                reuse = False
+        except Exception:
+            reuse = False
+
+        expired = []
+        with self._lock:
+            self._in_use -= 1
+            if reuse:
+                self._idle.append((raw, time.monotonic()))
+                expired = self._reap_locked()
+
+        self._close_expired(expired)
+        if not reuse:
+            self._close_raw(raw)
+        self._slots.release()
+
+    # ── 유휴 커넥션 정리 ──────────────────────────────────────────────────────
+
+    def _reap_locked(self) -> list:
+        """
+        max_idle_time이 지난 유휴 커넥션을 꺼내 반환 (락을 잡은 상태에서 호출).
+        소켓 종료는 느릴 수 있으므로 락을 놓은 뒤 _close_expired()로 닫습니다.
+        """
+        now = time.monotonic()
+        expired = []
+        while len(self._idle) > self.min_idle:
+            raw, last_used = self._idle[0]
+            if now - last_used < self.max_idle_time:
+                break
+            self._idle.popleft()
+            self._stats["reaped"] += 1
+            expired.append(raw)
+        return expired
+
+    def _close_expired(self, expired: list):
+        for raw in expired:
+            self._close_raw(raw, count=False)
+
+    def _close_raw(self, raw, count: bool = True):
+        if count:
+            with self._lock:
+                self._stats["closed"] += 1
+        try:
+            raw.close()
+        except Exception:
+            pass
+
+    def close_all(self):
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for raw, _ in idle:
+            self._close_raw(raw)
+
+    # ── 메트릭 ──────────────────────────────────────────────────────
+
+    def stats(self) -> dict:
+        with self._lock:
+            checkouts = self._stats["checkouts"]
+            return {
+                "name": self.name,
+                "max_size": self.max_size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                **self._stats,
+                "wait_time_avg_ms": round(self._stats["wait_time_total_ms"] / checkouts, 3) if checkouts else 0.0,
+            }
+
+_pools: dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+def get_pool(name: str = "default") -> ConnectionPool:
+    pool = _pools.get(name)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(name)
+            if pool is None:
+                pool = ConnectionPool(name, DB_CONFIG, **POOL_CONFIG)
+                _pools[name] = pool
+    return pool
+
+def get_pool_stats() -> list[dict]:
+    return [pool.stats() for pool in list(_pools.values())]
+
+def close_pools():
+    for pool in list(_pools.values()):
+        pool.close_all()
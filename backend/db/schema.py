@@ -0,0 +1,60 @@
+# backend/db/schema.py
+
+"""
+기능 추가로 필요한 테이블/컬럼을 서버 시작 시 보장합니다.
+모든 DDL은 여러 번 실행해도 안전하며(IF NOT EXISTS / 컬럼 존재 확인), 실패해도 서버 기동은 계속됩니다.
+"""
+
+from .database import get_connection
+
+# 테이블 생성 DDL
+_TABLES = {
+    # 모델/세션별 누적 대화 요약 (Summary / Hybrid 메모리 전략)
+    "llm_summaries": """
+        CREATE TABLE IF NOT EXISTS llm_summaries (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            model_id INT NOT NULL,
+            session_id VARCHAR(64) NOT NULL DEFAULT '',
+            summary TEXT NOT NULL,
+            turns INT NOT NULL DEFAULT 0,
+            last_interaction_id INT NULL,
+            updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            UNIQUE KEY uq_llm_summaries_model_session (model_id, session_id)
+        ) CHARACTER SET utf8mb4
+    """,
+}
+
+# (테이블, 컬럼, 컬럼 정의)
+_COLUMNS: list[tuple[str, str, str]] = [
+    # websocket_chat 세션 이력 복원 (LLM_SESSION_PERSIST)
+    ("llm_interactions", "session_id", "VARCHAR(64) NULL, ADD INDEX idx_llm_interactions_session (session_id)"),
+    # 도구 결과 캐시 TTL (초, NULL이면 기본값 / 0이면 캐시 안 함)
+    ("mcp_tools", "cache_ttl", "INT NULL"),
+    # 감정 라벨 출처 (llm / local / default) - 로컬 분류기는 llm 라벨로만 학습
+    ("llm_interactions", "emotion_source", "VARCHAR(16) NULL"),
+    # 번역 캐시 2차 저장소 (TRANSLATE_CACHE_PERSISTENT) - 원본 언어가 기록된 행만 캐시로 사용
+    ("translation_results", "source_lang", "VARCHAR(16) NULL"),
+]
+
+def ensure_schema():
+    conn = None
+    try:
+        conn = get_connection()
+        with conn.cursor() as cursor:
+            for name, ddl in _TABLES.items():
+                cursor.execute(ddl)
+
+            for table, column, definition in _COLUMNS:
+                cursor.execute("""
+                    SELECT COUNT(*) FROM information_schema.COLUMNS
+                    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+                """, (table, column))
+                if cursor.fetchone()[0] == 0:
+                    cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+                    print(f"[DB] 컬럼 추가: {table}.{column}")
+        conn.commit()
+    except Exception as e:
+        print("\033[91m" + f"[ERROR] 스키마 확인 실패: {e}" + "\033[0m")
+    finally:
+        if conn:
+            conn.close()
@@ -0,0 +1,172 @@
+# backend/llm/config_cache.py
+
+"""
+LLM 모델별 설정 캐시.
+
+websocket_chat은 매 턴마다 모델 행 / params / 프롬프트 템플릿 / 도구 목록이 필요하므로
+모델 ID별로 한 번 읽어 두고, 설정이 바뀌면 버전을 올려 무효화합니다.
+
+설정 변경 라우트는 MCP 서버(:8500)에 있고 채팅은 메인 서버(:8000)에서 처리되므로,
+notify_config_changed()가 로컬 캐시를 비우고 메인 서버의 /llm/config/invalidate(LLM_CONFIG_NOTIFY_URL)를 호출합니다.
+채팅 라우터가 같은 프로세스에 있으면(config_cache.local_chat) HTTP 호출 없이 바로 무효화합니다.
+알림이 실패하면 경고를 남기며, 그래도 LLM_CONFIG_CACHE_TTL이 지나면 다시 읽습니다.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import requests
+
+from backend.db import aio as adb
+from backend.db.database import render_prompt_template
+from backend.llm.tools.result_cache import tool_cache
+
+LLM_CONFIG_CACHE_TTL = float(os.getenv("LLM_CONFIG_CACHE_TTL", 300))
+# 메인 서버(채팅)의 설정 캐시 무효화 엔드포인트. 비워 두면 알림을 보내지 않음 (TTL로만 갱신)
+LLM_CONFIG_NOTIFY_URL = os.getenv("LLM_CONFIG_NOTIFY_URL", "http://localhost:8000/llm/config/invalidate")
+SYSTEM_PROMPT_PATH = Path("backend/llm/prompt/arielle_prompt.txt")
+
+class ModelConfig:
+    __slots__ = ("model_id", "version", "loaded_at", "model", "params", "prompt_rows", "tools")
+
+    def __init__(self, model_id, version, model, params, prompt_rows, tools):
+        self.model_id = model_id
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.model = model
+        self.params = params            # JSON 디코드 실패 시 None
+        self.prompt_rows = prompt_rows  # 변수 치환 전 템플릿
+        self.tools = tools
+
+    def template_prompts(self, include_volatile: bool = True) -> list[str]:
+        """시각 등 턴마다 달라지는 변수는 호출 시점에 적용"""
+        return [render_prompt_template(row, include_volatile) for row in self.prompt_rows]
+
+class ModelConfigCache:
+    def __init__(self, ttl: float = LLM_CONFIG_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: dict[int, ModelConfig] = {}
+        self._versions: dict[int, int] = {}
+        self._global_version = 0
+        self._load_locks: dict[int, asyncio.Lock] = {}
+        self._system_prompt: str | None = None
+        # 이 프로세스가 websocket_chat을 처리하는지 (backend/llm/service.py가 설정)
+        self.local_chat = False
+
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def _version(self, model_id: int) -> tuple[int, int]:
+        return self._global_version, self._versions.get(model_id, 0)
+
+    async def get(self, model_id: int) -> ModelConfig | None:
+        model_id = int(model_id)
+        entry = self._fresh(model_id)
+        if entry is not None:
+            with self._lock:
+                self._hits += 1
+            return entry
+
+        lock = self._load_locks.setdefault(model_id, asyncio.Lock())
+        async with lock:
+            # 같은 모델을 동시에 요청한 경우 먼저 읽은 결과를 사용
+            entry = self._fresh(model_id)
+            if entry is not None:
+                return entry
+            with self._lock:
+                self._misses += 1
+            return await self._load(model_id)
+
+    def _fresh(self, model_id: int) -> ModelConfig | None:
+        entry = self._entries.get(model_id)
+        if entry is None or entry.version != self._version(model_id):
+            return None
+        if time.monotonic() - entry.loaded_at > self.ttl:
+            return None
+        return entry
+
+    async def _load(self, model_id: int) -> ModelConfig | None:
+        version = self._version(model_id)
+        model = await adb.get_llm_model_by_id(model_id)
+        if not model:
+            self._entries.pop(model_id, None)
+            return None
+
+        try:
+            params = json.loads(model.get("params") or "{}")
+        except Exception as e:
+            print(f"[ERROR] 모델 파라미터 JSON 디코드 실패: {e}")
+            params = None
+
+        prompt_rows, tools = await asyncio.gather(
+            adb.get_prompt_template_rows_by_ids((params or {}).get("prompts", [])),
+            adb.get_tools_by_ids((params or {}).get("tools", [])),
+        )
+        entry = ModelConfig(model_id, version, model, params, prompt_rows, tools)
+        # 읽는 도중 무효화되었다면 이번 결과는 한 번만 쓰고 캐시에 남기지 않음
+        if version == self._version(model_id):
+            self._entries[model_id] = entry
+        return entry
+
+    def system_prompt(self) -> str:
+        """기본 시스템 프롬프트 파일 (전체 무효화 시 다시 읽음)"""
+        if self._system_prompt is None:
+            self._system_prompt = SYSTEM_PROMPT_PATH.read_text(encoding="utf-8")
+        return self._system_prompt
+
+    def invalidate(self, model_id: int | None = None):
+        """model_id가 없으면 모든 모델(프롬프트/도구 변경 등)을 무효화"""
+        with self._lock:
+            self._invalidations += 1
+            if model_id is None:
+                self._global_version += 1
+                self._entries.clear()
+                self._system_prompt = None
+            else:
+                model_id = int(model_id)
+                self._versions[model_id] = self._versions.get(model_id, 0) + 1
+                self._entries.pop(model_id, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "models": sorted(self._entries),
+                "ttl": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else None,
+            }
+
+config_cache = ModelConfigCache()
+
+def invalidate_local(model_id: int | None = None):
+    """현재 프로세스의 설정 캐시 무효화. 전체 무효화는 도구 설정 변경일 수 있으므로 도구 결과 캐시도 비움"""
+    config_cache.invalidate(model_id)
+    if model_id is None:
+        tool_cache.clear()
+
+def notify_config_changed(model_id: int | None = None):
+    """
+    설정 변경 후 호출. 현재 프로세스의 캐시를 비우고,
+    채팅이 다른 프로세스에 있으면 메인 서버에도 무효화를 요청합니다(백그라운드).
+    """
+    invalidate_local(model_id)
+    if config_cache.local_chat or not LLM_CONFIG_NOTIFY_URL:
+        return
+
+    def _post():
+        try:
+            res = requests.post(LLM_CONFIG_NOTIFY_URL, json={"model_id": model_id}, timeout=2)
+            res.raise_for_status()
+        except Exception as e:
+            print(f"[WARN] LLM 설정 캐시 무효화 알림 실패 ({LLM_CONFIG_NOTIFY_URL}): {e} - 메인 서버는 최대 {LLM_CONFIG_CACHE_TTL:.0f}초 동안 이전 설정을 사용합니다")
+
+    threading.Thread(target=_post, name="llm-config-notify", daemon=True).start()
@@ -0,0 +1,174 @@
+# backend/llm/emotion/classifier.py
+
+"""
+로컬 감정/톤 분류기 (LLM 분석기의 빠른 대체 경로).
+
+llm_interactions에 저장된 응답과 emotion/tone 라벨로 학습하는
+해시 n-gram 특징 + 최근접 중심(nearest centroid) 분류기입니다.
+추론은 짧은 텍스트 기준 1ms 안팎이며, 외부 모델 파일이나 추가 패키지가 필요 없습니다.
+"""
+
+import asyncio
+import math
+import os
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+
+import numpy as np
+
+from backend.db import aio as adb
+
+EMOTION_LOCAL_DIM = int(os.getenv("EMOTION_LOCAL_DIM", 2 ** 14))
+EMOTION_LOCAL_MIN_SAMPLES = int(os.getenv("EMOTION_LOCAL_MIN_SAMPLES", 3))      # 라벨별 최소 학습 샘플 수
+EMOTION_LOCAL_TRAIN_LIMIT = int(os.getenv("EMOTION_LOCAL_TRAIN_LIMIT", 5000))   # 학습에 사용할 최근 이력 수
+EMOTION_LOCAL_RETRAIN_SEC = float(os.getenv("EMOTION_LOCAL_RETRAIN_SEC", 3600))
+EMOTION_LOCAL_RETRY_SEC = float(os.getenv("EMOTION_LOCAL_RETRY_SEC", 300))       # 학습 데이터 부족/실패 시 재시도 간격
+
+_WORD = re.compile(r"[a-z0-9']+")
+# 유사도를 확률처럼 보이도록 변환할 때의 배율
+_SOFTMAX_SCALE = 20.0
+
+def _features(text: str, dim: int) -> np.ndarray:
+    """단어 / 단어 bigram / 문자 trigram을 해싱한 L2 정규화 벡터"""
+    words = _WORD.findall(text.lower())
+    grams = Counter(words)
+    grams.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+    for word in words:
+        padded = f"<{word}>"
+        grams.update(f"#{padded[i:i + 3]}" for i in range(len(padded) - 2))
+
+    vec = np.zeros(dim, dtype=np.float32)
+    for gram, count in grams.items():
+        vec[zlib.crc32(gram.encode("utf-8")) % dim] += 1.0 + math.log(count)
+    norm = np.linalg.norm(vec)
+    return vec / norm if norm else vec
+
+class _CentroidModel:
+    def __init__(self, labels: list[str], centroids: np.ndarray, counts: dict[str, int]):
+        self.labels = labels
+        self.centroids = centroids
+        self.counts = counts
+
+    @classmethod
+    def fit(cls, vectors: np.ndarray, labels: list[str], min_samples: int):
+        counts = Counter(labels)
+        kept = sorted(label for label, n in counts.items() if n >= min_samples)
+        if len(kept) < 2:
+            return None
+        index = {label: i for i, label in enumerate(kept)}
+        centroids = np.zeros((len(kept), vectors.shape[1]), dtype=np.float32)
+        for vec, label in zip(vectors, labels):
+            if label in index:
+                centroids[index[label]] += vec
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        centroids /= np.where(norms == 0, 1, norms)
+        return cls(kept, centroids, {label: counts[label] for label in kept})
+
+    def predict(self, vec: np.ndarray) -> tuple[str, float]:
+        sims = self.centroids @ vec
+        weights = np.exp((sims - sims.max()) * _SOFTMAX_SCALE)
+        best = int(np.argmax(sims))
+        return self.labels[best], float(weights[best] / weights.sum())
+
+class LocalEmotionClassifier:
+    def __init__(self, dim: int = EMOTION_LOCAL_DIM, min_samples: int = EMOTION_LOCAL_MIN_SAMPLES, train_limit: int = EMOTION_LOCAL_TRAIN_LIMIT, retrain_sec: float = EMOTION_LOCAL_RETRAIN_SEC, retry_sec: float = EMOTION_LOCAL_RETRY_SEC):
+        self.dim = dim
+        self.min_samples = min_samples
+        self.train_limit = train_limit
+        self.retrain_sec = retrain_sec
+        self.retry_sec = retry_sec
+
+        self._emotion: _CentroidModel | None = None
+        self._tone: _CentroidModel | None = None
+        self._trained_at = 0.0
+        self._attempted_at = 0.0
+        self._samples = 0
+        self._training: asyncio.Task | None = None
+
+        self._lock = threading.Lock()
+        self._predictions = 0
+        self._predict_ms = 0.0
+
+    @property
+    def ready(self) -> bool:
+        return self._emotion is not None
+
+    def predict(self, text: str) -> dict | None:
+        """
+        {"emotion", "tone", "confidence"}를 반환합니다. 아직 학습되지 않았으면 None.
+        confidence는 emotion 판단의 확신도(0~1)입니다.
+        """
+        self._maybe_retrain()
+        emotion_model, tone_model = self._emotion, self._tone
+        if emotion_model is None:
+            return None
+
+        begin = time.perf_counter()
+        vec = _features(text, self.dim)
+        emotion, confidence = emotion_model.predict(vec)
+        tone = tone_model.predict(vec)[0] if tone_model is not None else "neutral"
+
+        with self._lock:
+            self._predictions += 1
+            self._predict_ms += (time.perf_counter() - begin) * 1000
+        return {"emotion": emotion, "tone": tone, "confidence": round(confidence, 4)}
+
+    def _maybe_retrain(self):
+        if self._training is not None and not self._training.done():
+            return
+        # 학습된 뒤에는 retrain_sec마다, 학습 전(데이터 부족/실패)에는 retry_sec마다 시도
+        interval = self.retrain_sec if self.ready else self.retry_sec
+        now = time.time()
+        if now - self._attempted_at < interval:
+            return
+        self._attempted_at = now
+        try:
+            self._training = asyncio.get_running_loop().create_task(self.train())
+        except RuntimeError:
+            pass
+
+    async def train(self):
+        try:
+            rows = await adb.get_emotion_training_samples(self.train_limit)
+            emotion_model, tone_model, samples = await asyncio.to_thread(self._fit, rows)
+        except Exception as e:
+            # 재시도 간격은 _maybe_retrain의 _attempted_at이 관리
+            print(f"[WARN] 로컬 감정 분류기 학습 실패: {e}")
+            return
+        if emotion_model is None:
+            print(f"[INFO] 로컬 감정 분류기: 학습 데이터 부족 ({len(rows)}건)")
+            return
+        self._emotion, self._tone, self._samples = emotion_model, tone_model, samples
+        self._trained_at = time.time()
+        print(f"[INFO] 로컬 감정 분류기 학습 완료: {samples}건, 감정 {len(emotion_model.labels)}종, 톤 {len(tone_model.labels) if tone_model else 0}종")
+
+    def _fit(self, rows: list[dict]):
+        from backend.llm.emotion.service import ALLOWED_EMOTIONS
+
+        # neutral은 LLM 분석기가 허용 목록 밖의 감정을 돌려줄 때의 라벨 - 분류기도 예측할 수 있도록 포함
+        labels = ALLOWED_EMOTIONS | {"neutral"}
+        rows = [r for r in rows if r.get("response") and r.get("emotion") in labels]
+        if not rows:
+            return None, None, 0
+        vectors = np.stack([_features(r["response"], self.dim) for r in rows])
+        emotion_model = _CentroidModel.fit(vectors, [r["emotion"] for r in rows], self.min_samples)
+        tone_model = _CentroidModel.fit(vectors, [(r.get("tone") or "neutral").strip().lower() for r in rows], self.min_samples)
+        return emotion_model, tone_model, len(rows)
+
+    def stats(self) -> dict:
+        with self._lock:
+            predictions, predict_ms = self._predictions, self._predict_ms
+        return {
+            "ready": self.ready,
+            "samples": self._samples,
+            "emotions": self._emotion.counts if self._emotion else {},
+            "tones": len(self._tone.labels) if self._tone else 0,
+            "trained_at": self._trained_at or None,
+            "predictions": predictions,
+            "predict_avg_ms": round(predict_ms / predictions, 3) if predictions else None,
+        }
+
+local_classifier = LocalEmotionClassifier()
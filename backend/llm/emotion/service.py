@@ -1,9 +1,16 @@
 # backend/llm/emotion/service.py
 
+import asyncio
+import hashlib
+import os
 import re
+import threading
+from collections import OrderedDict
 from typing import Dict
 import httpx
 from backend.llm.emotion.prompt import PROMPT_TEMPLATE
+from backend.llm.emotion.classifier import local_classifier
+from backend.utils.http_client import get_http_client
 
 LLAMA_ENDPOINT = "http://localhost:8081/v1/completions"
 ALLOWED_EMOTIONS = {
@@ -13,29 +20,216 @@ ALLOWED_EMOTIONS = {
     "embarrassed", "contemplative"
 }
 
-async def analyze_emotion(text: str) -> Dict[str, str]:
-    prompt = PROMPT_TEMPLATE.format(text=text)
+EMOTION_CACHE_SIZE = int(os.getenv("EMOTION_CACHE_SIZE", 2048))
+EMOTION_BATCH_MAX_SIZE = int(os.getenv("EMOTION_BATCH_MAX_SIZE", 8))
+EMOTION_BATCH_WAIT_MS = float(os.getenv("EMOTION_BATCH_WAIT_MS", 15))
+# 감정 분석 방식: llm (기본) | local (로컬 분류기) | hybrid (로컬 확신도가 낮으면 LLM)
+EMOTION_BACKEND = os.getenv("EMOTION_BACKEND", "llm").lower()
+EMOTION_LOCAL_MIN_CONFIDENCE = float(os.getenv("EMOTION_LOCAL_MIN_CONFIDENCE", 0.6))
+# llama.cpp 슬롯 고정 (-1 또는 미설정 시 서버가 선택). --parallel 설정과 맞춰야 함
+EMOTION_SLOT_ID = os.getenv("EMOTION_SLOT_ID")
+
+class EmotionAnalyzer:
+    """
+    감정 분석기 호출 관리.
+    - 결과 캐시: 응답 텍스트 해시 → {emotion, tone} (LRU)
+    - single-flight: 같은 텍스트의 분석이 진행 중이면 그 결과를 함께 기다림
+    - 배칭: batch_wait_ms 동안 모인 요청을 prompt 배열 하나로 /v1/completions에 전달
+    - cache_prompt: 고정된 PROMPT_TEMPLATE 앞부분의 KV 캐시를 서버가 재사용
+    """
+
+    def __init__(self, cache_size: int = EMOTION_CACHE_SIZE, max_batch_size: int = EMOTION_BATCH_MAX_SIZE, batch_wait_ms: float = EMOTION_BATCH_WAIT_MS):
+        self.cache_size = max(0, cache_size)
+        self.max_batch_size = max(1, max_batch_size)
+        self.batch_wait = max(0.0, batch_wait_ms) / 1000
+
+        self._cache: OrderedDict[str, Dict[str, str]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "joined": 0,
+            "batches": 0,
+            "batched_requests": 0,
+            "fallbacks": 0,
+        }
+
+    async def analyze(self, text: str) -> Dict[str, str]:
+        key = _text_key(text)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self._count("hits")
+            return dict(cached)
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._count("joined")
+            return dict(await asyncio.shield(inflight))
+
+        self._count("misses")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._inflight[key] = future
+        future.add_done_callback(lambda f: self._settle(key, f))
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_wait, self._flush)
+
+        return dict(await asyncio.shield(future))
+
+    def _settle(self, key: str, future: asyncio.Future):
+        # 기다리던 호출자가 모두 시간 초과로 빠졌더라도 결과는 캐시에 남김
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled() and future.exception() is None:
+            self._put(key, future.result())
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            asyncio.get_running_loop().create_task(self._run_batch(batch))
+
+    async def _run_batch(self, batch: list[tuple[str, asyncio.Future]]):
+        with self._lock:
+            self._stats["batches"] += 1
+            self._stats["batched_requests"] += len(batch)
+
+        prompts = [PROMPT_TEMPLATE.format(text=text) for text, _ in batch]
+        try:
+            contents = await self._complete(prompts)
+        except Exception as e:
+            for _, future in batch:
+                _fail(future, e)
+            return
+
+        for (_, future), content in zip(batch, contents):
+            if isinstance(content, Exception):
+                _fail(future, content)
+                continue
+            try:
+                _resolve(future, extract_emotion_json(content))
+            except Exception as e:
+                _fail(future, e)
+
+    async def _complete(self, prompts: list[str]) -> list:
+        if len(prompts) == 1:
+            return [await _request_completion(prompts[0])]
+
+        try:
+            choices = await _request_completion(prompts)
+            if len(choices) == len(prompts):
+                return choices
+        except ValueError as e:
+            print(f"[WARN] 감정 분석 배치 요청 실패, 개별 요청으로 전환: {e}")
+
+        # prompt 배열을 지원하지 않는 서버면 개별 요청으로 동시에 처리
+        self._count("fallbacks")
+        return await asyncio.gather(*(_request_completion(p) for p in prompts), return_exceptions=True)
+
+    def _put(self, key: str, result: Dict[str, str]):
+        if self.cache_size == 0:
+            return
+        self._cache[key] = result
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"] + stats["joined"]
+        return {
+            **stats,
+            "cache_size": len(self._cache),
+            "cache_max_size": self.cache_size,
+            "pending": len(self._pending),
+            "inflight": len(self._inflight),
+            "hit_rate": round((stats["hits"] + stats["joined"]) / lookups, 4) if lookups else None,
+            "avg_batch_size": round(stats["batched_requests"] / stats["batches"], 2) if stats["batches"] else None,
+        }
+
+async def _request_completion(prompt: str | list[str]):
+    """
+    prompt가 문자열이면 생성 텍스트를, 배열이면 index 순으로 정렬된 생성 텍스트 목록을 반환
+    """
     payload = {
         "model": "emotion-analyzer",
         "prompt": prompt,
         "temperature": 0.2,
         "max_tokens": 64,
-        "stream": False
+        "stream": False,
+        # 고정 프롬프트 앞부분의 KV 캐시 재사용
+        "cache_prompt": True,
     }
+    if EMOTION_SLOT_ID not in (None, "", "-1"):
+        payload["id_slot"] = int(EMOTION_SLOT_ID)
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            res = await client.post(LLAMA_ENDPOINT, json=payload)
-            res.raise_for_status()
-            content = res.json()["choices"][0]["text"].strip()
-        except httpx.RequestError as e:
-                raise ValueError(f"Request failed: {e}")
-        except httpx.TimeoutException:
-            raise ValueError("The request timed out after 60 seconds.")
-        except httpx.HTTPStatusError as e:
-            raise ValueError(f"HTTP error occurred: {e.response.status_code}")
-
-    return extract_emotion_json(content)
+    client = get_http_client("emotion")
+    try:
+        res = await client.post(LLAMA_ENDPOINT, json=payload)
+        res.raise_for_status()
+        choices = res.json()["choices"]
+    except httpx.TimeoutException:
+        raise ValueError("The request timed out after 60 seconds.")
+    except httpx.RequestError as e:
+        raise ValueError(f"Request failed: {e}")
+    except httpx.HTTPStatusError as e:
+        raise ValueError(f"HTTP error occurred: {e.response.status_code}")
+
+    if isinstance(prompt, str):
+        return choices[0]["text"].strip()
+    choices = sorted(choices, key=lambda c: c.get("index", 0))
+    return [c["text"].strip() for c in choices]
+
+def _text_key(text: str) -> str:
+    return hashlib.sha1(" ".join(text.split()).encode("utf-8")).hexdigest()
+
+def _resolve(future: asyncio.Future, value):
+    if not future.done():
+        future.set_result(value)
+
+def _fail(future: asyncio.Future, error: Exception):
+    if not future.done():
+        future.set_exception(error)
+
+emotion_analyzer = EmotionAnalyzer()
+
+async def analyze_emotion(text: str) -> Dict[str, str]:
+    """
+    {"emotion", "tone", "source"}를 반환합니다. source는 라벨을 붙인 쪽("local" / "llm")이며
+    llm_interactions.emotion_source로 저장되어 로컬 분류기 학습 데이터를 고르는 데 쓰입니다.
+    """
+    if EMOTION_BACKEND in ("local", "hybrid"):
+        result = local_classifier.predict(text)
+        # local은 학습 전에만, hybrid는 확신도가 낮을 때도 LLM 분석기로 넘김
+        if result is not None and (EMOTION_BACKEND == "local" or result["confidence"] >= EMOTION_LOCAL_MIN_CONFIDENCE):
+            return {"emotion": result["emotion"], "tone": result["tone"], "source": "local"}
+    result = await emotion_analyzer.analyze(text)
+    result["source"] = "llm"
+    return result
+
+def get_emotion_stats() -> dict:
+    return {
+        "backend": EMOTION_BACKEND,
+        "llm": emotion_analyzer.stats(),
+        "local": local_classifier.stats() if EMOTION_BACKEND in ("local", "hybrid") else None,
+    }
 
 def extract_emotion_json(text: str) -> Dict[str, str]:
     match = re.search(r'{\s*"emotion"\s*:\s*"(.*?)"\s*,\s*"tone"\s*:\s*"(.*?)"\s*}', text)
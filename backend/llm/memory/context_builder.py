@@ -1,46 +1,125 @@
 # backend/llm/memory/context_builder.py
 
+import os
 from typing import List, Dict
 
-async def get_summary(model_id: int) -> str:
-    # TODO: 실제 요약 로직 구현 예정
-    return "This is a summary of the context."
+from backend.llm.memory.tokenizer import Tokenizer, get_tokenizer, MESSAGE_OVERHEAD_TOKENS
+from backend.llm.memory.summarizer import summarizer
+
+SUMMARY_STRATEGIES = ("Summary", "Hybrid")
+# 대화 이력 앞부분은 이 개수(짝수) 단위로만 잘라냄 - 자르는 위치가 매 턴 바뀌면 프롬프트 캐시를 쓸 수 없음
+HISTORY_CHUNK_MESSAGES = max(2, int(os.getenv("LLM_HISTORY_CHUNK_MESSAGES", 8)) // 2 * 2)
+
+def _align_up(n: int, chunk: int = HISTORY_CHUNK_MESSAGES) -> int:
+    """n을 chunk의 배수로 올림 (0 이하면 0)"""
+    return -(-n // chunk) * chunk if n > 0 else 0
+
+async def get_summary(model_id: int, session_id: str = "") -> str:
+    summary = await summarizer.get_summary(model_id, session_id)
+    return f"Summary of the conversation so far:\n{summary}" if summary else ""
 
 async def build_context(
     model_id: int,
     system_prompt: str,
     user_messages: List[Dict],
-    memory_settings: Dict
-) -> List[Dict]:
+    memory_settings: Dict,
+    sources: List[str] | None = None,
+    notes: List[str] | None = None,
+    tokenizer: Tokenizer | None = None,
+    reserve_tokens: int = 0,
+    session_id: str = "",
+) -> tuple[List[Dict], Dict]:
     """
-    memory.strategy에 맞는 context 메시지 리스트를 생성합니다.
+    memory.strategy에 맞는 context 메시지 리스트를 토큰 예산 안에서 생성합니다.
+
+    예산 = 컨텍스트 크기(memory.contextWindow 또는 서버 n_ctx) - reserve_tokens(생성 토큰 등)
+    시스템 프롬프트, 마지막 사용자 메시지, notes(시각·도구 결과 등)는 항상 포함하고
+    남은 예산을 요약 → 로컬 소스(sources) → 최근 대화 이력 순으로 채웁니다.
+
+    메시지 순서는 llama.cpp 프롬프트 캐시가 재사용되도록 턴마다 바뀌지 않는 것을 앞에 둡니다.
+        [시스템 프롬프트] [로컬 소스] [대화 이력] [요약] [notes] [마지막 사용자 메시지]
+    windowSize나 예산 때문에 이력 앞부분을 버릴 때는 HISTORY_CHUNK_MESSAGES 단위로 버려
+    그 사이 턴들에서는 이력 시작 위치(프롬프트 앞부분)가 그대로 유지됩니다.
+
+    반환값: (messages, usage)
     """
 
     strategy = memory_settings.get("strategy", "None")
-    max_tokens = memory_settings.get("max_tokens", 64)
     include_history = memory_settings.get("includeHistory", True)
+    max_messages = memory_settings.get("windowSize")
+    tokenizer = tokenizer or get_tokenizer()
+    sources = sources or []
+    notes = notes or []
 
-    context = [{"role": "system", "content": system_prompt}]
+    context_window = int(memory_settings.get("contextWindow") or await tokenizer.context_window())
+    budget = max(0, context_window - reserve_tokens)
 
-    if strategy == "None":
-        context += user_messages[-1:]
+    summary = await get_summary(model_id, session_id) if strategy in SUMMARY_STRATEGIES else None
+    history = user_messages[:-1] if include_history and strategy in ("Window", "Hybrid") else []
+    if max_messages:
+        history = history[_align_up(len(history) - int(max_messages)):]
+    last = user_messages[-1:]
 
-    elif strategy == "Window":
-        window_size = max_tokens // 4
-        context += user_messages[-window_size:] if include_history else user_messages[-1:]
+    async def count_all(texts: list[str]) -> list[int]:
+        counts = await tokenizer.count_many(texts)
+        return [c + MESSAGE_OVERHEAD_TOKENS for c in counts]
 
-    elif strategy == "Summary":
-        summary = await get_summary(model_id)
-        context.append({"role": "system", "content": summary})
-        context += user_messages[-1:]
+    system_tokens, = await count_all([system_prompt])
+    last_tokens = sum(await count_all([m["content"] for m in last]))
+    note_tokens = await count_all(notes)
+    summary_tokens = (await count_all([summary]))[0] if summary else 0
+    source_tokens = await count_all(sources)
+    history_tokens = await count_all([m["content"] for m in history])
 
-    elif strategy == "Hybrid":
-        summary = await get_summary(model_id)
-        window_size = max_tokens // 4
-        context.append({"role": "system", "content": summary})
-        context += user_messages[-window_size:] if include_history else user_messages[-1:]
+    used = system_tokens + last_tokens + sum(note_tokens)
+    if used > budget:
+        print(f"[WARN] 필수 컨텍스트가 예산을 초과합니다: {used} > {budget} 토큰")
 
+    if summary and used + summary_tokens <= budget:
+        used += summary_tokens
     else:
-        context += user_messages[-1:]
+        summary, summary_tokens = None, 0
+
+    kept_sources = []
+    for text, tokens in zip(sources, source_tokens):
+        if used + tokens > budget:
+            break
+        kept_sources.append(text)
+        used += tokens
+
+    # 최신 메시지부터 예산이 허용하는 만큼
+    start = len(history)
+    for i in range(len(history) - 1, -1, -1):
+        if used + history_tokens[i] > budget:
+            break
+        used += history_tokens[i]
+        start = i
+    aligned = min(len(history), _align_up(start))
+    used -= sum(history_tokens[start:aligned])
+    start = aligned
+    kept_history = history[start:]
+
+    context = [{"role": "system", "content": system_prompt}]
+    context += [{"role": "system", "content": text} for text in kept_sources]
+    context += kept_history
+    if summary:
+        context.append({"role": "system", "content": summary})
+    context += [{"role": "system", "content": text} for text in notes]
+    context += last
 
-    return context
\ No newline at end of file
+    usage = {
+        "tokenizer": tokenizer.name,
+        "context_window": context_window,
+        "reserved": reserve_tokens,
+        "budget": budget,
+        "used": used,
+        "system": system_tokens,
+        "summary": summary_tokens,
+        "sources": sum(source_tokens[:len(kept_sources)]),
+        "notes": sum(note_tokens),
+        "history": sum(history_tokens[start:]),
+        "history_messages": len(kept_history),
+        "dropped_messages": start,
+        "dropped_sources": len(sources) - len(kept_sources),
+    }
+    return context, usage
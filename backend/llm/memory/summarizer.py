@@ -0,0 +1,154 @@
+# backend/llm/memory/summarizer.py
+
+"""
+Summary / Hybrid 메모리 전략을 위한 누적 대화 요약.
+
+LLM_SUMMARY_EVERY_TURNS턴마다 schedule_update()가 백그라운드에서
+(이전 요약 + 새 대화)를 LLM에 보내 요약을 갱신하고 llm_summaries에 저장합니다.
+갱신 주기는 이력이 잘리는 단위(LLM_HISTORY_CHUNK_MESSAGES / 2턴)와 맞춰
+그 사이 턴들에서는 요약 메시지가 바뀌지 않아 프롬프트 캐시가 유지됩니다.
+요약은 (모델, 세션)별로 하나이며, 같은 키의 갱신은 순서대로 하나씩 실행됩니다.
+메모리에는 최근 사용한 LLM_SUMMARY_MAX_STATES개의 상태만 두고(LRU), 밀려난 세션은 다음에 DB에서 다시 읽습니다.
+"""
+
+import asyncio
+import os
+from collections import OrderedDict
+
+import httpx
+
+from backend.db import aio as adb
+from backend.utils.http_client import get_http_client
+
+SUMMARY_EVERY_TURNS = int(os.getenv("LLM_SUMMARY_EVERY_TURNS", 4))   # 몇 턴마다 요약을 갱신할지
+SUMMARY_MAX_WORDS = int(os.getenv("LLM_SUMMARY_MAX_WORDS", 150))
+SUMMARY_MAX_TOKENS = int(os.getenv("LLM_SUMMARY_MAX_TOKENS", 256))
+SUMMARY_TIMEOUT = float(os.getenv("LLM_SUMMARY_TIMEOUT", 60))
+SUMMARY_MAX_STATES = int(os.getenv("LLM_SUMMARY_MAX_STATES", 512))
+# 요약 전용 llama.cpp 슬롯. 미설정 시 cache_prompt 없이 요청해 채팅 슬롯의 KV 캐시를 덮어쓰지 않음
+# (설정할 경우 --parallel 값과 맞추고 LLM_SLOT_ID와 다른 번호를 사용)
+SUMMARY_SLOT_ID = os.getenv("LLM_SUMMARY_SLOT_ID")
+
+SUMMARY_INSTRUCTION = (
+    "You maintain a running summary of a conversation between a user and an assistant. "
+    "Merge the new exchanges into the existing summary. Keep facts about the user, "
+    "their preferences, decisions, open questions and the current topic. "
+    "Drop greetings and small talk. Write in English, third person, at most {max_words} words. "
+    "Reply with the updated summary only."
+)
+
+class _SummaryState:
+    __slots__ = ("summary", "turns", "last_interaction_id", "pending", "lock", "loaded")
+
+    def __init__(self):
+        self.summary = ""
+        self.turns = 0
+        self.last_interaction_id = None
+        self.pending: list[tuple[str, str]] = []
+        self.lock = asyncio.Lock()
+        self.loaded = False
+
+class ConversationSummarizer:
+    def __init__(self, every_turns: int = SUMMARY_EVERY_TURNS, max_states: int = SUMMARY_MAX_STATES):
+        self.every_turns = max(1, every_turns)
+        self.max_states = max(1, max_states)
+        self._states: OrderedDict[tuple[int, str], _SummaryState] = OrderedDict()
+        self._tasks: set[asyncio.Task] = set()
+
+    def _state(self, model_id: int, session_id: str) -> _SummaryState:
+        key = (int(model_id), session_id or "")
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _SummaryState()
+            self._evict()
+        else:
+            self._states.move_to_end(key)
+        return state
+
+    def _evict(self):
+        """
+        오래된 상태부터 제거. 갱신 중인 상태는 건너뜀.
+        아직 요약하지 않은 대화(pending)는 버려지며, 해당 턴은 요약에 반영되지 않습니다.
+        """
+        excess = len(self._states) - self.max_states
+        for key in list(self._states):
+            if excess <= 0:
+                break
+            state = self._states[key]
+            if state.lock.locked():
+                continue
+            del self._states[key]
+            excess -= 1
+
+    async def _ensure_loaded(self, model_id: int, session_id: str, state: _SummaryState):
+        if state.loaded:
+            return
+        row = await adb.get_llm_summary(model_id, session_id or "")
+        if row and not state.loaded:
+            state.summary = row["summary"] or ""
+            state.turns = row["turns"] or 0
+            state.last_interaction_id = row["last_interaction_id"]
+        state.loaded = True
+
+    async def get_summary(self, model_id: int, session_id: str = "") -> str:
+        state = self._state(model_id, session_id)
+        await self._ensure_loaded(model_id, session_id, state)
+        return state.summary
+
+    def schedule_update(self, model_id: int, session_id: str, endpoint: str, model_name: str, user_text: str, assistant_text: str, interaction_id: int | None = None):
+        """응답 전송 후 호출. 요약 갱신은 백그라운드 태스크로 실행"""
+        state = self._state(model_id, session_id)
+        state.pending.append((user_text, assistant_text))
+        if interaction_id is not None:
+            state.last_interaction_id = interaction_id
+        if len(state.pending) < self.every_turns:
+            return
+        task = asyncio.create_task(self._update(model_id, session_id, endpoint, model_name, state))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _update(self, model_id, session_id, endpoint, model_name, state: _SummaryState):
+        async with state.lock:
+            await self._ensure_loaded(model_id, session_id, state)
+            if not state.pending:
+                return
+            exchanges, state.pending = state.pending, []
+            try:
+                summary = await self._summarize(endpoint, model_name, state.summary, exchanges)
+            except Exception as e:
+                print(f"[WARN] 대화 요약 갱신 실패: {e}")
+                # 다음 갱신 때 함께 요약하도록 되돌림
+                state.pending = exchanges + state.pending
+                return
+            if not summary:
+                return
+            state.summary = summary
+            state.turns += len(exchanges)
+            await adb.save_llm_summary(model_id, session_id or "", summary, state.turns, state.last_interaction_id)
+            print(f"[🧾 대화 요약 갱신] model={model_id} session={session_id or '-'} turns={state.turns}")
+
+    async def _summarize(self, endpoint: str, model_name: str, summary: str, exchanges: list[tuple[str, str]]) -> str:
+        transcript = "\n".join(f"User: {u}\nAssistant: {a}" for u, a in exchanges)
+        payload = {
+            "model": model_name,
+            "messages": [
+                {"role": "system", "content": SUMMARY_INSTRUCTION.format(max_words=SUMMARY_MAX_WORDS)},
+                {"role": "user", "content": f"Existing summary:\n{summary or '(none)'}\n\nNew exchanges:\n{transcript}"},
+            ],
+            "temperature": 0.2,
+            "max_tokens": SUMMARY_MAX_TOKENS,
+            "stream": False,
+            "cache_prompt": SUMMARY_SLOT_ID is not None,
+        }
+        if SUMMARY_SLOT_ID is not None:
+            payload["id_slot"] = int(SUMMARY_SLOT_ID)
+        res = await get_http_client("llm").post(
+            f"{endpoint}/v1/chat/completions", json=payload, timeout=httpx.Timeout(SUMMARY_TIMEOUT, connect=5.0)
+        )
+        res.raise_for_status()
+        return res.json()["choices"][0]["message"]["content"].strip()
+
+    def forget(self, model_id: int, session_id: str):
+        self._states.pop((int(model_id), session_id or ""), None)
+
+summarizer = ConversationSummarizer()
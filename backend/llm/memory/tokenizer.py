@@ -0,0 +1,125 @@
+# backend/llm/memory/tokenizer.py
+
+"""
+컨텍스트 예산 계산용 토크나이저.
+
+LlamaCppTokenizer는 모델을 서빙 중인 llama.cpp 서버의 /tokenize를 사용하므로
+실제 모델 토크나이저와 같은 값을 얻습니다. 결과는 텍스트 해시별로 캐시하므로
+매 턴 새로 세는 것은 새 메시지뿐입니다. 서버가 응답하지 않으면 HeuristicTokenizer로 대체합니다.
+"""
+
+import asyncio
+import hashlib
+import math
+import os
+import re
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+import httpx
+
+from backend.utils.http_client import get_http_client
+
+LLM_CONTEXT_WINDOW = int(os.getenv("LLM_CONTEXT_WINDOW", 4096))
+TOKEN_COUNT_CACHE_SIZE = int(os.getenv("TOKEN_COUNT_CACHE_SIZE", 8192))
+# 채팅 템플릿이 메시지마다 붙이는 역할/구분 토큰 추정치
+MESSAGE_OVERHEAD_TOKENS = 4
+
+_WORDLIKE = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+
+class Tokenizer(ABC):
+    name = "base"
+
+    @abstractmethod
+    async def count(self, text: str) -> int:
+        """text의 토큰 수"""
+
+    async def count_many(self, texts: list[str]) -> list[int]:
+        return list(await asyncio.gather(*(self.count(t) for t in texts)))
+
+    async def context_window(self) -> int:
+        return LLM_CONTEXT_WINDOW
+
+class HeuristicTokenizer(Tokenizer):
+    """BPE 토크나이저 평균치에 맞춘 근사 (영어 약 4글자/토큰, 비 ASCII는 글자당 1토큰 이상)"""
+    name = "heuristic"
+
+    def count_sync(self, text: str) -> int:
+        if not text:
+            return 0
+        ascii_chars = sum(1 for c in text if ord(c) < 128)
+        non_ascii = len(text) - ascii_chars
+        pieces = len(_WORDLIKE.findall(text))
+        return max(pieces, math.ceil(ascii_chars / 4)) + non_ascii
+
+    async def count(self, text: str) -> int:
+        return self.count_sync(text)
+
+class LlamaCppTokenizer(Tokenizer):
+    name = "llama.cpp"
+
+    def __init__(self, endpoint: str, cache_size: int = TOKEN_COUNT_CACHE_SIZE, retry_after: float = 30.0):
+        self.endpoint = endpoint.rstrip("/")
+        self.cache_size = cache_size
+        self.retry_after = retry_after
+        self._cache: OrderedDict[str, int] = OrderedDict()
+        self._fallback = HeuristicTokenizer()
+        self._down_until = 0.0
+        self._n_ctx: int | None = None
+
+    async def count(self, text: str) -> int:
+        if not text:
+            return 0
+        key = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        if time.monotonic() < self._down_until:
+            return self._fallback.count_sync(text)
+
+        try:
+            res = await get_http_client("llm").post(
+                f"{self.endpoint}/tokenize", json={"content": text}, timeout=httpx.Timeout(5.0)
+            )
+            res.raise_for_status()
+            count = len(res.json()["tokens"])
+        except Exception as e:
+            print(f"[WARN] /tokenize 실패, 근사치 사용: {e}")
+            self._down_until = time.monotonic() + self.retry_after
+            return self._fallback.count_sync(text)
+
+        self._cache[key] = count
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return count
+
+    async def context_window(self) -> int:
+        """서버의 n_ctx (/props). 조회할 수 없으면 LLM_CONTEXT_WINDOW"""
+        if self._n_ctx is not None:
+            return self._n_ctx
+        try:
+            res = await get_http_client("llm").get(f"{self.endpoint}/props", timeout=httpx.Timeout(5.0))
+            res.raise_for_status()
+            data = res.json()
+            n_ctx = (data.get("default_generation_settings") or {}).get("n_ctx") or data.get("n_ctx")
+            self._n_ctx = int(n_ctx) if n_ctx else LLM_CONTEXT_WINDOW
+        except Exception as e:
+            print(f"[WARN] /props 조회 실패, 기본 컨텍스트 크기 사용: {e}")
+            return LLM_CONTEXT_WINDOW
+        return self._n_ctx
+
+_tokenizers: dict[str, Tokenizer] = {}
+
+def get_tokenizer(endpoint: str | None = None) -> Tokenizer:
+    """
+    엔드포인트별 토크나이저. LLM_TOKENIZER=heuristic이면 항상 근사치를 사용합니다.
+    """
+    if not endpoint or os.getenv("LLM_TOKENIZER", "llama.cpp") == "heuristic":
+        return _tokenizers.setdefault("", HeuristicTokenizer())
+    tokenizer = _tokenizers.get(endpoint)
+    if tokenizer is None:
+        tokenizer = _tokenizers[endpoint] = LlamaCppTokenizer(endpoint)
+    return tokenizer
@@ -1,24 +1,86 @@
 # backend/llm/service.py
 
 import os
+import asyncio
 import requests
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel, Field
 from typing import List, Literal
 
-import httpx
 import json
-from pathlib import Path
 import re
 import ast
 
-from backend.db.database import save_llm_interaction, save_llm_feedback
-from backend.llm.emotion.service import analyze_emotion
+from backend.db import aio as adb
+from backend.llm.emotion.service import analyze_emotion, get_emotion_stats
+from backend.llm.emotion.classifier import local_classifier
+from backend.llm.config_cache import config_cache, invalidate_local
+from backend.llm.memory.tokenizer import get_tokenizer
+from backend.llm.memory.summarizer import summarizer
+from backend.llm.session_store import session_store
+from backend.llm.tools.intent_router import intent_router
+from backend.llm.tools.executor import ToolCall, run_tools
+from backend.llm.tools.result_cache import tool_cache, tool_ttl
+from backend.translate.engine import translation_service
+from backend.llm.stream_translate import SentenceSegmenter, IncrementalTranslator
+from backend.utils.http_client import get_http_client
 
 router = APIRouter()
+# 채팅이 이 프로세스에서 처리되므로 설정 변경은 HTTP 알림 없이 로컬 무효화로 충분
+config_cache.local_chat = True
+
+# 응답 후처리(번역 / 감정 분석) 단계별 제한 시간 (초)
+TRANSLATE_TIMEOUT = float(os.getenv("LLM_TRANSLATE_TIMEOUT", 10))
+EMOTION_TIMEOUT = float(os.getenv("LLM_EMOTION_TIMEOUT", 15))
+# 생성 중 문장 단위로 번역해 translated_partial 프레임 전송
+STREAM_TRANSLATE = os.getenv("LLM_STREAM_TRANSLATE", "1") == "1"
+TRANSLATE_TARGETS = ["ko", "ja"]
+# 컨텍스트 예산 계산 시 생성 토큰 외에 남겨둘 여유분
+CONTEXT_SAFETY_TOKENS = int(os.getenv("LLM_CONTEXT_SAFETY_TOKENS", 32))
+# 매 턴 값이 바뀌는 프롬프트 변수 (시스템 프롬프트에 직접 넣으면 llama.cpp 프롬프트 캐시가 깨짐)
+VOLATILE_VARIABLES = ("time", "date")
+PROMPT_VARIABLE_PATTERN = re.compile(r"\{([\w_]+)\}")
+# llama.cpp 슬롯 고정 (모델 params.id_slot이 우선)
+LLM_SLOT_ID = os.getenv("LLM_SLOT_ID")
+
+async def run_stage(name: str, coro, timeout: float, default):
+    """
+    후처리 단계를 제한 시간 안에 실행하고, 실패하거나 시간 초과 시 default를 반환합니다.
+    한 단계가 실패해도 나머지 단계의 결과는 그대로 사용할 수 있습니다.
+    """
+    try:
+        return await asyncio.wait_for(coro, timeout)
+    except asyncio.TimeoutError:
+        print(f"[WARN] {name} 시간 초과 ({timeout}s)")
+    except Exception as e:
+        print(f"[ERROR] {name} 실패: {e}")
+    return default
+
+def parse_prompt_cache(chunk: dict) -> dict | None:
+    """
+    llama.cpp 스트림 청크의 timings / usage에서 프롬프트 캐시 사용량 추출
+    """
+    timings = chunk.get("timings")
+    if timings and "prompt_n" in timings:
+        return {
+            "prompt_tokens": timings.get("prompt_n", 0) + timings.get("cache_n", 0),
+            "cached_tokens": timings.get("cache_n", 0),
+            "evaluated_tokens": timings.get("prompt_n", 0),
+            "prompt_ms": round(timings.get("prompt_ms", 0), 1),
+        }
+    usage = chunk.get("usage")
+    if usage and "prompt_tokens" in usage:
+        cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0)
+        return {
+            "prompt_tokens": usage["prompt_tokens"],
+            "cached_tokens": cached,
+            "evaluated_tokens": usage["prompt_tokens"] - cached,
+            "prompt_ms": None,
+        }
+    return None
 
 def load_system_prompt() -> str:
-    return Path("backend/llm/prompt/arielle_prompt.txt").read_text(encoding="utf-8")
+    return config_cache.system_prompt()
 
 def clean_text(text: str) -> str:
     return re.sub(r'\*.*?\*', '', text).strip()
@@ -55,14 +117,6 @@ def evaluate_math_expr(expr: str) -> str:
         print(f"[❌ 계산 실패] {expr} -> {e}")
         return f"Error: {e}"
     
-def extract_weather_expr(text: str) -> str | None:
-    match = re.search(r'\b(?:weather|forecast)\s+(?:in\s+)?([A-Za-z\s]+)', text, re.IGNORECASE)
-    if match:
-        location = match.group(1).strip()
-        print(f"[🌤️ 감지된 날씨 위치]: {location}")
-        return location
-    return None
-
 class ChatMessage(BaseModel):
     role: Literal["user", "assistant"]
     content: str
@@ -107,15 +161,13 @@ class ChatRequest(BaseModel):
 
 @router.websocket('/ws/chat')
 async def websocket_chat(ws: WebSocket):
-    from backend.db.database import get_connection, get_llm_model_by_id, get_prompt_templates_by_ids
     from backend.utils.prompt_utils import apply_variables
-    from backend.llm.memory.context_builder import build_context
-    import re
+    from backend.llm.memory.context_builder import build_context, SUMMARY_STRATEGIES
     from datetime import datetime
     from urllib.parse import quote
 
     def extract_variables(template: str) -> list[str]:
-        return re.findall(r"\{([\w_]+)\}", template)
+        return PROMPT_VARIABLE_PATTERN.findall(template)
     
     def resolve_variables(vars: list[str]) -> dict:
         now = datetime.now()
@@ -127,86 +179,28 @@ async def websocket_chat(ws: WebSocket):
             ) for var in vars
         }
     
-    def get_tools_by_ids(tool_ids: list[int]):
-        if not tool_ids:
-            return []
-        conn = get_connection()
-        try:
-            with conn.cursor() as cursor:
-                q = f"SELECT id, name, type, command, enabled FROM mcp_tools WHERE id IN ({','.join(['%s'] * len(tool_ids))})"
-                cursor.execute(q, tuple(tool_ids))
-                return [
-                    {"id": r[0], "name": r[1], "type": r[2], "command": r[3], "enabled": r[4]}
-                    for r in cursor.fetchall()
-                ]
-        finally:
-            conn.close()
-
-    def extract_math_expr(text: str) -> str | None:
-        lowered = text.lower()
-
-        if 'spotify' in lowered or 'play' in lowered or 'music' in lowered:
-            return None
-        
-        matches = re.findall(r'[\(]?[0-9\.\s\+\-\*/\^()]+[\)]?', text)
-        
-        for expr in matches:
-            cleaned = expr.strip().replace("^", "**")
-            if ' - ' in cleaned:
-                continue
-            if any(op in cleaned for op in ['+', '-', '*', '/', '**']):
-                print(f"[🧠 감지된 수식]: {cleaned}")
-                return cleaned
-        
-        return None
-    
-    def extract_search_query(text: str) -> str | None:
-        match = re.search(r'\b(?:search|find|look\s+up)\s+(.+)', text, re.IGNORECASE)
-        if match:
-            query = match.group(1).strip()
-            print(f"[🔍 감지된 검색어]: {query}")
-            return query
-        return None
-    
-    def extract_spotify_query(text: str) -> str | None:
-        match = re.search(r'\bplay\s+(.+?)\s+(?:on|with)\s+spotify\b', text, re.IGNORECASE)
-        if match:
-            song = match.group(1).strip()
-            print(f"[🎵 Spotify 요청 감지]: {song}")
-            return song
-        return None
-    
-    def extract_spotify_command(text: str) -> dict | None:
-        text = text.lower()
-
-        if re.search(r'\b(pause|stop)\b.*(music|song)?', text):
-            return {"action": "pause"}
-        if re.search(r'\b(resume|continue)\b.*(music|song)?', text):
-            return {"action": "play"}
-        if re.search(r'\b(skip|next)\b.*(track|song|music)?', text):
-            return {"action": "next"}
-        if re.search(r'\b(previous|back)\b.*(track|song)?', text):
-            return {"action": "previous"}
-        if re.search(r'\b(volume\s+up|turn\s+up\s+the\s+volume|increase\s+volume)\b', text):
-            return {"action": "volume_up"}
-        if re.search(r'\b(volume\s+down|turn\s+down\s+the\s+volume|decrease\s+volume)\b', text):
-            return {"action": "volume_down"}
-        
-        return None
-
     await ws.accept()
 
     try:
         while True:
             data = await ws.receive_json()
 
+            if data.get("type") == "ping":
+                await ws.send_json({"type": "pong"})
+                continue
+
+            if data.get("type") == "session_reset":
+                session_store.discard(data.get("session_id") or "")
+                continue
+
             model_id = data.get("model_id")
             if model_id is None:
                 await ws.send_text("[NOTICE] 모델 ID가 없습니다! 웹소켓을 다시 연결해 주세요!")
                 await ws.close()
                 return
             
-            model = get_llm_model_by_id(model_id)
+            config = await config_cache.get(model_id)
+            model = config.model if config else None
             if not model or not model["enabled"]:
                 await ws.send_text("[NOTICE] 사용 불가능한 모델입니다! 웹소켓을 다시 연결해 주세요!")
                 await ws.close()
@@ -215,18 +209,15 @@ async def websocket_chat(ws: WebSocket):
             model_name = model["model_key"]
             endpoint = model["endpoint"]
 
-            try:
-                params = json.loads(model.get("params") or "{}")
-            except Exception as e:
-                await ws.send("[NOTICE] 모델 파라미터 디코딩에 실패했습니다! 웹소켓을 다시 연결해 주세요!")
-                print(f"[ERROR] 모델 파라미터 JSON 디코드 실패: {e}")
+            params = config.params
+            if params is None:
+                await ws.send_text("[NOTICE] 모델 파라미터 디코딩에 실패했습니다! 웹소켓을 다시 연결해 주세요!")
                 await ws.close()
                 return
             
             # 프롬프트
-            prompt_ids = params.get("prompts", [])
             manual_prompt = params.get("prompt", "").strip()
-            template_prompts = get_prompt_templates_by_ids(prompt_ids)
+            template_prompts = config.template_prompts(include_volatile=False)
 
             if manual_prompt:
                 system_prompt = manual_prompt
@@ -236,8 +227,16 @@ async def websocket_chat(ws: WebSocket):
                 system_prompt = load_system_prompt()
 
             # 프롬프트 변수 처리
+            # 시각/날짜는 시스템 프롬프트에 고정 표기만 남기고 실제 값은 마지막 사용자 메시지 앞에 전달
             vars = extract_variables(system_prompt)
-            system_prompt = apply_variables(system_prompt, vars, resolve_variables(vars))
+            values = resolve_variables(vars)
+            volatile_vars = [v for v in vars if v in VOLATILE_VARIABLES]
+            system_prompt = apply_variables(system_prompt, [v for v in vars if v not in VOLATILE_VARIABLES], values)
+            system_prompt = apply_variables(system_prompt, volatile_vars, {v: f"[current {v}]" for v in volatile_vars})
+            volatile_note = (
+                "Current context: " + ", ".join(f"{v} = {values[v]}" for v in dict.fromkeys(volatile_vars))
+                if volatile_vars else None
+            )
             
             # Sampling & Memory
             sampling = params.get("sampling", {})
@@ -251,50 +250,35 @@ async def websocket_chat(ws: WebSocket):
                 "repeat_penalty": sampling.get("repetitionPenalty", 1.1),
             }
             
-            msgs = data.get('messages', [])
+            # 새 방식: {model_id, session_id?, message, history?} - 이력은 서버 세션에서 가져옴
+            # 기존 방식: {model_id, messages} - 클라이언트가 보낸 전체 이력을 그대로 사용
+            session = None
+            if "message" in data:
+                requested_id = (data.get("session_id") or "").strip()
+                session, is_new = await session_store.get_or_create(requested_id, data.get("history"))
+                if requested_id and is_new:
+                    # 서버 재시작/세션 만료로 이력을 잃음 - 맥락 없는 응답 대신 클라이언트가 이력과 함께 다시 보내도록
+                    session_store.discard(session.id)
+                    await ws.send_json({"type": "session_expired", "session_id": requested_id})
+                    continue
+                await ws.send_json({"type": "session", "session_id": session.id})
+                msgs = session.messages + [{"role": "user", "content": str(data.get("message") or "")}]
+            else:
+                msgs = data.get('messages', [])
+            session_id = session.id if session else ""
 
-            tool_ids = params.get("tools", [])
-            tool_defs = get_tools_by_ids(tool_ids)
+            tool_defs = config.tools
 
             print(f"[🧰 tool_defs 목록]: {tool_defs}")
 
-            weather_query = extract_weather_expr(msgs[-1]["content"])
-            weather_result = None
+            # 도구 의도 감지 (모델에 연결된 활성 도구만)
+            enabled_tools = {t["name"] for t in tool_defs if t["enabled"]}
+            intents = {i["intent"]: i for i in intent_router.classify(msgs[-1]["content"], enabled_tools)}
+            if intents:
+                print(f"[🧭 감지된 의도]: {list(intents.values())}")
 
-            if weather_query:
-                weather_tool = next((t for t in tool_defs if t["name"] == "fetch_weather" and t["enabled"]), None)
-                if weather_tool:
-                    try:
-                        url = weather_tool["command"].replace("{{expr}}", quote(weather_query))
-                        print(f"[🌤️ fetch_weather 실행 URL]: {url}")
-                        async with httpx.AsyncClient() as client:
-                            res = await client.get(url)
-                            weather_result = res.text.strip()
-                        print(f"[🌤️ 날씨 결과]: {weather_result}")
-                    except Exception as e:
-                        print(f"[❌ fetch_weather 실행 실패]: {e}")
-
-            search_query = extract_search_query(msgs[-1]["content"])
-            search_result = None
-
-            if search_query:
-                search_tool = next((t for t in tool_defs if t["name"] == "search" and t["enabled"]), None)
-                if search_tool:
-                    try:
-                        encoded = quote(search_query)
-                        url = f"http://localhost:8500/mcp/api/tools/search?query={encoded}"
-                        print(f"[🔍 search 실행 URL]: {url}")
-                        async with httpx.AsyncClient() as client:
-                            res = await client.get(url)
-                            data = res.json()
-                            if "title" in data:
-                                search_result = f"{data['title']}: {data['summary']} ({data['link']})"
-                                print(f"[🔍 검색 결과]: {search_result}")
-                    except Exception as e:
-                        print(f"[❌ search 실행 실패]: {e}")
-
-            spotify_query = extract_spotify_query(msgs[-1]["content"])
-            spotify_cmd = extract_spotify_command(msgs[-1]["content"])
+            spotify_query = intents.get("spotify_play", {}).get("query")
+            spotify_cmd = intents.get("spotify_command")
 
             tool_call = None
 
@@ -307,32 +291,66 @@ async def websocket_chat(ws: WebSocket):
             elif spotify_cmd:
                 tool_call = {
                     "integration": "spotify",
-                    **spotify_cmd
+                    "action": spotify_cmd["action"]
                 }
 
-            expr = extract_math_expr(msgs[-1]["content"])
-            tool_result = None
+            # 도구 실행 단계: 감지된 도구를 동시에 실행하고 끝나는 대로 notes에 추가
+            tools_by_name = {t["name"]: t for t in tool_defs if t["enabled"]}
+            tool_calls = []
 
-            if expr:
+            if "calculate" in intents:
+                expr = intents["calculate"]["expr"]
                 print(f"[🧪 수식 감지됨]: {expr}")
-                calc_tool = next((t for t in tool_defs if t["name"] == "calculate" and t["enabled"]), None)
-                if calc_tool:
-                    print(f"[🧪 calculate 도구 사용] {calc_tool}")
-                    tool_result = evaluate_math_expr(expr)
-                else:
-                    print("[⚠️ calculate 도구가 등록되어 있지 않음]")
-
-            context = await build_context(
-                model_id=model_id,
-                system_prompt=system_prompt,
-                user_messages=msgs,
-                memory_settings=memory
-            )
-
-            local_source_ids = params.get("local_sources", [])
-            if local_source_ids:
+                tool_calls.append(ToolCall(
+                    "calculate",
+                    lambda expr=expr: asyncio.to_thread(evaluate_math_expr, expr),
+                    note=lambda value, expr=expr: f"The result of '{expr}' is {value}. Include this result in your reply.",
+                ))
+
+            if "weather" in intents:
+                weather_query = intents["weather"]["query"]
+                weather_tool = tools_by_name["fetch_weather"]
+
+                async def run_weather(query=weather_query, tool=weather_tool):
+                    async def fetch():
+                        url = tool["command"].replace("{{expr}}", quote(query))
+                        print(f"[🌤️ fetch_weather 실행 URL]: {url}")
+                        res = await get_http_client("tools").get(url)
+                        res.raise_for_status()
+                        return res.text.strip()
+                    return await tool_cache.get_or_fetch("fetch_weather", query, fetch, tool_ttl(tool))
+
+                tool_calls.append(ToolCall(
+                    "fetch_weather", run_weather,
+                    note=lambda value, query=weather_query: f"The weather in {query} is: {value}. Please include this in your response if relevant.",
+                ))
+
+            if "search" in intents:
+                search_query = intents["search"]["query"]
+                search_tool = tools_by_name["search"]
+
+                async def run_search(query=search_query, tool=search_tool):
+                    async def fetch():
+                        url = f"http://localhost:8500/mcp/api/tools/search?query={quote(query)}"
+                        print(f"[🔍 search 실행 URL]: {url}")
+                        res = await get_http_client("tools").get(url)
+                        data = res.json()
+                        if "title" not in data:
+                            return None
+                        return f"{data['title']}: {data['summary']} ({data['link']})"
+                    return await tool_cache.get_or_fetch("search", query, fetch, tool_ttl(tool))
+
+                tool_calls.append(ToolCall(
+                    "search", run_search,
+                    note=lambda value, query=search_query: f"Here is the result for '{query}': {value}. Include this in your reply if helpful.",
+                ))
+
+            async def load_sources() -> list[str]:
+                local_source_ids = params.get("local_sources", [])
+                if not local_source_ids:
+                    return []
                 from backend.utils.source_loader import load_text_from_local_sources
-                texts = load_text_from_local_sources(local_source_ids)
+                texts = await adb.run_db(load_text_from_local_sources, local_source_ids)
 
                 print(f"[📁 로컬 소스 ID 목록]: {local_source_ids}")
                 print(f"[📁 로컬 소스 참고 문서 수]: {len(texts)}개")
@@ -341,44 +359,87 @@ async def websocket_chat(ws: WebSocket):
                     header = text.split('\n')[0] if '\n' in text else text[:50]
                     print(f"[📄 문서 {idx+1}] 헤더: {header}")
 
+                sources = []
                 for text in texts:
                     role_intro = "This is character information:" if " is a " in text else "This is background knowledge:"
-                    context.append({
-                        "role": "system",
-                        "content": f"{role_intro}\n{text[:500]}"
-                    })
+                    sources.append(f"{role_intro}\n{text[:500]}")
+                return sources
+
+            notes = [volatile_note] if volatile_note else []
 
-            if tool_result:
-                print(f"[🧪 LLM 전달용 결과] '{expr}' = {tool_result}")
-                context.append({
-                    "role": "system",
-                    "content": f"The result of '{expr}' is {tool_result}. Include this result in your reply."
-                })
-
-            if weather_result:
-                context.append({
-                    "role": "system",
-                    "content": f"The weather in {weather_query} is: {weather_result}. Please include this in your response if relevant."
-                })
-
-            if search_result:
-                context.append({
-                    "role": "system",
-                    "content": f"Here is the result for '{search_query}': {search_result}. Include this in your reply if helpful."
-                })
+            def add_tool_note(result):
+                if result.note:
+                    print(f"[🧪 LLM 전달용 결과] {result.name} = {result.value}")
+                    notes.append(result.note)
+
+            # 로컬 소스 로딩도 도구와 함께 진행 → 가장 느린 작업만큼만 대기
+            sources, tool_results = await asyncio.gather(
+                load_sources(),
+                run_tools(tool_calls, on_result=add_tool_note),
+            )
+
+            context, context_usage = await build_context(
+                model_id=model_id,
+                system_prompt=system_prompt,
+                user_messages=msgs,
+                memory_settings=memory,
+                sources=sources,
+                notes=notes,
+                tokenizer=get_tokenizer(endpoint),
+                reserve_tokens=opts["max_tokens"] + CONTEXT_SAFETY_TOKENS,
+                session_id=session_id
+            )
+            print(f"[🧮 컨텍스트 토큰]: {context_usage['used']}/{context_usage['budget']} (이력 {context_usage['history_messages']}개, 제외 {context_usage['dropped_messages']}개)")
 
             stream_text = ""
             payload = {
                 "model": model_name,
                 "messages": context,
                 "stream": True,
+                # 이전 턴과 같은 앞부분의 KV 캐시 재사용
+                "cache_prompt": True,
                 **opts
             }
+            slot_id = params.get("id_slot", LLM_SLOT_ID)
+            if slot_id not in (None, "", "-1", -1):
+                payload["id_slot"] = int(slot_id)
+            prompt_cache = None
 
             if os.getenv("DEBUG_LLM_PAYLOAD") == "1":
                 print(f"[▶️ 요청 payload]\n{json.dumps(payload, indent=2)}")
 
-            async with httpx.AsyncClient(timeout=None) as client:
+            segmenter = SentenceSegmenter() if STREAM_TRANSLATE else None
+            partials = IncrementalTranslator(
+                lambda sentence: translation_service.translate(sentence, "en", TRANSLATE_TARGETS),
+                TRANSLATE_TIMEOUT
+            )
+
+            async def send_partials(items):
+                for index, sentence, result in items:
+                    await ws.send_json({
+                        "type": "translated_partial",
+                        "index": index,
+                        "source": sentence,
+                        "translated": result.get("ko", ""),
+                        "ja_translated": result.get("ja", ""),
+                    })
+
+            async def finish_translation() -> dict[str, str]:
+                """남은 문장 번역을 마저 보내고, 문장 번역을 이어 붙인 전체 번역을 반환"""
+                if segmenter is not None:
+                    rest = segmenter.flush()
+                    if rest:
+                        partials.add(rest)
+                    await send_partials(await partials.drain())
+                    ko = partials.joined("ko", " ")
+                    ja = partials.joined("ja", "")
+                    if ko is not None and ja is not None:
+                        return {"ko": ko, "ja": ja}
+                # 문장 번역이 일부 실패했거나 비활성화된 경우 전체 번역
+                return await translation_service.translate(stream_text, "en", TRANSLATE_TARGETS)
+
+            try:
+                client = get_http_client("llm")
                 async with client.stream("POST", f"{endpoint}/v1/chat/completions", json=payload) as res:
                     async for line in res.aiter_lines():
                         if line.startswith("data: "):
@@ -388,65 +449,77 @@ async def websocket_chat(ws: WebSocket):
                                 break
                             try:
                                 chunk = json.loads(content)
-                                delta = chunk["choices"][0]["delta"].get("content", "")
+                                prompt_cache = parse_prompt_cache(chunk) or prompt_cache
+                                if not chunk.get("choices"):
+                                    continue
+                                delta = chunk["choices"][0]["delta"].get("content") or ""
                                 stream_text += delta
                                 await ws.send_text(delta)
                             except Exception as e:
                                 print(f"[ERROR] JSON decode 실패: {e}")
                                 continue
-            
-            # 번역 및 감정 분석
-            try:
-                async with httpx.AsyncClient() as client:
-                    ko_res = await client.post("http://localhost:8000/api/translate", json={
-                        "text": stream_text,
-                        "from_lang": "en",
-                        "to": "ko"
-                    })
-                    ko_translation = ko_res.json().get("translated", "")
 
-                    ja_res = await client.post("http://localhost:8000/api/translate", json={
-                        "text": stream_text,
-                        "from_lang": "en",
-                        "to": "ja"
-                    })
-                    ja_translation = ja_res.json().get("translated", "")
+                            if segmenter is not None and delta:
+                                for sentence in segmenter.feed(delta):
+                                    partials.add(sentence)
+                                await send_partials(partials.ready())
+
+                if prompt_cache:
+                    print(f"[⚡ 프롬프트 캐시]: {prompt_cache['cached_tokens']}/{prompt_cache['prompt_tokens']} 토큰 재사용 ({prompt_cache['prompt_ms']}ms)")
 
+                if session and stream_text.strip():
+                    session_store.record_turn(session, msgs[-1]["content"], stream_text.strip())
+
+                # 번역 및 감정 분석
                 try:
-                    emo_data = await analyze_emotion(stream_text)
+                    # 남은 문장 번역과 감정 분석을 동시에 실행
+                    translations, emo_data = await asyncio.gather(
+                        run_stage("번역", finish_translation(), TRANSLATE_TIMEOUT, {}),
+                        run_stage("감정 분석", analyze_emotion(stream_text), EMOTION_TIMEOUT, {}),
+                    )
+                    ko_translation = translations.get("ko", "")
+                    ja_translation = translations.get("ja", "")
                     emotion = emo_data.get("emotion", "neutral")
                     tone = emo_data.get("tone", "neutral")
+
+                    interaction_id = await adb.save_llm_interaction(
+                        model_name=model_name,
+                        request=msgs[-1]["content"],
+                        response=stream_text.strip(),
+                        translate_response=ko_translation,
+                        ja_translate_response=ja_translation,
+                        emotion=emotion,
+                        tone=tone,
+                        session_id=session_id if session and session_store.persist else None,
+                        # 분석 실패/시간 초과로 기본값을 쓴 경우는 학습에서 제외되도록 default
+                        emotion_source=emo_data.get("source", "default")
+                    )
+
+                    # print("[✅ WebSocket 번역 결과]", {
+                    #     "id": interaction_id,
+                    #     "ko": ko_translation,
+                    #     "ja": ja_translation
+                    # })
+                    await ws.send_json({
+                        "type": "interaction_id",
+                        "id": interaction_id,
+                        "translated": ko_translation,
+                        "ja_translated": ja_translation,
+                        "emotion": emotion,
+                        "tone": tone,
+                        "toolCall": tool_call,
+                        "context": {**context_usage, "prompt_cache": prompt_cache, "tools": [r.to_dict() for r in tool_results]}
+                    })
+
+                    if memory.get("strategy") in SUMMARY_STRATEGIES:
+                        summarizer.schedule_update(
+                            model_id, session_id, endpoint, model_name,
+                            msgs[-1]["content"], stream_text.strip(), interaction_id
+                        )
                 except Exception as e:
-                    print(f"[ERROR] 감정 분석 실패: {e}")
-                    emotion = "neutral"
-                    tone = "neutral"
-
-                interaction_id = save_llm_interaction(
-                    model_name=model_name,
-                    request=msgs[-1]["content"],
-                    response=stream_text.strip(),
-                    translate_response=ko_translation,
-                    ja_translate_response=ja_translation,
-                    emotion=emotion,
-                    tone=tone
-                )
-
-                # print("[✅ WebSocket 번역 결과]", {
-                #     "id": interaction_id,
-                #     "ko": ko_translation,
-                #     "ja": ja_translation
-                # })
-                await ws.send_json({
-                    "type": "interaction_id",
-                    "id": interaction_id,
-                    "translated": ko_translation,
-                    "ja_translated": ja_translation,
-                    "emotion": emotion,
-                    "tone": tone,
-                    "toolCall": tool_call
-                })
-            except Exception as e:
-                print(f"[ERROR] 번역 또는 DB 저장 실패: {e}")
+                    print(f"[ERROR] 번역 또는 DB 저장 실패: {e}")
+            finally:
+                partials.cancel()
         
     except WebSocketDisconnect:
         print("[WS] 클라이언트 연결 종료")
@@ -454,6 +527,40 @@ async def websocket_chat(ws: WebSocket):
         print(f"[WS ERROR]: {e}")
         await ws.close()
 
+class ConfigInvalidateRequest(BaseModel):
+    model_id: int | None = None
+
+@router.post("/config/invalidate")
+def invalidate_config(req: ConfigInvalidateRequest):
+    invalidate_local(req.model_id)
+    return {"status": "ok"}
+
+@router.get("/config/stats")
+def config_stats():
+    return config_cache.stats()
+
+@router.get("/tools/cache/stats")
+def tool_cache_stats():
+    return tool_cache.stats()
+
+@router.delete("/tools/cache")
+def clear_tool_cache(tool: str | None = None):
+    tool_cache.clear(tool)
+    return {"status": "cleared"}
+
+@router.get("/sessions/stats")
+def session_stats():
+    return session_store.stats()
+
+@router.get("/emotion/stats")
+def emotion_stats():
+    return get_emotion_stats()
+
+@router.post("/emotion/retrain")
+async def retrain_emotion_classifier():
+    await local_classifier.train()
+    return local_classifier.stats()
+
 class FeedbackRequest(BaseModel):
     interaction_id: int
     rating: Literal['up', 'down'] | None = None
@@ -462,7 +569,7 @@ class FeedbackRequest(BaseModel):
 @router.post("/feedback")
 async def save_feedback(req: FeedbackRequest):
     try:
-        save_llm_feedback(
+        await adb.save_llm_feedback(
             interaction_id=req.interaction_id,
             rating=req.rating,
             tone_score=req.tone_score
@@ -0,0 +1,119 @@
+# backend/llm/session_store.py
+
+"""
+websocket_chat 대화 세션 저장소.
+
+클라이언트는 매 턴 전체 messages 대신 session_id와 새 메시지만 보내고,
+대화 이력은 서버가 세션별로 보관합니다(LRU, 최근 LLM_SESSION_MAX_MESSAGES개).
+한도를 넘으면 LLM_SESSION_TRIM_CHUNK개씩 한꺼번에 버려, 매 턴 이력 앞부분이 바뀌지 않도록 합니다.
+LLM_SESSION_PERSIST=1(기본)이면 llm_interactions.session_id로 저장되어
+서버 재시작 후에도 같은 session_id로 이력을 복원합니다.
+복원할 이력이 없는 session_id가 오면 websocket_chat이 session_expired를 보내고,
+클라이언트는 자신이 가진 이력(history)과 함께 다시 보내 새 세션을 시작합니다.
+"""
+
+import os
+import time
+import uuid
+from collections import OrderedDict
+
+from backend.db import aio as adb
+
+LLM_SESSION_MAX = int(os.getenv("LLM_SESSION_MAX", 256))
+LLM_SESSION_MAX_MESSAGES = int(os.getenv("LLM_SESSION_MAX_MESSAGES", 64))
+# 한 번에 버릴 메시지 수 (짝수, LLM_HISTORY_CHUNK_MESSAGES의 배수로 맞추면 잘리는 위치가 일치)
+LLM_SESSION_TRIM_CHUNK = max(2, int(os.getenv("LLM_SESSION_TRIM_CHUNK", 16)) // 2 * 2)
+LLM_SESSION_PERSIST = os.getenv("LLM_SESSION_PERSIST", "1") == "1"
+
+class ChatSession:
+    __slots__ = ("id", "messages", "created_at", "updated_at")
+
+    def __init__(self, session_id: str, messages: list[dict] | None = None):
+        self.id = session_id
+        self.messages = messages or []
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+
+    def append(self, role: str, content: str, max_messages: int = LLM_SESSION_MAX_MESSAGES, trim_chunk: int = LLM_SESSION_TRIM_CHUNK):
+        self.messages.append({"role": role, "content": content})
+        excess = len(self.messages) - max_messages
+        if excess > 0:
+            # trim_chunk 단위로 올려서 버림
+            del self.messages[:-(-excess // trim_chunk) * trim_chunk]
+        self.updated_at = time.time()
+
+class SessionStore:
+    def __init__(self, max_sessions: int = LLM_SESSION_MAX, max_messages: int = LLM_SESSION_MAX_MESSAGES, persist: bool = LLM_SESSION_PERSIST):
+        self.max_sessions = max(1, max_sessions)
+        self.max_messages = max(2, max_messages)
+        self.persist = persist
+        self._sessions: OrderedDict[str, ChatSession] = OrderedDict()
+        self._restored = 0
+        self._evicted = 0
+
+    async def get_or_create(self, session_id: str | None, history: list | None = None) -> tuple[ChatSession, bool]:
+        """
+        (세션, 이력 없이 새로 만들었는지)를 반환합니다.
+        알 수 없는 session_id는 저장된 이력이 있으면 복원하고, 없으면 history(클라이언트가 보낸 이력)로
+        채워 같은 ID로 새로 만듭니다.
+        """
+        session_id = (session_id or "").strip()[:64]
+        if session_id in self._sessions:
+            self._sessions.move_to_end(session_id)
+            return self._sessions[session_id], False
+
+        if not session_id:
+            session_id = uuid.uuid4().hex
+
+        messages = []
+        if self.persist:
+            messages = await self._restore(session_id)
+            if messages:
+                self._restored += 1
+        if not messages:
+            messages = self._sanitize(history)
+
+        session = ChatSession(session_id, messages)
+        self._sessions[session_id] = session
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+            self._evicted += 1
+        return session, not messages
+
+    async def _restore(self, session_id: str) -> list[dict]:
+        rows = await adb.get_llm_session_history(session_id, self.max_messages // 2)
+        messages = []
+        for row in rows:
+            messages.append({"role": "user", "content": row["request"]})
+            messages.append({"role": "assistant", "content": row["response"]})
+        return messages[-self.max_messages:]
+
+    def _sanitize(self, history: list | None) -> list[dict]:
+        """클라이언트가 보낸 이력에서 user/assistant 텍스트 메시지만 최근 max_messages개 사용"""
+        messages = []
+        for m in history or []:
+            if not isinstance(m, dict) or m.get("role") not in ("user", "assistant"):
+                continue
+            content = m.get("content")
+            if isinstance(content, str) and content.strip():
+                messages.append({"role": m["role"], "content": content})
+        return messages[-self.max_messages:]
+
+    def record_turn(self, session: ChatSession, user_text: str, assistant_text: str):
+        session.append("user", user_text, self.max_messages)
+        session.append("assistant", assistant_text, self.max_messages)
+
+    def discard(self, session_id: str):
+        self._sessions.pop(session_id, None)
+
+    def stats(self) -> dict:
+        return {
+            "sessions": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "max_messages": self.max_messages,
+            "persist": self.persist,
+            "restored": self._restored,
+            "evicted": self._evicted,
+        }
+
+session_store = SessionStore()
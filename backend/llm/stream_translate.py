@@ -0,0 +1,109 @@
+# backend/llm/stream_translate.py
+
+"""
+LLM 스트리밍 응답의 문장 단위 점진 번역.
+
+SentenceSegmenter가 토큰 스트림에서 완성된 문장을 잘라내면
+IncrementalTranslator가 생성이 계속되는 동안 바로 번역을 시작합니다.
+번역 결과는 문장 순서대로만 꺼낼 수 있으므로, 호출자는 이를 그대로 WebSocket으로 보내면 됩니다.
+"""
+
+import asyncio
+import re
+
+# 문장 끝 (마침표/느낌표/물음표 + 닫는 따옴표·괄호) 뒤 공백, 또는 줄바꿈
+_BOUNDARY = re.compile(r"[.!?…]+[\"'”’)\]]*\s+|\n+")
+_ABBREVIATIONS = {"mr", "mrs", "ms", "dr", "prof", "st", "vs", "etc", "e.g", "i.e", "no"}
+
+class SentenceSegmenter:
+    def __init__(self, min_chars: int = 4):
+        self.min_chars = min_chars
+        self._buffer = ""
+
+    def feed(self, delta: str) -> list[str]:
+        """delta를 이어 붙이고 새로 완성된 문장들을 반환"""
+        self._buffer += delta
+        sentences = []
+        start = 0
+        for match in _BOUNDARY.finditer(self._buffer):
+            candidate = self._buffer[start:match.end()].strip()
+            if not candidate:
+                start = match.end()
+                continue
+            # 너무 짧은 조각과 약어(Mr. 등)는 다음 문장과 합침
+            if len(candidate) < self.min_chars or self._is_abbreviation(match.start()):
+                continue
+            sentences.append(candidate)
+            start = match.end()
+        self._buffer = self._buffer[start:]
+        return sentences
+
+    def flush(self) -> str:
+        rest = self._buffer.strip()
+        self._buffer = ""
+        return rest
+
+    def _is_abbreviation(self, dot_index: int) -> bool:
+        if self._buffer[dot_index] != ".":
+            return False
+        words = self._buffer[:dot_index].split()
+        return bool(words) and words[-1].lower().strip("(\"'") in _ABBREVIATIONS
+
+class IncrementalTranslator:
+    """
+    문장별 번역 작업을 관리합니다.
+    translate(sentence) -> {lang: text} 를 문장마다 태스크로 실행하고, 결과는 입력 순서대로 반환합니다.
+    """
+
+    def __init__(self, translate, timeout: float):
+        self._translate = translate
+        self._timeout = timeout
+        self._tasks: list[tuple[str, asyncio.Task]] = []
+        self._results: list[dict[str, str] | None] = []
+        self.failed = False
+
+    def add(self, sentence: str):
+        task = asyncio.create_task(asyncio.wait_for(self._translate(sentence), self._timeout))
+        self._tasks.append((sentence, task))
+
+    def ready(self) -> list[tuple[int, str, dict[str, str]]]:
+        """앞에서부터 연속으로 완료된 문장 번역만 반환 (대기하지 않음)"""
+        items = []
+        while len(self._results) < len(self._tasks):
+            sentence, task = self._tasks[len(self._results)]
+            if not task.done():
+                break
+            items.append(self._collect(sentence, task))
+        return [item for item in items if item is not None]
+
+    async def drain(self) -> list[tuple[int, str, dict[str, str]]]:
+        """남은 문장 번역을 모두 기다려 순서대로 반환"""
+        items = []
+        while len(self._results) < len(self._tasks):
+            sentence, task = self._tasks[len(self._results)]
+            await asyncio.wait([task])
+            items.append(self._collect(sentence, task))
+        return [item for item in items if item is not None]
+
+    def _collect(self, sentence, task):
+        index = len(self._results)
+        if task.cancelled() or task.exception() is not None:
+            error = "cancelled" if task.cancelled() else task.exception()
+            print(f"[WARN] 문장 번역 실패 ({index}): {error!r}")
+            self.failed = True
+            self._results.append(None)
+            return None
+        result = task.result() or {}
+        self._results.append(result)
+        return index, sentence, result
+
+    def joined(self, lang: str, sep: str = " ") -> str | None:
+        """모든 문장이 번역된 경우에만 이어 붙인 전체 번역을 반환"""
+        if self.failed or not self._results or any(r is None or lang not in r for r in self._results):
+            return None
+        return sep.join(r[lang] for r in self._results).strip()
+
+    def cancel(self):
+        for _, task in self._tasks:
+            if not task.done():
+                task.cancel()
@@ -0,0 +1,127 @@
+# backend/llm/tools/bench_intent_router.py
+
+"""
+의도 라우터 마이크로 벤치마크.
+
+기존 websocket_chat의 extract_* 체인과 IntentRouter.classify를
+같은 예시 발화 묶음에 대해 비교하고, 두 결과가 같은지도 확인합니다.
+
+    python -m backend.llm.tools.bench_intent_router [반복 횟수]
+"""
+
+import re
+import sys
+import timeit
+
+from backend.llm.tools.intent_router import intent_router
+
+SAMPLE_UTTERANCES = [
+    "Hi Arielle, how was your day?",
+    "What's the weather in Seoul",
+    "weather forecast in New York for tomorrow",
+    "Can you search latest llama.cpp release notes",
+    "find a good ramen place near Gangnam station",
+    "look up the population of Busan",
+    "play Ditto by NewJeans on spotify",
+    "pause the music please",
+    "skip this song",
+    "go back to the previous track",
+    "turn up the volume",
+    "volume down a little",
+    "what is 12 * (3 + 4)?",
+    "2^10 + 1",
+    "I walked 3 - 4 km today",
+    "Tell me a story about a cat who loves the rain.",
+    "Do you remember what we talked about yesterday?",
+    "Let's continue where we left off",
+    "I feel a bit tired, can you cheer me up?",
+    "next time let's talk about music",
+    "오늘 기분이 어때?",
+    "Could you explain how prompt caching works in llama.cpp?",
+    "stop it, that's enough",
+    "search weather in Tokyo",
+] * 4
+
+# ──────── 기존 구현 (websocket_chat 안의 extract_* 함수) ────────
+
+def legacy_weather(text):
+    match = re.search(r'\b(?:weather|forecast)\s+(?:in\s+)?([A-Za-z\s]+)', text, re.IGNORECASE)
+    return match.group(1).strip() if match else None
+
+def legacy_search(text):
+    match = re.search(r'\b(?:search|find|look\s+up)\s+(.+)', text, re.IGNORECASE)
+    return match.group(1).strip() if match else None
+
+def legacy_spotify_query(text):
+    match = re.search(r'\bplay\s+(.+?)\s+(?:on|with)\s+spotify\b', text, re.IGNORECASE)
+    return match.group(1).strip() if match else None
+
+def legacy_spotify_command(text):
+    text = text.lower()
+    if re.search(r'\b(pause|stop)\b.*(music|song)?', text):
+        return {"action": "pause"}
+    if re.search(r'\b(resume|continue)\b.*(music|song)?', text):
+        return {"action": "play"}
+    if re.search(r'\b(skip|next)\b.*(track|song|music)?', text):
+        return {"action": "next"}
+    if re.search(r'\b(previous|back)\b.*(track|song)?', text):
+        return {"action": "previous"}
+    if re.search(r'\b(volume\s+up|turn\s+up\s+the\s+volume|increase\s+volume)\b', text):
+        return {"action": "volume_up"}
+    if re.search(r'\b(volume\s+down|turn\s+down\s+the\s+volume|decrease\s+volume)\b', text):
+        return {"action": "volume_down"}
+    return None
+
+def legacy_math(text):
+    lowered = text.lower()
+    if 'spotify' in lowered or 'play' in lowered or 'music' in lowered:
+        return None
+    for expr in re.findall(r'[\(]?[0-9\.\s\+\-\*/\^()]+[\)]?', text):
+        cleaned = expr.strip().replace("^", "**")
+        if ' - ' in cleaned:
+            continue
+        if any(op in cleaned for op in ['+', '-', '*', '/', '**']):
+            return cleaned
+    return None
+
+def legacy_classify(text):
+    return {
+        "weather": legacy_weather(text),
+        "search": legacy_search(text),
+        "spotify_play": legacy_spotify_query(text),
+        "spotify_command": (legacy_spotify_command(text) or {}).get("action"),
+        "calculate": legacy_math(text),
+    }
+
+def router_classify(text):
+    found = {i["intent"]: i for i in intent_router.classify(text)}
+    return {
+        "weather": found.get("weather", {}).get("query"),
+        "search": found.get("search", {}).get("query"),
+        "spotify_play": found.get("spotify_play", {}).get("query"),
+        "spotify_command": found.get("spotify_command", {}).get("action"),
+        "calculate": found.get("calculate", {}).get("expr"),
+    }
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    mismatches = [t for t in set(SAMPLE_UTTERANCES) if legacy_classify(t) != router_classify(t)]
+    for text in mismatches:
+        print(f"[MISMATCH] {text!r}\n  legacy: {legacy_classify(text)}\n  router: {router_classify(text)}")
+
+    def run(fn):
+        for text in SAMPLE_UTTERANCES:
+            fn(text)
+
+    legacy = min(timeit.repeat(lambda: run(legacy_classify), number=number, repeat=5))
+    router = min(timeit.repeat(lambda: run(router_classify), number=number, repeat=5))
+    per_msg = lambda total: total / (number * len(SAMPLE_UTTERANCES)) * 1e6
+
+    print(f"발화 {len(SAMPLE_UTTERANCES)}개 × {number}회")
+    print(f"  기존 extract_* 체인 : {per_msg(legacy):7.2f} µs/메시지")
+    print(f"  IntentRouter        : {per_msg(router):7.2f} µs/메시지 ({legacy / router:.1f}x)")
+    print(f"  결과 불일치         : {len(mismatches)}건")
+
+if __name__ == "__main__":
+    main()
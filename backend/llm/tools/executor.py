@@ -0,0 +1,129 @@
+# backend/llm/tools/executor.py
+
+"""
+생성 전 도구 실행 단계.
+
+감지된 도구 호출을 모두 동시에 시작하고, 끝나는 순서대로 결과를 넘깁니다.
+도구마다 제한 시간(LLM_TOOL_TIMEOUT)이 있고, 단계 전체가 LLM_TOOL_STAGE_TIMEOUT을 넘으면
+남은 호출은 취소합니다. 결과 문자열은 LLM_TOOL_RESULT_MAX_CHARS로 잘라 컨텍스트를 보호합니다.
+"""
+
+import asyncio
+import os
+import time
+from typing import Awaitable, Callable
+
+TOOL_TIMEOUT = float(os.getenv("LLM_TOOL_TIMEOUT", 5))
+TOOL_STAGE_TIMEOUT = float(os.getenv("LLM_TOOL_STAGE_TIMEOUT", 8))
+TOOL_RESULT_MAX_CHARS = int(os.getenv("LLM_TOOL_RESULT_MAX_CHARS", 1000))
+
+class ToolCall:
+    __slots__ = ("name", "run", "note", "timeout", "max_chars")
+
+    def __init__(
+        self,
+        name: str,
+        run: Callable[[], Awaitable[str | None]],
+        note: Callable[[str], str] | None = None,
+        timeout: float | None = None,
+        max_chars: int | None = None,
+    ):
+        self.name = name
+        self.run = run              # 결과 문자열(없으면 None)을 반환하는 코루틴 함수
+        self.note = note            # 결과 → 컨텍스트에 넣을 문장
+        self.timeout = timeout or TOOL_TIMEOUT
+        self.max_chars = max_chars or TOOL_RESULT_MAX_CHARS
+
+class ToolResult:
+    __slots__ = ("call", "value", "error", "elapsed", "truncated")
+
+    def __init__(self, call: ToolCall, value: str | None = None, error: str | None = None, elapsed: float = 0.0, truncated: bool = False):
+        self.call = call
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+        self.truncated = truncated
+
+    @property
+    def name(self) -> str:
+        return self.call.name
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and bool(self.value)
+
+    @property
+    def note(self) -> str | None:
+        if not self.ok or self.call.note is None:
+            return None
+        return self.call.note(self.value)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "ok": self.ok,
+            "error": self.error,
+            "elapsed_ms": round(self.elapsed * 1000, 1),
+            "truncated": self.truncated,
+        }
+
+def truncate(text: str, max_chars: int) -> tuple[str, bool]:
+    if len(text) <= max_chars:
+        return text, False
+    return text[:max_chars].rstrip() + "…", True
+
+async def _run_one(call: ToolCall) -> ToolResult:
+    started = time.perf_counter()
+    try:
+        value = await asyncio.wait_for(call.run(), call.timeout)
+    except asyncio.TimeoutError:
+        print(f"[WARN] 도구 '{call.name}' 시간 초과 ({call.timeout}s)")
+        return ToolResult(call, error="timeout", elapsed=time.perf_counter() - started)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        print(f"[❌ 도구 '{call.name}' 실행 실패]: {e}")
+        return ToolResult(call, error=str(e) or type(e).__name__, elapsed=time.perf_counter() - started)
+
+    elapsed = time.perf_counter() - started
+    if value is None:
+        return ToolResult(call, elapsed=elapsed)
+    value, truncated = truncate(str(value).strip(), call.max_chars)
+    return ToolResult(call, value=value, elapsed=elapsed, truncated=truncated)
+
+async def run_tools(
+    calls: list[ToolCall],
+    on_result: Callable[[ToolResult], None] | None = None,
+    stage_timeout: float = TOOL_STAGE_TIMEOUT,
+) -> list[ToolResult]:
+    """
+    도구 호출을 동시에 실행하고 결과를 완료 순서대로 반환합니다.
+    on_result는 각 결과가 나오는 즉시 호출됩니다.
+    단계 제한 시간을 넘긴 호출은 취소되고 error="cancelled"로 채워집니다.
+    """
+    if not calls:
+        return []
+
+    started = time.perf_counter()
+    tasks = [asyncio.create_task(_run_one(call)) for call in calls]
+    results: list[ToolResult] = []
+    try:
+        for next_done in asyncio.as_completed(tasks, timeout=stage_timeout):
+            result = await next_done
+            results.append(result)
+            if on_result:
+                on_result(result)
+    except asyncio.TimeoutError:
+        print(f"[WARN] 도구 실행 단계 시간 초과 ({stage_timeout}s), 남은 도구 취소")
+    finally:
+        # 시간 초과 또는 웹소켓 종료로 취소된 경우 남은 호출 정리
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+    finished = {id(r.call) for r in results}
+    results += [ToolResult(call, error="cancelled") for call in calls if id(call) not in finished]
+
+    summary = ", ".join(f"{r.name}={'ok' if r.ok else r.error or 'empty'}({r.elapsed * 1000:.0f}ms)" for r in results)
+    print(f"[🧰 도구 실행] {time.perf_counter() - started:.2f}s - {summary}")
+    return results
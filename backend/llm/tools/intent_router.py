@@ -0,0 +1,139 @@
+# backend/llm/tools/intent_router.py
+
+"""
+사용자 메시지에서 도구 호출 의도를 찾는 라우터.
+
+모든 패턴은 모듈 로드 시 한 번만 컴파일합니다.
+먼저 키워드 하나의 정규식으로 메시지를 한 번 훑어 후보 규칙만 고르고,
+후보 규칙의 추출 패턴만 실행합니다. 대부분의 메시지는 키워드 검사에서 끝납니다.
+
+규칙의 tool은 mcp_tools.name과 같으며, enabled_tools를 넘기면
+모델에 연결되어 있고 활성화된 도구의 규칙만 실행합니다.
+"""
+
+import re
+from typing import Callable
+
+# 계산기 후보 (기존 extract_math_expr와 동일한 패턴)
+_MATH_CANDIDATE = re.compile(r'[\(]?[0-9\.\s\+\-\*/\^()]+[\)]?')
+_MATH_OPERATORS = frozenset("+-*/^")
+_MATH_BLOCKERS = ("spotify", "play", "music")
+
+_WEATHER = re.compile(r'\b(?:weather|forecast)\s+(?:in\s+)?([A-Za-z\s]+)', re.IGNORECASE)
+_SEARCH = re.compile(r'\b(?:search|find|look\s+up)\s+(.+)', re.IGNORECASE)
+_SPOTIFY_PLAY = re.compile(r'\bplay\s+(.+?)\s+(?:on|with)\s+spotify\b', re.IGNORECASE)
+
+# (action, 패턴) - 앞에 있을수록 우선
+_SPOTIFY_ACTIONS = (
+    ("pause", r'pause|stop'),
+    ("play", r'resume|continue'),
+    ("next", r'skip|next'),
+    ("previous", r'previous|back'),
+    ("volume_up", r'volume\s+up|turn\s+up\s+the\s+volume|increase\s+volume'),
+    ("volume_down", r'volume\s+down|turn\s+down\s+the\s+volume|decrease\s+volume'),
+)
+_SPOTIFY_COMMAND = re.compile(
+    "|".join(rf'\b(?P<a{i}>{pattern})\b' for i, (_, pattern) in enumerate(_SPOTIFY_ACTIONS)),
+    re.IGNORECASE,
+)
+
+class IntentRule:
+    __slots__ = ("intent", "tool", "integration", "keywords", "extract")
+
+    def __init__(self, intent: str, keywords: tuple[str, ...], extract: Callable[[str], dict | None], tool: str | None = None, integration: str | None = None):
+        self.intent = intent
+        self.tool = tool                # mcp_tools.name
+        self.integration = integration  # 렌더러에서 실행하는 통합 (spotify 등)
+        self.keywords = frozenset(keywords)
+        self.extract = extract
+
+def _extract_weather(text: str) -> dict | None:
+    match = _WEATHER.search(text)
+    return {"query": match.group(1).strip()} if match else None
+
+def _extract_search(text: str) -> dict | None:
+    match = _SEARCH.search(text)
+    return {"query": match.group(1).strip()} if match else None
+
+def _extract_spotify_play(text: str) -> dict | None:
+    match = _SPOTIFY_PLAY.search(text)
+    return {"action": "play", "query": match.group(1).strip()} if match else None
+
+def _extract_spotify_command(text: str) -> dict | None:
+    best = None
+    for match in _SPOTIFY_COMMAND.finditer(text):
+        idx = int(match.lastgroup[1:])
+        if best is None or idx < best:
+            best = idx
+            if idx == 0:
+                break
+    return {"action": _SPOTIFY_ACTIONS[best][0]} if best is not None else None
+
+def _extract_math(text: str) -> dict | None:
+    lowered = text.lower()
+    if any(word in lowered for word in _MATH_BLOCKERS):
+        return None
+    for expr in _MATH_CANDIDATE.findall(text):
+        cleaned = expr.strip().replace("^", "**")
+        if ' - ' in cleaned:
+            continue
+        if any(op in cleaned for op in ['+', '-', '*', '/', '**']):
+            return {"expr": cleaned}
+    return None
+
+DEFAULT_RULES = (
+    IntentRule("weather", ("weather", "forecast"), _extract_weather, tool="fetch_weather"),
+    IntentRule("search", ("search", "find", "look"), _extract_search, tool="search"),
+    IntentRule("spotify_play", ("play",), _extract_spotify_play, integration="spotify"),
+    IntentRule(
+        "spotify_command",
+        ("pause", "stop", "resume", "continue", "skip", "next", "previous", "back", "volume"),
+        _extract_spotify_command,
+        integration="spotify",
+    ),
+    # 키워드 대신 연산자 문자로 후보를 고름
+    IntentRule("calculate", (), _extract_math, tool="calculate"),
+)
+
+class IntentRouter:
+    def __init__(self, rules=DEFAULT_RULES):
+        self.rules = tuple(rules)
+        keywords = sorted({k for rule in self.rules for k in rule.keywords}, key=len, reverse=True)
+        self._keywords = re.compile(r'\b(' + "|".join(map(re.escape, keywords)) + r')\b', re.IGNORECASE) if keywords else None
+
+    def classify(self, text: str, enabled_tools: set[str] | None = None) -> list[dict]:
+        """
+        메시지에서 감지된 모든 의도를 규칙 순서대로 반환합니다.
+        예: [{"intent": "weather", "tool": "fetch_weather", "query": "Seoul"}]
+
+        enabled_tools가 주어지면 tool이 그 안에 없는 규칙은 건너뜁니다(통합 규칙은 항상 실행).
+        """
+        if not text:
+            return []
+
+        hits = {m.lower() for m in self._keywords.findall(text)} if self._keywords else set()
+        has_operator = not _MATH_OPERATORS.isdisjoint(text)
+
+        intents = []
+        for rule in self.rules:
+            if rule.tool and enabled_tools is not None and rule.tool not in enabled_tools:
+                continue
+            if rule.keywords:
+                if rule.keywords.isdisjoint(hits):
+                    continue
+            elif not has_operator:
+                continue
+
+            found = rule.extract(text)
+            if found is None:
+                continue
+            intent = {"intent": rule.intent}
+            if rule.tool:
+                intent["tool"] = rule.tool
+            if rule.integration:
+                intent["integration"] = rule.integration
+            intent.update(found)
+            intents.append(intent)
+        return intents
+
+intent_router = IntentRouter()
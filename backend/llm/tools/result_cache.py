@@ -0,0 +1,185 @@
+# backend/llm/tools/result_cache.py
+
+"""
+도구 결과 TTL 캐시 (날씨 / 웹 검색 등).
+
+- TTL은 mcp_tools.cache_ttl(초)로 도구마다 설정하고, 비어 있으면 DEFAULT_TOOL_TTLS를 사용합니다.
+  0이면 캐시하지 않습니다.
+- TTL이 지난 뒤에도 TOOL_CACHE_STALE_SECONDS 동안은 이전 결과를 바로 돌려주고
+  백그라운드에서 갱신합니다(stale-while-revalidate).
+- 실패나 빈 결과도 TOOL_CACHE_NEGATIVE_TTL 동안 기억해 같은 요청으로 외부 API를 반복 호출하지 않습니다.
+- 같은 키를 동시에 요청하면 외부 호출은 한 번만 합니다.
+"""
+
+import asyncio
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+TOOL_CACHE_SIZE = int(os.getenv("TOOL_CACHE_SIZE", 512))
+TOOL_CACHE_STALE_SECONDS = float(os.getenv("TOOL_CACHE_STALE_SECONDS", 600))
+TOOL_CACHE_NEGATIVE_TTL = float(os.getenv("TOOL_CACHE_NEGATIVE_TTL", 60))
+
+# mcp_tools.cache_ttl이 NULL인 도구의 기본 TTL (초)
+DEFAULT_TOOL_TTLS = {
+    "fetch_weather": 600,
+    "search": 3600,
+}
+
+_WHITESPACE = re.compile(r"\s+")
+
+class CachedToolError(Exception):
+    """최근에 실패한 요청 (negative cache)"""
+
+class _Entry:
+    __slots__ = ("value", "error", "stored_at", "ttl")
+
+    def __init__(self, value: str | None, error: str | None, ttl: float):
+        self.value = value
+        self.error = error
+        self.stored_at = time.monotonic()
+        self.ttl = ttl
+
+    def age(self) -> float:
+        return time.monotonic() - self.stored_at
+
+    @property
+    def negative(self) -> bool:
+        return self.error is not None or self.value is None
+
+def tool_ttl(tool: dict) -> float:
+    ttl = tool.get("cache_ttl")
+    if ttl is None:
+        ttl = DEFAULT_TOOL_TTLS.get(tool.get("name"), 0)
+    return max(0.0, float(ttl))
+
+def normalize_key(text: str) -> str:
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+class ToolResultCache:
+    def __init__(
+        self,
+        max_entries: int = TOOL_CACHE_SIZE,
+        stale_seconds: float = TOOL_CACHE_STALE_SECONDS,
+        negative_ttl: float = TOOL_CACHE_NEGATIVE_TTL,
+    ):
+        self.max_entries = max_entries
+        self.stale_seconds = stale_seconds
+        self.negative_ttl = negative_ttl
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+        self._refreshes: set[asyncio.Task] = set()
+
+        self._hits = 0
+        self._stale_hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+
+    async def get_or_fetch(self, tool: str, query: str, fetch: Callable[[], Awaitable[str | None]], ttl: float) -> str | None:
+        """
+        캐시된 결과를 반환하거나 fetch()로 가져와 저장합니다.
+        최근에 실패한 요청이면 CachedToolError를 발생시킵니다.
+        """
+        if ttl <= 0:
+            return await fetch()
+
+        key = (tool, normalize_key(query))
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = entry.age()
+            if age < entry.ttl:
+                self._entries.move_to_end(key)
+                return self._hit(entry)
+            if not entry.negative and age < entry.ttl + self.stale_seconds:
+                self._entries.move_to_end(key)
+                self._stale_hits += 1
+                self._refresh(key, fetch, ttl)
+                return entry.value
+
+        self._misses += 1
+        return await self._load(key, fetch, ttl)
+
+    def _hit(self, entry: _Entry) -> str | None:
+        if entry.error is not None:
+            self._negative_hits += 1
+            raise CachedToolError(entry.error)
+        if entry.value is None:
+            self._negative_hits += 1
+        else:
+            self._hits += 1
+        return entry.value
+
+    async def _load(self, key, fetch, ttl: float) -> str | None:
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            # 같은 결과를 기다리던 다른 요청까지 취소되지 않도록 오류로 전달
+            future.set_exception(CachedToolError("cancelled"))
+            future.exception()
+            raise
+        except Exception as e:
+            self._store(key, _Entry(None, str(e) or type(e).__name__, self.negative_ttl))
+            future.set_exception(e)
+            future.exception()  # 기다리는 쪽이 없어도 경고가 나지 않도록
+            raise
+        else:
+            self._store(key, _Entry(value, None, ttl if value is not None else self.negative_ttl))
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def _refresh(self, key, fetch, ttl: float):
+        if key in self._inflight:
+            return
+
+        async def refresh():
+            try:
+                await self._load(key, fetch, ttl)
+                print(f"[🔄 도구 캐시 갱신] {key[0]}: {key[1]}")
+            except Exception as e:
+                print(f"[WARN] 도구 캐시 갱신 실패 ({key[0]}): {e}")
+
+        task = asyncio.create_task(refresh())
+        self._refreshes.add(task)
+        task.add_done_callback(self._refreshes.discard)
+
+    def _store(self, key, entry: _Entry):
+        # 갱신 실패가 아직 쓸 수 있는 이전 결과를 덮어쓰지 않도록
+        previous = self._entries.get(key)
+        if entry.error is not None and previous is not None and not previous.negative and previous.age() < previous.ttl + self.stale_seconds:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self, tool: str | None = None):
+        if tool is None:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if k[0] == tool]:
+            del self._entries[key]
+
+    def stats(self) -> dict:
+        lookups = self._hits + self._stale_hits + self._negative_hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self._hits,
+            "stale_hits": self._stale_hits,
+            "negative_hits": self._negative_hits,
+            "misses": self._misses,
+            "hit_rate": round((self._hits + self._stale_hits + self._negative_hits) / lookups, 4) if lookups else None,
+            "refreshing": len(self._refreshes),
+        }
+
+tool_cache = ToolResultCache()
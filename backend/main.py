@@ -17,18 +17,37 @@ from backend.asr.routes.logs import router as logs_router
 from backend.asr.routes.asr_status import router as asr_status_router
 from backend.asr.routes.hardware_info import router as hardware_router
 import backend.asr.socket_handlers
+from backend.asr.socket_handlers import forget_session
 
 # 번역 백엔드 라이브러리
 from backend.translate.api import router as translate_api_router
 from backend.translate.service import router as translate_router
 from backend.translate.routes.asr import router as fetching_asr_router
+from backend.translate.engine import translation_service
 
 # LLM 백엔드 라이브러리
 from backend.llm.service import router as llm_router
 
+from backend.db import aio as adb
 from backend.db.database import save_log_to_db
-
-fastapi_app = FastAPI(title='Arielle AI Backend Server')
+from backend.db.log_sink import log_sink
+from backend.db.pool import close_pools
+from backend.db.schema import ensure_schema
+from backend.utils.http_client import aclose_http_clients
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await adb.run_db(ensure_schema)
+    # 스키마(translation_results.source_lang) 확인 후 번역 캐시 초기화
+    if translation_service.cache:
+        await translation_service.cache.seed()
+    yield
+    await aclose_http_clients()
+    log_sink.shutdown()
+    adb.shutdown_executor()
+    close_pools()
+
+fastapi_app = FastAPI(title='Arielle AI Backend Server', lifespan=lifespan)
 
 fastapi_app.add_middleware(
     CORSMiddleware,
@@ -64,6 +83,7 @@ async def connect(sid, environ):
 @sio.event
 async def disconnect(sid):
     print(f"[SOCKET.IO] 클라이언트 연결 해제됨: {sid}")
+    forget_session(sid)
     save_log_to_db("INFO", f"Socket disconnected: sid={sid}", "FRONTEND")
 
 @fastapi_app.get("/")
@@ -43,7 +43,7 @@ def parse_mysql_uri(uri: str):
     }
 
 @router.post("/local-sources", response_model=LocalSourceOut)
-async def create_local_source(source: LocalSourceIn):
+def create_local_source(source: LocalSourceIn):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -58,7 +58,7 @@ async def create_local_source(source: LocalSourceIn):
         conn.close()
 
 @router.post("/remote-sources", response_model=RemoteSourceOut)
-async def create_remote_source(source: RemoteSourceIn):
+def create_remote_source(source: RemoteSourceIn):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -73,7 +73,7 @@ async def create_remote_source(source: RemoteSourceIn):
         conn.close()
 
 @router.get("/local-sources", response_model=List[LocalSourceOut])
-async def get_local_sources():
+def get_local_sources():
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -84,7 +84,7 @@ async def get_local_sources():
         conn.close()
 
 @router.get("/remote-sources", response_model=List[RemoteSourceOut])
-async def get_remote_sources():
+def get_remote_sources():
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -95,7 +95,7 @@ async def get_remote_sources():
         conn.close()
 
 @router.patch("/local-sources/{source_id}", response_model=LocalSourceOut)
-async def update_local_source(source_id: int, source: LocalSourceIn):
+def update_local_source(source_id: int, source: LocalSourceIn):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -111,7 +111,7 @@ async def update_local_source(source_id: int, source: LocalSourceIn):
         conn.close()
 
 @router.patch("/remote-sources/{source_id}", response_model=RemoteSourceOut)
-async def update_remote_source(source_id: int, source: RemoteSourceIn):
+def update_remote_source(source_id: int, source: RemoteSourceIn):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -127,7 +127,7 @@ async def update_remote_source(source_id: int, source: RemoteSourceIn):
         conn.close()
 
 @router.delete("/local-sources/{source_id}")
-async def delete_local_source(source_id: int):
+def delete_local_source(source_id: int):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -139,7 +139,7 @@ async def delete_local_source(source_id: int):
         conn.close()
 
 @router.delete("/remote-sources/{source_id}")
-async def delete_remote_source(source_id: int):
+def delete_remote_source(source_id: int):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -151,7 +151,7 @@ async def delete_remote_source(source_id: int):
         conn.close()
 
 @router.get("/local-sources/{source_id}/preview")
-async def preview_local_source(source_id: int):
+def preview_local_source(source_id: int):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, HTTPException, Path
 from pydantic import BaseModel
-import httpx
 import time
 
+from backend.utils.http_client import get_http_client
+
 router = APIRouter(prefix="/llm/model")
 
 class ModelLoadRequest(BaseModel):
@@ -27,9 +28,8 @@ async def test_model_response(alias: str = Path(...)):
 
         start = time.perf_counter()
 
-        async with httpx.AsyncClient(timeout=10) as client:
-            response = await client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
+        response = await get_http_client("llm").post(url, json=payload, headers=headers, timeout=10)
+        response.raise_for_status()
 
         end = time.perf_counter()
         result = (response.json().get("choices", [{}])[0].get("message", {}).get("content") or "").strip()
@@ -45,9 +45,8 @@ async def test_model_response(alias: str = Path(...)):
 @router.get("/{alias}/check")
 async def check_model_loaded(alias: str = Path(...)):
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get("http://localhost:8080/v1/models")
-            response.raise_for_status()
+        response = await get_http_client("llm").get("http://localhost:8080/v1/models", timeout=5)
+        response.raise_for_status()
 
         models = response.json().get("data", [])
         model_ids = [m["id"] for m in models]
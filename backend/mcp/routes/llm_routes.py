@@ -4,6 +4,8 @@ from pydantic import BaseModel, model_validator
 from typing import List, Optional
 import json
 
+from backend.llm.config_cache import notify_config_changed
+
 router = APIRouter()
 
 class LLMModelIn(BaseModel):
@@ -54,7 +56,7 @@ class LLMModelPatch(BaseModel):
         return values
 
 @router.get("/llm/model")
-async def get_llm_models():
+def get_llm_models():
     try:
         from backend.db.database import get_llm_models_from_db
         models = get_llm_models_from_db()
@@ -63,7 +65,7 @@ async def get_llm_models():
         raise HTTPException(status_code=500, detail=f"모델 조회 실패: {str(e)}")
 
 @router.post("/llm/model")
-async def register_llm_model(model_info: LLMModelIn):
+def register_llm_model(model_info: LLMModelIn):
     try:
         from backend.db.database import save_llm_model_to_db
         model_id = save_llm_model_to_db(model_info)
@@ -72,26 +74,28 @@ async def register_llm_model(model_info: LLMModelIn):
         raise HTTPException(status_code=500, detail=f"LLM 모델 등록 실패: {str(e)}")
 
 @router.patch("/llm/model/{model_id}")
-async def update_llm_model(model_id: str, model_info: LLMModelPatch):
+def update_llm_model(model_id: str, model_info: LLMModelPatch):
     try:
         print(f"Received model info: {model_info}")
         from backend.db.database import update_llm_model_in_db
         update_llm_model_in_db(model_id, model_info)
+        notify_config_changed(model_id)
         return {"message": "LLM 모델 업데이트 성공"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"LLM 모델 업데이트 실패: {str(e)}")
     
 @router.delete("/llm/model/{model_id}")
-async def delete_llm_model(model_id: int):
+def delete_llm_model(model_id: int):
     try:
         from backend.db.database import delete_llm_model_from_db
         delete_llm_model_from_db(model_id)
+        notify_config_changed(model_id)
         return {"message": "LLM 모델 삭제 성공"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"LLM 모델 삭제 실패: {str(e)}")
     
 @router.get("/llm/model/{model_id}/integrations")
-async def get_model_integrations(model_id: int):
+def get_model_integrations(model_id: int):
     from backend.db.database import get_llm_models_from_db
     models = get_llm_models_from_db()
     model = next((m for m in models if m["id"] == model_id), None)
@@ -105,7 +109,7 @@ async def get_model_integrations(model_id: int):
         return {"integrations": []}
     
 @router.patch("/llm/model/{model_id}/integrations")
-async def update_model_integrations(model_id: int, payload: dict):
+def update_model_integrations(model_id: int, payload: dict):
     from backend.db.database import get_connection
     conn = get_connection()
     try:
@@ -122,12 +126,13 @@ async def update_model_integrations(model_id: int, payload: dict):
                 UPDATE llm_models SET params = %s WHERE id = %s
             """, (json.dumps(current_params), model_id))
         conn.commit()
+        notify_config_changed(model_id)
         return {"message": "Integrations updated", "model_id": model_id}
     finally:
         conn.close()
 
 @router.get("/llm/model/{model_id}/params")
-async def get_model_params(model_id: int):
+def get_model_params(model_id: int):
     from backend.db.database import get_connection
     import json
 
@@ -147,7 +152,7 @@ async def get_model_params(model_id: int):
         conn.close()
 
 @router.patch("/llm/model/{model_id}/params")
-async def update_model_params(model_id: int, payload: dict):
+def update_model_params(model_id: int, payload: dict):
     from backend.db.database import get_connection
     import json
 
@@ -164,6 +169,7 @@ async def update_model_params(model_id: int, payload: dict):
                 UPDATE llm_models SET params = %s WHERE id = %s
             """, (json.dumps(merged), model_id))
         conn.commit()
+        notify_config_changed(model_id)
         return {"message": "Params updated", "model_id": model_id}
     finally:
         conn.close()
@@ -5,7 +5,7 @@ from backend.db.database import get_connection
 router = APIRouter(prefix="/api")
 
 @router.get("/logs")
-async def get_mcp_logs():
+def get_mcp_logs():
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
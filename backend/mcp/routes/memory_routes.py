@@ -16,7 +16,7 @@ class MemoryContextSettings(BaseModel):
     context_prompts: list
 
 @router.get("/memory/settings")
-async def get_memory_settings():
+def get_memory_settings():
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -42,7 +42,7 @@ async def get_memory_settings():
         conn.close()
 
 @router.post("/memory/settings")
-async def save_memory_settings(settings: MemoryContextSettings):
+def save_memory_settings(settings: MemoryContextSettings):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -65,7 +65,7 @@ async def save_memory_settings(settings: MemoryContextSettings):
         conn.close()
 
 @router.patch("/memory/settings")
-async def update_memory_settings(settings: MemoryContextSettings):
+def update_memory_settings(settings: MemoryContextSettings):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -3,6 +3,7 @@ from fastapi import APIRouter
 from pydantic import BaseModel
 from typing import List
 from backend.db.database import get_connection
+from backend.llm.config_cache import notify_config_changed
 
 router = APIRouter(prefix="/llm/model")
 
@@ -10,7 +11,7 @@ class PromptLink(BaseModel):
     prompt_ids: List[int]
 
 @router.get("/{model_id}/prompts")
-async def get_model_prompts(model_id: int):
+def get_model_prompts(model_id: int):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -21,7 +22,7 @@ async def get_model_prompts(model_id: int):
         conn.close()
 
 @router.patch("/{model_id}/prompts")
-async def update_model_prompts(model_id: int, payload: PromptLink):
+def update_model_prompts(model_id: int, payload: PromptLink):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -32,6 +33,7 @@ async def update_model_prompts(model_id: int, payload: PromptLink):
                     VALUES (%s, %s)
                 """, (model_id, pid))
         conn.commit()
+        notify_config_changed(model_id)
         return {"message": "Model prompts updated"}
     finally:
         conn.close()
@@ -4,6 +4,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List
 from backend.db.database import get_connection, update_llm_model_params
+from backend.llm.config_cache import notify_config_changed
 
 class SourceItem(BaseModel):
     source_id: int
@@ -15,7 +16,7 @@ class SourceIdsIn(BaseModel):
 router = APIRouter(prefix="/llm/model")
 
 @router.get("/{model_id}/sources")
-async def get_model_sources(model_id: int):
+def get_model_sources(model_id: int):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -28,7 +29,7 @@ async def get_model_sources(model_id: int):
         conn.close()
 
 @router.patch("/{model_id}/sources")
-async def update_model_sources(
+def update_model_sources(
     model_id: int,
     payload: SourceIdsIn,
     source_type: str
@@ -64,6 +65,8 @@ async def update_model_sources(
                 "UPDATE llm_models SET params = %s WHERE id = %s",
                 (json.dumps(params), model_id)
             )
+        conn.commit()
+        notify_config_changed(model_id)
 
         return {"message": "Model sources updated successfully"}
     finally:
@@ -72,7 +75,7 @@ async def update_model_sources(
 
 
 @router.delete("/{model_id}/sources/{source_id}")
-async def delete_model_source(model_id: int, source_id: int):
+def delete_model_source(model_id: int, source_id: int):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -80,6 +83,7 @@ async def delete_model_source(model_id: int, source_id: int):
                 DELETE FROM llm_model_sources WHERE model_id = %s AND source_id = %s
             """, (model_id, source_id))
         conn.commit()
+        notify_config_changed(model_id)
         return {"message": "Model source deleted successfully"}
     finally:
         conn.close()
\ No newline at end of file
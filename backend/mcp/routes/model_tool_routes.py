@@ -3,6 +3,7 @@ from fastapi import APIRouter
 from pydantic import BaseModel
 from typing import List
 from backend.db.database import get_connection
+from backend.llm.config_cache import notify_config_changed
 
 router = APIRouter(prefix="/llm/model")
 
@@ -15,7 +16,7 @@ class LinkedToolOut(BaseModel):
     created_at: str
 
 @router.get("/{model_id}/tools", response_model=List[LinkedToolOut])
-async def get_model_tools(model_id: int):
+def get_model_tools(model_id: int):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -33,7 +34,7 @@ async def get_model_tools(model_id: int):
         conn.close()
 
 @router.patch("/{model_id}/tools")
-async def update_model_tools(model_id: int, payload: ToolLink):
+def update_model_tools(model_id: int, payload: ToolLink):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -44,6 +45,7 @@ async def update_model_tools(model_id: int, payload: ToolLink):
                     VALUES (%s, %s)
                 """, (model_id, tid))
         conn.commit()
+        notify_config_changed(model_id)
         return {"message": "Model tools updated"}
     finally:
         conn.close()
@@ -3,6 +3,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List, Optional
 from backend.db.database import get_connection, insert_mcp_log
+from backend.llm.config_cache import notify_config_changed
 import json
 
 router = APIRouter(prefix="/api")
@@ -23,7 +24,7 @@ class PromptOut(PromptIn):
     full: str
 
 @router.get("/prompts", response_model=List[PromptOut])
-async def get_prompts():
+def get_prompts():
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -43,7 +44,7 @@ async def get_prompts():
         conn.close()
 
 @router.post("/prompts", response_model=PromptOut)
-async def create_prompt(prompt: PromptIn):
+def create_prompt(prompt: PromptIn):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -66,7 +67,7 @@ async def create_prompt(prompt: PromptIn):
         conn.close()
 
 @router.patch("/prompts/{prompt_id}", response_model=PromptOut)
-async def update_prompt_in_db(prompt_id: int, prompt: PromptIn):
+def update_prompt_in_db(prompt_id: int, prompt: PromptIn):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -129,6 +130,7 @@ async def update_prompt_in_db(prompt_id: int, prompt: PromptIn):
             ) if field]
 
             insert_mcp_log("INFO", "PROMPT", f"Updated prompt (id={prompt_id}): {prompt.name} ({', '.join(changed_fields)})")
+            notify_config_changed()
 
             return PromptOut(
                 id=prompt_id,
@@ -142,7 +144,7 @@ async def update_prompt_in_db(prompt_id: int, prompt: PromptIn):
         conn.close()
 
 @router.delete("/prompts/{prompt_id}", status_code=204)
-async def delete_prompt(prompt_id: int):
+def delete_prompt(prompt_id: int):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -150,6 +152,7 @@ async def delete_prompt(prompt_id: int):
             conn.commit()
 
             insert_mcp_log("INFO", "PROMPT", f"Deleted prompt: id={prompt_id}")
+            notify_config_changed()
             
             if cursor.rowcount == 0:
                 raise HTTPException(status_code=404, detail="Prompt not found")
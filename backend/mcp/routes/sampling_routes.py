@@ -13,7 +13,7 @@ class SamplingSettings(BaseModel):
     repetition_penalty: float
 
 @router.get("/sampling/settings")
-async def get_sampling_settings():
+def get_sampling_settings():
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -32,7 +32,7 @@ async def get_sampling_settings():
         conn.close()
 
 @router.post("/sampling/settings")
-async def save_sampling_settings(settings: SamplingSettings):
+def save_sampling_settings(settings: SamplingSettings):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -53,7 +53,7 @@ async def save_sampling_settings(settings: SamplingSettings):
         conn.close()
 
 @router.patch("/sampling/settings")
-async def update_sampling_settings(settings: SamplingSettings):
+def update_sampling_settings(settings: SamplingSettings):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
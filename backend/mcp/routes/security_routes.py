@@ -14,7 +14,7 @@ class SecuritySettings(BaseModel):
     disable_auth: bool
 
 @router.get("/security/settings")
-async def get_security_settings():
+def get_security_settings():
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -34,7 +34,7 @@ async def get_security_settings():
         conn.close()
 
 @router.post("/security/settings")
-async def save_security_settings(settings: SecuritySettings):
+def save_security_settings(settings: SecuritySettings):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
@@ -61,7 +61,7 @@ async def save_security_settings(settings: SecuritySettings):
         conn.close()
 
 @router.patch("/security/settings")
-async def update_security_settings(settings: SecuritySettings):
+def update_security_settings(settings: SecuritySettings):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
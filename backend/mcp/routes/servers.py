@@ -2,7 +2,7 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field, HttpUrl
 from typing import List
-import time, httpx
+import time
 
 from backend.db.database import (
     list_mcp_servers,
@@ -12,6 +12,8 @@ from backend.db.database import (
     delete_mcp_server,
     insert_mcp_log
 )
+from backend.db import aio as adb
+from backend.utils.http_client import get_http_client
 
 router = APIRouter()
 
@@ -35,7 +37,7 @@ class ServerOut(ServerIn):
     password: str = ''
 
 @router.get("/servers", response_model=List[ServerOut])
-async def api_list_servers():
+def api_list_servers():
     servers = list_mcp_servers()
     for server in servers:
         server['api_key'] = server.get('api_key', '') or ''
@@ -45,7 +47,7 @@ async def api_list_servers():
     return servers
 
 @router.post("/servers", status_code=201)
-async def api_create_server(server: ServerIn):
+def api_create_server(server: ServerIn):
     if get_mcp_server(server.alias):
         raise HTTPException(status_code=400, detail="Alias 중복")
     create_mcp_server(server.model_dump())
@@ -53,7 +55,7 @@ async def api_create_server(server: ServerIn):
     return {"ok": True}
 
 @router.patch("/servers/{alias}")
-async def api_update_server(alias: str, fields: ServerIn):
+def api_update_server(alias: str, fields: ServerIn):
     if not get_mcp_server(alias):
         raise HTTPException(status_code=404, detail="서버 없음")
     update_mcp_server(alias, fields.model_dump(exclude_unset=True))
@@ -62,7 +64,7 @@ async def api_update_server(alias: str, fields: ServerIn):
     return {"ok": True}
 
 @router.delete("/servers/{alias}", status_code=204)
-async def api_delete_server(alias: str):
+def api_delete_server(alias: str):
     if not get_mcp_server(alias):
         raise HTTPException(status_code=404, detail="서버 없음")
     delete_mcp_server(alias)
@@ -70,14 +72,13 @@ async def api_delete_server(alias: str):
 
 @router.get("/servers/{alias}/status")
 async def api_server_status(alias: str):
-    srv = get_mcp_server(alias)
+    srv = await adb.get_mcp_server(alias)
     if not srv:
         raise HTTPException(status_code=404, detail="서버 없음")
     
     start = time.monotonic()
     try:
-        async with httpx.AsyncClient(timeout=5) as cli:
-            await cli.get(f"{srv['endpoint'].rstrip('/')}/healthz")
+        await get_http_client("tools").get(f"{srv['endpoint'].rstrip('/')}/healthz", timeout=5)
         status = "active"
     except Exception:
         status = "inactive"
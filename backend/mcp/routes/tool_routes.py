@@ -1,13 +1,16 @@
 # backend/mcp/routes/tool_routes.py
 import os
+import json
 from fastapi import APIRouter, HTTPException, Query
-import httpx
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List
 from backend.db.database import get_connection, insert_mcp_log
+from backend.utils.http_client import get_http_client
+from backend.llm.config_cache import notify_config_changed
+from backend.mcp.tools.python_runner import python_pool
+from backend.mcp.tools.process_executor import process_executor, powershell_argv, python_argv
 
-import subprocess
-import shlex
 import urllib.parse
 
 router = APIRouter(prefix="/api")
@@ -20,6 +23,7 @@ class ToolIn(BaseModel):
     command: str
     status: str
     enabled: bool
+    cache_ttl: int | None = None    # 결과 캐시 TTL (초)
 
 class ToolOut(ToolIn):
     id: int
@@ -27,11 +31,11 @@ class ToolOut(ToolIn):
 # ──────── CRUD Endpoints ────────
 
 @router.get("/tools", response_model=List[ToolOut])
-async def get_tools():
+def get_tools():
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
-            cursor.execute("SELECT * FROM mcp_tools")
+            cursor.execute("SELECT id, name, type, command, status, enabled, cache_ttl FROM mcp_tools")
             rows = cursor.fetchall()
             return [ToolOut(
                 id=row[0],
@@ -39,20 +43,21 @@ async def get_tools():
                 type=row[2],
                 command=row[3],
                 status=row[4],
-                enabled=row[5]
+                enabled=row[5],
+                cache_ttl=row[6]
             ) for row in rows]
     finally:
         conn.close()
 
 @router.post("/tools", response_model=ToolOut)
-async def create_tool(tool: ToolIn):
+def create_tool(tool: ToolIn):
     conn = get_connection()
     try:
         with conn.cursor() as cur:
             cur.execute("""
-                INSERT INTO mcp_tools (name, type, command, status, enabled)
-                VALUES (%s, %s, %s, %s, %s)
-            """, (tool.name, tool.type, tool.command, tool.status, tool.enabled))
+                INSERT INTO mcp_tools (name, type, command, status, enabled, cache_ttl)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """, (tool.name, tool.type, tool.command, tool.status, tool.enabled, tool.cache_ttl))
             conn.commit()
 
             insert_mcp_log("INFO", "TOOL", f"Created tool: {tool.name} ({tool.type})")
@@ -61,26 +66,35 @@ async def create_tool(tool: ToolIn):
         conn.close()
 
 @router.patch("/tools/{tool_id}", response_model=ToolOut)
-async def update_tool(tool_id: int, tool: ToolIn):
+def update_tool(tool_id: int, tool: ToolIn):
     conn = get_connection()
     try:
         with conn.cursor() as cur:
-            cur.execute("""
-                UPDATE mcp_tools
-                SET name=%s, type=%s, command=%s, status=%s, enabled=%s
-                WHERE id=%s
-            """, (tool.name, tool.type, tool.command, tool.status, tool.enabled, tool_id))
+            # cache_ttl을 보내지 않은 클라이언트는 기존 값을 유지
+            if "cache_ttl" in tool.model_fields_set:
+                cur.execute("""
+                    UPDATE mcp_tools
+                    SET name=%s, type=%s, command=%s, status=%s, enabled=%s, cache_ttl=%s
+                    WHERE id=%s
+                """, (tool.name, tool.type, tool.command, tool.status, tool.enabled, tool.cache_ttl, tool_id))
+            else:
+                cur.execute("""
+                    UPDATE mcp_tools
+                    SET name=%s, type=%s, command=%s, status=%s, enabled=%s
+                    WHERE id=%s
+                """, (tool.name, tool.type, tool.command, tool.status, tool.enabled, tool_id))
             conn.commit()
             if cur.rowcount == 0:
                 raise HTTPException(status_code=404, detail="Tool not found")
             
             insert_mcp_log("INFO", "TOOL", f"Updated tool (id={tool_id}): {tool.name}")
+            notify_config_changed()
             return ToolOut(id=tool_id, **tool.dict())
     finally:
         conn.close()
 
 @router.delete("/tools/{tool_id}", status_code=204)
-async def delete_tool(tool_id: int):
+def delete_tool(tool_id: int):
     conn = get_connection()
     try:
         with conn.cursor() as cur:
@@ -90,6 +104,7 @@ async def delete_tool(tool_id: int):
                 raise HTTPException(status_code=404, detail="Tool not found")
             
             insert_mcp_log("INFO", "TOOL", f"Deleted tool: id={tool_id}")
+            notify_config_changed()
     finally:
         conn.close()
 
@@ -100,34 +115,77 @@ async def execute_python_script(command: str = Query(..., description="Python co
         # URL 디코딩
         decoded_command = urllib.parse.unquote(command)
 
-        result = subprocess.run(
-            ['python', '-c', decoded_command],
-            text=True, capture_output=True, check=True
-        )
+        # 상주 워커 풀에서 실행 (인터프리터 시작 비용 없음, 이벤트 루프 차단 없음)
+        result = await python_pool.run(decoded_command)
+
+        if not result["ok"]:
+            insert_mcp_log("ERROR", "TOOL", f"Python tool execution failed: {decoded_command}")
+            return {"error": f"Execution failed: {result['stderr'] or result['error']}"}
 
         insert_mcp_log("PROCESS", "TOOL", f"Executed python tool: {decoded_command}")
-        return {"result": result.stdout.strip()}
-    except subprocess.CalledProcessError as e:
-        insert_mcp_log("ERROR", "TOOL", f"Python tool execution failed: {decoded_command}")
-        return {"error": f"Execution failed: {e.stderr}"}
+        return {"result": result["stdout"].strip()}
     except Exception as e:
         return {"error": f"Unexpected error: {str(e)}"}
 
+@router.get("/tools/python/stats")
+def python_pool_stats():
+    return python_pool.stats()
+
 @router.get("/tools/powershell")
 async def execute_powershell_script(command: str = Query(..., description="PowerShell command to execute")):
     try:
-        result = subprocess.run(
-            ['powershell', '-Command', command],
-            text=True, capture_output=True, check=True
-        )
+        result = await process_executor.run(powershell_argv(command))
+
+        if result.timed_out:
+            insert_mcp_log("ERROR", "TOOL", f"PowerShell execution timed out: {command}")
+            return {"error": f"Execution timed out after {result.elapsed:.1f}s", "partial": result.stdout}
+        if not result.ok:
+            insert_mcp_log("ERROR", "TOOL", f"PowerShell execution failed: {command}")
+            return {"error": f"Execution failed: {result.stderr}"}
 
         insert_mcp_log("PROCESS", "TOOL", f"Executed PowerShell tool: {command}")
         return {"result": result.stdout}
-    except subprocess.CalledProcessError as e:
-        insert_mcp_log("ERROR", "TOOL", f"PowerShell execution failed: {command}")
-        return {"error": f"Execution failed: {e.stderr}"}
     except Exception as e:
         return {"error": f"Unexpected error: {str(e)}"}
+
+def _sse(events) -> StreamingResponse:
+    async def body():
+        async for event in events:
+            name = event.pop("event")
+            yield f"event: {name}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+async def _logged_stream(kind: str, command: str, events):
+    """종료 이벤트를 보고 실행 결과를 로그에 남김"""
+    async for event in events:
+        if event["event"] == "exit":
+            if event["timed_out"]:
+                insert_mcp_log("ERROR", "TOOL", f"{kind} stream timed out: {command}")
+            elif event["returncode"] != 0:
+                insert_mcp_log("ERROR", "TOOL", f"{kind} stream failed (exit {event['returncode']}): {command}")
+            else:
+                insert_mcp_log("PROCESS", "TOOL", f"Streamed {kind} tool: {command}")
+        yield event
+
+@router.get("/tools/powershell/stream")
+async def stream_powershell_script(command: str = Query(..., description="PowerShell command to execute")):
+    """출력을 줄 단위 SSE 이벤트(stdout / stderr / exit)로 전송"""
+    return _sse(_logged_stream("PowerShell", command, process_executor.stream(powershell_argv(command))))
+
+@router.get("/tools/python/stream")
+async def stream_python_script(command: str = Query(..., description="Python command to execute")):
+    """오래 걸리는 스크립트용. 출력을 줄 단위 SSE 이벤트로 전송"""
+    decoded_command = urllib.parse.unquote(command)
+    return _sse(_logged_stream("python", decoded_command, process_executor.stream(python_argv(decoded_command))))
+
+@router.get("/tools/process/stats")
+def process_stats():
+    return process_executor.stats()
     
 @router.get("/tools/search")
 async def search_google(query: str = Query(..., description="검색어")):
@@ -141,9 +199,8 @@ async def search_google(query: str = Query(..., description="검색어")):
         "q": query
     }
 
-    async with httpx.AsyncClient() as client:
-        res = await client.get(url, params=params)
-        data = res.json()
+    res = await get_http_client("tools").get(url, params=params)
+    data = res.json()
 
     if "items" not in data or len(data["items"]) == 0:
         return {"error": "검색 결과 없음 또는 API 오류", "raw": data}
@@ -1,5 +1,6 @@
 # backend/mcp/server.py
 from fastapi import FastAPI
+from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
 from backend.mcp.routes.servers import router as servers_router
 from backend.mcp.routes.llm_routes import router as llm_router
@@ -22,7 +23,25 @@ from backend.mcp.routes.llm_load_routes import router as llm_load_router
 
 from backend.mcp.routes.integrations.spotify_routes import router as spotify_router
 
-app = FastAPI(title="Arielle MCP Control Server")
+from backend.db import aio as adb
+from backend.db.log_sink import log_sink
+from backend.db.pool import close_pools
+from backend.db.schema import ensure_schema
+from backend.utils.http_client import aclose_http_clients
+from backend.mcp.tools.python_runner import python_pool
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await adb.run_db(ensure_schema)
+    await python_pool.start()
+    yield
+    await python_pool.close()
+    await aclose_http_clients()
+    log_sink.shutdown()
+    adb.shutdown_executor()
+    close_pools()
+
+app = FastAPI(title="Arielle MCP Control Server", lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],
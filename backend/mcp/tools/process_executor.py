@@ -0,0 +1,294 @@
+# backend/mcp/tools/process_executor.py
+
+"""
+PowerShell / Python 도구용 비동기 프로세스 실행기.
+
+asyncio 서브프로세스로 실행하므로 스크립트가 오래 걸려도 다른 MCP 요청이 막히지 않습니다.
+- 동시에 실행하는 프로세스 수 제한 (PROCESS_MAX_CONCURRENCY)
+- 제한 시간(PROCESS_TIMEOUT)을 넘기면 프로세스 종료
+- stdout / stderr 각각 PROCESS_MAX_OUTPUT 바이트까지만 보관 (나머지는 읽어서 버림)
+- stream()은 출력 줄을 나오는 대로 이벤트로 넘겨 SSE로 전달할 수 있습니다
+
+Windows의 SelectorEventLoop(uvicorn --reload / --workers)는 asyncio 서브프로세스를 지원하지 않으므로
+이때는 subprocess.Popen을 띄우고 파이프 입출력을 스레드에서 처리합니다(spawn_process).
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from typing import AsyncIterator
+
+PROCESS_MAX_CONCURRENCY = int(os.getenv("PROCESS_MAX_CONCURRENCY", 4))
+PROCESS_TIMEOUT = float(os.getenv("PROCESS_TIMEOUT", 30))
+PROCESS_MAX_OUTPUT = int(os.getenv("PROCESS_MAX_OUTPUT", 64_000))
+
+_CHUNK_SIZE = 4096
+_STREAM_LIMIT = 2 ** 16     # asyncio.StreamReader 기본 한도와 동일
+_fallback_warned = False
+
+def powershell_argv(command: str) -> list[str]:
+    return ["powershell", "-NoProfile", "-NonInteractive", "-Command", command]
+
+def python_argv(code: str) -> list[str]:
+    # -u: 파이프에서도 출력이 바로 나오도록 (스트리밍)
+    return [sys.executable, "-I", "-u", "-c", code]
+
+class ProcessResult:
+    __slots__ = ("returncode", "stdout", "stderr", "timed_out", "truncated", "elapsed")
+
+    def __init__(self, returncode, stdout, stderr, timed_out, truncated, elapsed):
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.timed_out = timed_out
+        self.truncated = truncated
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out
+
+class _Capture:
+    """최대 max_bytes까지만 보관하는 출력 버퍼"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.buf = bytearray()
+        self.truncated = False
+
+    def feed(self, data: bytes):
+        room = self.max_bytes - len(self.buf)
+        if room > 0:
+            self.buf += data[:room]
+        if len(data) > room:
+            self.truncated = True
+
+    def text(self) -> str:
+        text = self.buf.decode("utf-8", errors="replace")
+        return text + "\n... (output truncated)" if self.truncated else text
+
+class _ThreadedReader:
+    """asyncio.StreamReader 대신 스레드에서 파이프를 읽는 어댑터"""
+
+    def __init__(self, pipe, limit: int):
+        self._pipe = pipe
+        self._limit = limit
+
+    async def read(self, n: int) -> bytes:
+        return await asyncio.to_thread(self._pipe.read1, n)
+
+    async def readline(self) -> bytes:
+        # 한도를 넘는 줄은 잘린 채로 반환
+        return await asyncio.to_thread(self._pipe.readline, self._limit)
+
+class _ThreadedWriter:
+    def __init__(self, pipe):
+        self._pipe = pipe
+        self._buf = bytearray()
+
+    def write(self, data: bytes):
+        self._buf += data
+
+    async def drain(self):
+        data, self._buf = bytes(self._buf), bytearray()
+
+        def flush():
+            self._pipe.write(data)
+            self._pipe.flush()
+
+        await asyncio.to_thread(flush)
+
+    def close(self):
+        try:
+            self._pipe.close()
+        except OSError:
+            pass
+
+class _ThreadedProcess:
+    """asyncio.subprocess.Process와 같은 방식으로 쓰는 subprocess.Popen 래퍼"""
+
+    def __init__(self, popen: subprocess.Popen, limit: int):
+        self._popen = popen
+        self.pid = popen.pid
+        self.stdin = _ThreadedWriter(popen.stdin) if popen.stdin else None
+        self.stdout = _ThreadedReader(popen.stdout, limit) if popen.stdout else None
+        self.stderr = _ThreadedReader(popen.stderr, limit) if popen.stderr else None
+
+    @property
+    def returncode(self):
+        return self._popen.poll()
+
+    async def wait(self) -> int:
+        return await asyncio.to_thread(self._popen.wait)
+
+    def kill(self):
+        try:
+            self._popen.kill()
+        except OSError:     # 이미 종료된 프로세스 (Windows)
+            pass
+
+async def spawn_process(*argv, limit: int = _STREAM_LIMIT, **kwargs):
+    """
+    asyncio.create_subprocess_exec와 같은 인자로 프로세스를 띄웁니다.
+    이벤트 루프가 서브프로세스를 지원하지 않으면 스레드 기반 래퍼로 대신 실행합니다.
+    """
+    global _fallback_warned
+    try:
+        return await asyncio.create_subprocess_exec(*argv, limit=limit, **kwargs)
+    except NotImplementedError:
+        if not _fallback_warned:
+            _fallback_warned = True
+            print("[WARN] 현재 이벤트 루프가 asyncio 서브프로세스를 지원하지 않아 스레드 기반 실행으로 대체합니다")
+        popen = await asyncio.to_thread(subprocess.Popen, list(argv), **kwargs)
+        return _ThreadedProcess(popen, limit)
+
+async def _kill(proc: asyncio.subprocess.Process):
+    if proc.returncode is None:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+    try:
+        await asyncio.wait_for(proc.wait(), 5)
+    except asyncio.TimeoutError:
+        print(f"[WARN] 프로세스 종료 대기 시간 초과 (pid={proc.pid})")
+
+class ProcessExecutor:
+    def __init__(self, max_concurrency: int = PROCESS_MAX_CONCURRENCY):
+        self.max_concurrency = max(1, max_concurrency)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._running = 0
+        self._runs = 0
+        self._timeouts = 0
+
+    async def _spawn(self, argv: list[str]) -> asyncio.subprocess.Process:
+        return await spawn_process(
+            *argv,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+    async def run(self, argv: list[str], timeout: float = PROCESS_TIMEOUT, max_output: int = PROCESS_MAX_OUTPUT) -> ProcessResult:
+        """프로세스를 끝까지 실행하고 출력을 모아 반환 (실행 파일이 없으면 OSError)"""
+        async with self._semaphore:
+            started = time.perf_counter()
+            proc = await self._spawn(argv)
+            self._running += 1
+            out, err = _Capture(max_output), _Capture(max_output)
+
+            async def pump(stream, capture: _Capture):
+                while chunk := await stream.read(_CHUNK_SIZE):
+                    capture.feed(chunk)
+
+            timed_out = False
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(pump(proc.stdout, out), pump(proc.stderr, err), proc.wait()),
+                    timeout,
+                )
+            except asyncio.TimeoutError:
+                timed_out = True
+                self._timeouts += 1
+            finally:
+                # 시간 초과 또는 요청 취소 시 프로세스 정리
+                await _kill(proc)
+                self._running -= 1
+                self._runs += 1
+
+            return ProcessResult(
+                proc.returncode, out.text(), err.text(), timed_out,
+                out.truncated or err.truncated, round(time.perf_counter() - started, 4),
+            )
+
+    async def stream(self, argv: list[str], timeout: float = PROCESS_TIMEOUT, max_output: int = PROCESS_MAX_OUTPUT) -> AsyncIterator[dict]:
+        """
+        출력 줄을 나오는 대로 이벤트로 넘깁니다.
+            {"event": "stdout" | "stderr", "data": 줄}
+            {"event": "exit", "returncode", "timed_out", "truncated", "elapsed"}
+        소비하는 쪽이 중간에 끊으면 프로세스를 종료합니다.
+        프로세스를 시작하지 못하면 stderr로 오류를 보낸 뒤 returncode가 None인 exit 이벤트로 끝냅니다.
+        """
+        async with self._semaphore:
+            started = time.perf_counter()
+            try:
+                proc = await self._spawn(argv)
+            except OSError as e:
+                self._runs += 1
+                yield {"event": "stderr", "data": f"failed to start process: {e}"}
+                yield {
+                    "event": "exit",
+                    "returncode": None,
+                    "timed_out": False,
+                    "truncated": False,
+                    "elapsed": round(time.perf_counter() - started, 4),
+                    "error": str(e),
+                }
+                return
+            self._running += 1
+            queue: asyncio.Queue = asyncio.Queue()
+            sent = 0
+            truncated = timed_out = False
+
+            async def pump(stream, name: str):
+                while True:
+                    try:
+                        line = await stream.readline()
+                    except ValueError:
+                        # 줄이 스트림 버퍼보다 길면 잘라서 전달
+                        line = await stream.read(_CHUNK_SIZE)
+                    if not line:
+                        break
+                    await queue.put((name, line.decode("utf-8", errors="replace").rstrip("\r\n")))
+                await queue.put((name, None))
+
+            pumps = [asyncio.create_task(pump(proc.stdout, "stdout")), asyncio.create_task(pump(proc.stderr, "stderr"))]
+            deadline = time.monotonic() + timeout
+            try:
+                open_streams = 2
+                while open_streams:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise asyncio.TimeoutError()
+                    name, line = await asyncio.wait_for(queue.get(), remaining)
+                    if line is None:
+                        open_streams -= 1
+                        continue
+                    if truncated:
+                        continue
+                    sent += len(line)
+                    if sent > max_output:
+                        truncated = True
+                        yield {"event": name, "data": "... (output truncated)"}
+                        continue
+                    yield {"event": name, "data": line}
+                await asyncio.wait_for(proc.wait(), max(0.0, deadline - time.monotonic()))
+            except asyncio.TimeoutError:
+                timed_out = True
+                self._timeouts += 1
+            finally:
+                for task in pumps:
+                    task.cancel()
+                await _kill(proc)
+                self._running -= 1
+                self._runs += 1
+
+            yield {
+                "event": "exit",
+                "returncode": proc.returncode,
+                "timed_out": timed_out,
+                "truncated": truncated,
+                "elapsed": round(time.perf_counter() - started, 4),
+            }
+
+    def stats(self) -> dict:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "running": self._running,
+            "runs": self._runs,
+            "timeouts": self._timeouts,
+        }
+
+process_executor = ProcessExecutor()
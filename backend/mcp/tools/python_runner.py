@@ -0,0 +1,250 @@
+# backend/mcp/tools/python_runner.py
+
+"""
+Python 도구 실행용 상주 워커 풀.
+
+/mcp/api/tools/python 호출마다 인터프리터를 새로 띄우지 않고,
+미리 띄워 둔 워커(python_worker.py)에 JSON 한 줄로 코드를 보내 실행합니다.
+
+- 호출마다 실행 시간(PYTHON_TOOL_TIMEOUT), CPU 시간, 메모리(RLIMIT_AS) 제한
+  (CPU/메모리 제한은 resource 모듈이 있는 OS에서만 적용)
+- 제한 시간을 넘기거나 제한에 걸린 워커는 종료하고, 다음 요청을 기다리지 않고 바로 새로 띄움
+- PYTHON_WORKER_MAX_CALLS회 실행한 워커는 교체 (전역 상태 누적 방지)
+- 워커는 -I 모드(사용자 site-packages / PYTHON* 환경 변수 무시), 임시 작업 디렉터리, 최소 환경 변수로 실행
+
+보안 샌드박스가 아닙니다. 위 제한은 실수로 인한 폭주(무한 루프, 메모리 과다 사용)를 막는 용도이며,
+실행되는 코드는 서버와 같은 사용자 권한으로 파일 시스템과 네트워크에 접근할 수 있습니다.
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from backend.mcp.tools.process_executor import spawn_process
+
+PYTHON_WORKERS = int(os.getenv("PYTHON_WORKERS", 2))
+PYTHON_TOOL_TIMEOUT = float(os.getenv("PYTHON_TOOL_TIMEOUT", 10))
+PYTHON_TOOL_CPU_SECONDS = float(os.getenv("PYTHON_TOOL_CPU_SECONDS", 5))
+PYTHON_TOOL_MEMORY_MB = int(os.getenv("PYTHON_TOOL_MEMORY_MB", 512))
+PYTHON_TOOL_MAX_OUTPUT = int(os.getenv("PYTHON_TOOL_MAX_OUTPUT", 64_000))
+PYTHON_WORKER_MAX_CALLS = int(os.getenv("PYTHON_WORKER_MAX_CALLS", 200))
+
+WORKER_SCRIPT = Path(__file__).with_name("python_worker.py")
+_STREAM_LIMIT = 8 * 1024 * 1024
+_START_TIMEOUT = 10.0
+
+class PythonToolError(Exception):
+    pass
+
+def _worker_env() -> dict:
+    keep = ("PATH", "SYSTEMROOT", "TEMP", "TMP", "LANG", "LC_ALL")
+    env = {k: os.environ[k] for k in keep if k in os.environ}
+    env["PYTHONIOENCODING"] = "utf-8"
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    return env
+
+class _Worker:
+    def __init__(self, workdir: str):
+        self.workdir = workdir
+        self.proc: asyncio.subprocess.Process | None = None
+        self.calls = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.returncode is None
+
+    async def start(self):
+        # Windows SelectorEventLoop에서는 spawn_process가 스레드 기반 실행으로 대체
+        self.proc = await spawn_process(
+            sys.executable, "-I", str(WORKER_SCRIPT),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            cwd=self.workdir,
+            env=_worker_env(),
+            limit=_STREAM_LIMIT,
+        )
+        self.calls = 0
+        line = await asyncio.wait_for(self.proc.stdout.readline(), _START_TIMEOUT)
+        if not line or not json.loads(line).get("ready"):
+            await self.kill()
+            raise PythonToolError("Python 워커 시작 실패")
+
+    async def run(self, request: dict, timeout: float) -> dict:
+        self.calls += 1
+        self.proc.stdin.write((json.dumps(request, ensure_ascii=False) + "\n").encode("utf-8"))
+        await self.proc.stdin.drain()
+        line = await asyncio.wait_for(self.proc.stdout.readline(), timeout)
+        if not line:
+            raise PythonToolError("Python 워커가 응답 없이 종료되었습니다")
+        return json.loads(line)
+
+    async def kill(self):
+        if self.proc is None:
+            return
+        if self.proc.returncode is None:
+            try:
+                self.proc.kill()
+            except ProcessLookupError:
+                pass
+            try:
+                await asyncio.wait_for(self.proc.wait(), 5)
+            except asyncio.TimeoutError:
+                pass
+        self.proc = None
+
+    async def close(self):
+        """stdin을 닫아 정상 종료시키고, 응답이 없으면 강제 종료"""
+        if self.alive:
+            try:
+                self.proc.stdin.close()
+                await asyncio.wait_for(self.proc.wait(), 2)
+            except Exception:
+                pass
+        await self.kill()
+
+class PythonWorkerPool:
+    def __init__(self, size: int = PYTHON_WORKERS):
+        self.size = max(1, size)
+        self._idle: asyncio.Queue[_Worker] | None = None
+        self._workers: list[_Worker] = []
+        self._workdir: tempfile.TemporaryDirectory | None = None
+        self._start_lock = asyncio.Lock()
+        self._ids = itertools.count(1)
+        self._replacing: set[asyncio.Task] = set()
+
+        self._runs = 0
+        self._failures = 0
+        self._timeouts = 0
+        self._restarts = 0
+
+    async def start(self):
+        async with self._start_lock:
+            if self._idle is not None:
+                return
+            self._workdir = tempfile.TemporaryDirectory(prefix="arielle-pytool-")
+            idle: asyncio.Queue[_Worker] = asyncio.Queue()
+            workers = [_Worker(self._workdir.name) for _ in range(self.size)]
+            results = await asyncio.gather(*(w.start() for w in workers), return_exceptions=True)
+            for worker, result in zip(workers, results):
+                if isinstance(result, Exception):
+                    print(f"[WARN] Python 워커 시작 실패: {result}")
+                # 시작에 실패한 워커도 큐에 넣고, 사용할 때 다시 시작
+                idle.put_nowait(worker)
+            self._workers = workers
+            self._idle = idle
+            alive = sum(w.alive for w in workers)
+            if not alive:
+                print("\033[91m" + "[ERROR] Python 워커를 하나도 시작하지 못했습니다 - Python 도구 호출이 실패할 수 있습니다" + "\033[0m")
+            print(f"[🐍 Python 워커 풀] {alive}/{self.size}개 준비")
+
+    async def run(
+        self,
+        code: str,
+        timeout: float = PYTHON_TOOL_TIMEOUT,
+        cpu_seconds: float = PYTHON_TOOL_CPU_SECONDS,
+        memory_mb: int = PYTHON_TOOL_MEMORY_MB,
+        max_output: int = PYTHON_TOOL_MAX_OUTPUT,
+    ) -> dict:
+        """
+        코드를 워커에서 실행하고 {"ok", "stdout", "stderr", "error", "elapsed"}를 반환합니다.
+        """
+        if self._idle is None:
+            await self.start()
+
+        worker = await self._idle.get()
+        started = time.perf_counter()
+        try:
+            if not worker.alive:
+                await self._restart(worker)
+            request = {
+                "id": next(self._ids),
+                "code": code,
+                "cpu": cpu_seconds,
+                "memory_mb": memory_mb,
+                "max_output": max_output,
+            }
+            try:
+                result = await worker.run(request, timeout)
+            except asyncio.TimeoutError:
+                self._timeouts += 1
+                await worker.kill()
+                result = {"ok": False, "stdout": "", "stderr": "", "error": f"timed out after {timeout}s"}
+            except (PythonToolError, ValueError, ConnectionError) as e:
+                await worker.kill()
+                result = {"ok": False, "stdout": "", "stderr": "", "error": str(e)}
+            except asyncio.CancelledError:
+                # 응답을 읽지 못한 워커는 다음 요청과 섞이지 않도록 폐기
+                await worker.kill()
+                raise
+
+            if result.pop("recycle", False) or worker.calls >= PYTHON_WORKER_MAX_CALLS:
+                await worker.close()
+        finally:
+            if worker.alive:
+                self._idle.put_nowait(worker)
+            else:
+                self._replace(worker)
+
+        self._runs += 1
+        if not result["ok"]:
+            self._failures += 1
+        result.pop("id", None)
+        result["elapsed"] = round(time.perf_counter() - started, 4)
+        return result
+
+    async def _restart(self, worker: _Worker):
+        await worker.kill()
+        await worker.start()
+        self._restarts += 1
+
+    def _replace(self, worker: _Worker):
+        """종료된 워커를 백그라운드에서 다시 띄운 뒤 큐에 돌려놓음 (다음 요청이 시작 시간을 기다리지 않도록)"""
+        idle = self._idle
+
+        async def replace():
+            try:
+                await self._restart(worker)
+            except Exception as e:
+                # 큐에는 돌려놓고 다음 사용 시 다시 시작
+                print(f"[WARN] Python 워커 재시작 실패: {e}")
+            if self._idle is idle:
+                idle.put_nowait(worker)
+            else:
+                await worker.kill()
+
+        task = asyncio.create_task(replace())
+        self._replacing.add(task)
+        task.add_done_callback(self._replacing.discard)
+
+    async def close(self):
+        if self._idle is None:
+            return
+        for task in self._replacing:
+            task.cancel()
+        await asyncio.gather(*self._replacing, return_exceptions=True)
+        await asyncio.gather(*(w.close() for w in self._workers), return_exceptions=True)
+        self._workers = []
+        self._idle = None
+        if self._workdir is not None:
+            self._workdir.cleanup()
+            self._workdir = None
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "alive": sum(w.alive for w in self._workers),
+            "idle": self._idle.qsize() if self._idle else 0,
+            "runs": self._runs,
+            "failures": self._failures,
+            "timeouts": self._timeouts,
+            "restarts": self._restarts,
+            "replacing": len(self._replacing),
+        }
+
+python_pool = PythonWorkerPool()
@@ -0,0 +1,131 @@
+# backend/mcp/tools/python_worker.py
+
+"""
+Python 도구 워커 프로세스 (python_runner가 실행).
+
+표준 입력으로 JSON 한 줄씩 요청을 받고, 표준 출력으로 JSON 한 줄씩 응답합니다.
+    요청: {"id", "code", "cpu", "memory_mb", "max_output"}
+    응답: {"id", "ok", "stdout", "stderr", "error", "recycle"}
+
+실행할 코드의 print 출력은 버퍼로 받아 응답에 담고,
+fd 0/1은 /dev/null로 돌려 코드가 프로토콜 채널을 직접 읽거나 쓰지 못하게 합니다.
+표준 라이브러리만 사용합니다 (-I 모드로 실행).
+CPU/메모리 rlimit 외에는 실행되는 코드를 제한하지 않습니다 (보안 샌드박스 아님).
+"""
+
+import io
+import json
+import os
+import signal
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+
+try:
+    import resource
+except ImportError:     # Windows: 제한 시간은 부모 프로세스가 강제 종료로 처리
+    resource = None
+
+class CpuLimitExceeded(BaseException):
+    pass
+
+def _on_cpu_limit(signum, frame):
+    raise CpuLimitExceeded()
+
+def _apply_limits(cpu: float, memory_mb: int):
+    if resource is None:
+        return
+    if cpu and hasattr(resource, "RLIMIT_CPU"):
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        used = usage.ru_utime + usage.ru_stime
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        soft = int(used + cpu) + 1
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    if memory_mb and hasattr(resource, "RLIMIT_AS"):
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        soft = memory_mb * 1024 * 1024
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+def _reset_limits():
+    if resource is None:
+        return
+    for name in ("RLIMIT_CPU", "RLIMIT_AS"):
+        if hasattr(resource, name):
+            limit = getattr(resource, name)
+            _, hard = resource.getrlimit(limit)
+            resource.setrlimit(limit, (hard, hard))
+
+def _clip(text: str, max_output: int) -> str:
+    if max_output and len(text) > max_output:
+        return text[:max_output] + f"\n... ({len(text) - max_output} chars truncated)"
+    return text
+
+def _execute(request: dict) -> dict:
+    stdout, stderr = io.StringIO(), io.StringIO()
+    ok, error, recycle = True, None, False
+
+    _apply_limits(request.get("cpu") or 0, request.get("memory_mb") or 0)
+    # 표준 입력은 프로토콜 채널이므로 실행 중에는 빈 입력으로 교체 (input()이 요청 대기로 멈추지 않도록)
+    stdin, sys.stdin = sys.stdin, io.StringIO()
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            exec(compile(request["code"], "<tool>", "exec"), {"__name__": "__main__", "__builtins__": __builtins__})
+    except SystemExit as e:
+        ok = e.code in (None, 0)
+        if not ok:
+            error = f"exit status {e.code}"
+    except CpuLimitExceeded:
+        ok, error, recycle = False, "CPU time limit exceeded", True
+    except MemoryError:
+        ok, error, recycle = False, "memory limit exceeded", True
+    except BaseException as e:
+        ok = False
+        error = "exception"
+        # 워커 자신의 프레임은 빼고 실행한 코드의 traceback만 전달
+        stderr.write("".join(traceback.format_exception(type(e), e, e.__traceback__.tb_next)))
+    finally:
+        sys.stdin = stdin
+        _reset_limits()
+
+    max_output = request.get("max_output") or 0
+    return {
+        "id": request.get("id"),
+        "ok": ok,
+        "stdout": _clip(stdout.getvalue(), max_output),
+        "stderr": _clip(stderr.getvalue(), max_output),
+        "error": error,
+        "recycle": recycle,
+    }
+
+def main():
+    # 프로토콜 전용 채널을 복제한 뒤 fd 0/1/2는 /dev/null로 돌림
+    # (os.write(1, ...)로 응답이 깨지거나 os.read(0, ...)가 다음 요청을 가로채지 않도록)
+    requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    channel = os.fdopen(os.dup(1), "w", encoding="utf-8", buffering=1)
+    os.dup2(os.open(os.devnull, os.O_RDONLY), 0)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+    sys.stdout = sys.stderr = io.StringIO()
+
+    if resource is not None and hasattr(signal, "SIGXCPU"):
+        signal.signal(signal.SIGXCPU, _on_cpu_limit)
+
+    channel.write(json.dumps({"ready": True, "pid": os.getpid()}) + "\n")
+    for line in requests:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError:
+            continue
+        response = _execute(request)
+        channel.write(json.dumps(response, ensure_ascii=False) + "\n")
+        channel.flush()
+
+if __name__ == "__main__":
+    main()
@@ -1,55 +1,80 @@
 # backend/translate/routes/translate.py
 import os
-import uuid
-import httpx
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
-from dotenv import load_dotenv
+from backend.translate.engine import (
+    translation_service,
+    TranslationConfigError,
+    TranslationError,
+)
 
 router = APIRouter()
 
+# 배치 번역 요청당 최대 텍스트 수 (Azure 요청 단위 분할은 엔진에서 처리)
+TRANSLATE_BATCH_MAX_TEXTS = int(os.getenv("TRANSLATE_BATCH_MAX_TEXTS", 5000))
+
 class TranslateRequest(BaseModel):
     text: str
     from_lang: str = 'ko'
-    to: str
+    to: str | list[str]
+
+class BatchTranslateRequest(BaseModel):
+    texts: list[str]
+    from_lang: str = 'ko'
+    to: str | list[str]
 
 @router.post('/translate')
 async def translate_text(req: TranslateRequest):
     print("📝 입력 텍스트:", req.text)
 
-    endpoint = os.getenv('AZURE_TRANSLATOR_ENDPOINT')
-    key = os.getenv('AZURE_TRANSLATOR_KEY')
-    region = os.getenv('AZURE_TRANSLATOR_REGION')
-
-    if not endpoint or not key or not region:
-        raise HTTPException(status_code=500, detail="Azure Translator API 설정이 누락되었습니다.")
-    
-    headers = {
-        'Ocp-Apim-Subscription-Key': key,
-        'Ocp-Apim-Subscription-Region': region,
-        'Content-type': 'application/json',
-        'X-ClientTraceId': str(uuid.uuid4()),
-    }
-
-    params = {
-        'api-version': '3.0',
-        'from': req.from_lang,
-        'to': [req.to],
-    }
-
-    body = [{ 'text': req.text }]
-
-    print("📤 Azure 요청 바디:", body)
-
-    async with httpx.AsyncClient() as client:
-        response = await client.post(f'{endpoint}/translate', params=params, headers=headers, json=body)
-        response.encoding = 'utf-8'
-        print("🌐 Azure 응답 내용:", response.text)
-
-    result = response.json()
-    translated = result[0]['translations'][0]['text']
-    print("🔁 번역 결과:", translated)
-    
-    return JSONResponse(content={"translated": translated})
+    try:
+        translations = await translation_service.translate(req.text, req.from_lang, req.to)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except TranslationConfigError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    except TranslationError as e:
+        print(f"[ERROR] 번역 실패: {e}")
+        raise HTTPException(status_code=502, detail=str(e))
+
+    targets = [req.to] if isinstance(req.to, str) else req.to
+    translated = translations.get(targets[0], '')
+    print("🔁 번역 결과:", translations)
+
+    return JSONResponse(content={"translated": translated, "translations": translations})
+
+@router.post('/translate/batch')
+async def translate_batch(req: BatchTranslateRequest):
+    """
+    여러 텍스트 × 여러 언어를 한 번에 번역합니다.
+    translations[i]는 texts[i]의 {lang: text} 입니다.
+    """
+    if len(req.texts) > TRANSLATE_BATCH_MAX_TEXTS:
+        raise HTTPException(status_code=413, detail=f"한 번에 최대 {TRANSLATE_BATCH_MAX_TEXTS}개까지 번역할 수 있습니다.")
+
+    print(f"📝 배치 번역 요청: {len(req.texts)}건 → {req.to}")
+
+    try:
+        translations = await translation_service.translate_many(req.texts, req.from_lang, req.to)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except TranslationConfigError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    except TranslationError as e:
+        print(f"[ERROR] 배치 번역 실패: {e}")
+        raise HTTPException(status_code=502, detail=str(e))
+
+    return JSONResponse(content={"translations": translations})
+
+@router.get('/translate/cache/stats')
+def translation_cache_stats():
+    cache = translation_service.cache
+    return cache.stats() if cache else {"enabled": False}
+
+@router.delete('/translate/cache')
+def clear_translation_cache():
+    if translation_service.cache:
+        translation_service.cache.clear()
+    return {"status": "ok"}
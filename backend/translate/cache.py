@@ -0,0 +1,191 @@
+# backend/translate/cache.py
+
+"""
+번역 결과 캐시.
+
+(정규화된 원문, 원본 언어, 대상 언어)를 키로 하는 메모리 LRU 캐시이며,
+TRANSLATE_CACHE_PERSISTENT=1이면 translation_results 테이블을 2차 저장소로 사용합니다.
+- 서버 시작 시 최근 번역 결과로 LRU를 채움 (seed, TRANSLATE_CACHE_SEED_ROWS)
+- LRU에 없는 항목은 Azure 호출 전에 테이블에서 한 번 더 조회
+- 번역 제공자가 새로 번역한 결과는 백그라운드에서 테이블에 기록 (source_type='Cache')
+
+원본 언어는 translation_results.source_lang(ensure_schema가 추가)에 저장하며,
+source_lang이 없는 행(/translate/save_translation으로 저장된 기록 등)은 원본 언어를 알 수 없으므로 사용하지 않습니다.
+"""
+
+import asyncio
+import os
+import threading
+import unicodedata
+import uuid
+from collections import OrderedDict
+
+from backend.db import aio as adb
+
+TRANSLATE_CACHE_SIZE = int(os.getenv("TRANSLATE_CACHE_SIZE", 5000))
+TRANSLATE_CACHE_PERSISTENT = os.getenv("TRANSLATE_CACHE_PERSISTENT", "0") == "1"
+TRANSLATE_CACHE_SEED_ROWS = int(os.getenv("TRANSLATE_CACHE_SEED_ROWS", 2000))
+
+def normalize_text(text: str) -> str:
+    """유니코드 정규화 + 공백 정리"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+class TranslationCache:
+    def __init__(self, max_size: int = TRANSLATE_CACHE_SIZE, persistent: bool = TRANSLATE_CACHE_PERSISTENT, seed_rows: int = TRANSLATE_CACHE_SEED_ROWS):
+        self.max_size = max(0, max_size)
+        self.persistent = persistent
+        self.seed_rows = seed_rows
+
+        self._entries: OrderedDict[tuple, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._seeded = False
+        self._writes: set[asyncio.Task] = set()
+
+        self._hits = 0
+        self._persistent_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._written = 0
+
+    def get(self, text: str, from_lang: str, to: str) -> str | None:
+        norm = normalize_text(text)
+        with self._lock:
+            value = self._get((norm, from_lang, to))
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return value
+
+    def put(self, text: str, from_lang: str, to: str, translated: str):
+        with self._lock:
+            self._put((normalize_text(text), from_lang, to), translated)
+
+    def put_many(self, rows: list[tuple[str, str, str, str]]):
+        """
+        번역 제공자가 새로 번역한 (원문, 원본 언어, 대상 언어, 번역문)들을 저장합니다.
+        persistent이면 테이블에도 백그라운드로 기록합니다.
+        """
+        if not rows:
+            return
+        with self._lock:
+            for text, from_lang, to, translated in rows:
+                self._put((normalize_text(text), from_lang, to), translated)
+        if not self.persistent:
+            return
+
+        async def write():
+            try:
+                await adb.save_cached_translations([
+                    (uuid.uuid4().hex, text, from_lang, to, translated) for text, from_lang, to, translated in rows
+                ])
+                with self._lock:
+                    self._written += len(rows)
+            except Exception as e:
+                print(f"[WARN] 번역 캐시 기록 실패: {e}")
+
+        task = asyncio.create_task(write())
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def get_many(self, texts: list[str], from_lang: str, targets: list[str]):
+        """
+        캐시에서 찾을 수 있는 번역을 채운 결과와, 아직 번역이 필요한 항목을 반환합니다.
+        반환값: (results [{lang: text}], missing {index: [lang, ...]})
+        """
+        results = [{} for _ in texts]
+        missing: dict[int, list[str]] = {}
+        with self._lock:
+            for i, text in enumerate(texts):
+                norm = normalize_text(text)
+                for lang in targets:
+                    value = self._get((norm, from_lang, lang))
+                    if value is None:
+                        missing.setdefault(i, []).append(lang)
+                    else:
+                        results[i][lang] = value
+                        self._hits += 1
+
+        if missing and self.persistent:
+            await self._load_persistent(texts, from_lang, missing, results)
+
+        with self._lock:
+            self._misses += sum(len(langs) for langs in missing.values())
+        return results, missing
+
+    async def _load_persistent(self, texts, from_lang, missing, results):
+        originals = list(dict.fromkeys(texts[i] for i in missing))
+        langs = list(dict.fromkeys(lang for ls in missing.values() for lang in ls))
+        rows = await adb.get_translations_by_originals(originals, from_lang, langs)
+
+        # 최신순으로 정렬되어 있으므로 먼저 나온 값을 사용
+        found: dict[tuple, str] = {}
+        for row in rows:
+            found.setdefault((normalize_text(row['original']), row['target_lang']), row['translated'])
+        if not found:
+            return
+
+        with self._lock:
+            for i in list(missing):
+                norm = normalize_text(texts[i])
+                remaining = []
+                for lang in missing[i]:
+                    value = found.get((norm, lang))
+                    if value is None:
+                        remaining.append(lang)
+                        continue
+                    results[i][lang] = value
+                    self._persistent_hits += 1
+                    self._put((norm, from_lang, lang), value)
+                if remaining:
+                    missing[i] = remaining
+                else:
+                    del missing[i]
+
+    async def seed(self):
+        """서버 시작 시 호출. 최근 번역 결과로 LRU를 채움"""
+        if not self.persistent or self._seeded or self.seed_rows <= 0 or self.max_size == 0:
+            return
+        rows = await adb.get_recent_translations(min(self.seed_rows, self.max_size))
+        with self._lock:
+            # 오래된 것부터 넣어 최신 항목이 LRU 뒤쪽(최근 사용)에 오도록 함
+            for row in reversed(rows):
+                self._put((normalize_text(row['original']), row['source_lang'], row['target_lang']), row['translated'])
+        self._seeded = True
+        print(f"[INFO] 번역 캐시 초기화: {len(rows)}건 로드")
+
+    def _get(self, key: tuple) -> str | None:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def _put(self, key: tuple, translated: str):
+        if self.max_size == 0:
+            return
+        self._entries[key] = translated
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._persistent_hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "persistent": self.persistent,
+                "seeded": self._seeded,
+                "hits": self._hits,
+                "persistent_hits": self._persistent_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "written": self._written,
+                "pending_writes": len(self._writes),
+                "hit_rate": round((self._hits + self._persistent_hits) / lookups, 4) if lookups else None,
+            }
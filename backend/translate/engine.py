@@ -0,0 +1,163 @@
+# backend/translate/engine.py
+
+"""
+프로세스 내부 번역 엔진.
+
+HTTP 라우트(/api/translate)와 LLM 파이프라인이 같은 TranslationService를 직접 호출합니다.
+번역 제공자는 TranslationProvider를 구현해 교체할 수 있습니다.
+"""
+
+import asyncio
+import os
+import uuid
+from abc import ABC, abstractmethod
+
+from backend.translate.cache import TranslationCache, normalize_text
+from backend.utils.http_client import get_http_client
+
+# Azure로 동시에 보내는 요청(청크) 수 상한 - 큰 배치가 429(요청 한도)에 걸리지 않도록
+AZURE_TRANSLATE_CONCURRENCY = int(os.getenv("AZURE_TRANSLATE_CONCURRENCY", 4))
+
+class TranslationError(Exception):
+    """번역 제공자 호출 실패"""
+
+class TranslationConfigError(TranslationError):
+    """번역 제공자 설정(키/엔드포인트) 누락"""
+
+class TranslationProvider(ABC):
+    name = "base"
+
+    @abstractmethod
+    async def translate_many(self, texts: list[str], from_lang: str, targets: list[str]) -> list[dict[str, str]]:
+        """
+        texts의 각 항목을 targets 언어들로 번역합니다.
+        반환값은 입력 순서를 유지한 [{lang: text}, ...] 입니다.
+        """
+
+class AzureTranslator(TranslationProvider):
+    name = "azure"
+
+    # Azure Translator v3 요청당 제한 (글자 수는 대상 언어 수만큼 곱해서 계산됨)
+    MAX_ELEMENTS = 1000
+    MAX_CHARACTERS = 50000
+
+    def __init__(self, max_concurrency: int = AZURE_TRANSLATE_CONCURRENCY):
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    def _config(self):
+        endpoint = os.getenv('AZURE_TRANSLATOR_ENDPOINT')
+        key = os.getenv('AZURE_TRANSLATOR_KEY')
+        region = os.getenv('AZURE_TRANSLATOR_REGION')
+        if not endpoint or not key or not region:
+            raise TranslationConfigError("Azure Translator API 설정이 누락되었습니다.")
+        return endpoint, key, region
+
+    async def translate_many(self, texts, from_lang, targets):
+        if not texts:
+            return []
+        config = self._config()
+        chunks = _chunk(texts, len(targets), self.MAX_ELEMENTS, self.MAX_CHARACTERS)
+
+        async def request(chunk):
+            async with self._semaphore:
+                return await self._request(config, chunk, from_lang, targets)
+
+        if len(chunks) == 1:
+            return await request(texts)
+
+        results = await asyncio.gather(*(request(chunk) for chunk in chunks))
+        return [item for chunk_result in results for item in chunk_result]
+
+    async def _request(self, config, texts, from_lang, targets):
+        endpoint, key, region = config
+
+        headers = {
+            'Ocp-Apim-Subscription-Key': key,
+            'Ocp-Apim-Subscription-Region': region,
+            'Content-type': 'application/json',
+            'X-ClientTraceId': str(uuid.uuid4()),
+        }
+        # 여러 텍스트 × 여러 언어를 한 번의 요청으로 번역 (Azure는 to 파라미터 반복을 지원)
+        params = {
+            'api-version': '3.0',
+            'from': from_lang,
+            'to': targets,
+        }
+        body = [{'text': text} for text in texts]
+
+        try:
+            response = await get_http_client("translator").post(
+                f'{endpoint}/translate', params=params, headers=headers, json=body
+            )
+        except Exception as e:
+            raise TranslationError(f"Azure Translator 요청 실패: {e}") from e
+
+        response.encoding = 'utf-8'
+        if response.status_code != 200:
+            raise TranslationError(f"Azure Translator 오류 ({response.status_code}): {response.text}")
+
+        result = response.json()
+        if len(result) != len(texts):
+            raise TranslationError(f"Azure Translator 응답 개수가 요청과 다릅니다: {len(result)} != {len(texts)}")
+        return [{t['to']: t['text'] for t in item['translations']} for item in result]
+
+class TranslationService:
+    def __init__(self, provider: TranslationProvider, cache: TranslationCache | None = None):
+        self.provider = provider
+        self.cache = cache
+
+    async def translate(self, text: str, from_lang: str, to: str | list[str]) -> dict[str, str]:
+        """텍스트 하나를 하나 이상의 언어로 번역해 {lang: text}로 반환"""
+        targets = _targets(to)
+        return (await self.translate_many([text], from_lang, targets))[0]
+
+    async def translate_many(self, texts: list[str], from_lang: str, to: str | list[str]) -> list[dict[str, str]]:
+        targets = _targets(to)
+        texts = list(texts)
+        if not texts:
+            return []
+        if self.cache is None:
+            return await self.provider.translate_many(texts, from_lang, targets)
+
+        results, missing = await self.cache.get_many(texts, from_lang, targets)
+        if not missing:
+            return results
+
+        # 필요한 언어 조합별로 묶고, 같은 원문은 한 번만 요청
+        groups: dict[tuple, dict[str, list[int]]] = {}
+        for i, langs in missing.items():
+            groups.setdefault(tuple(langs), {}).setdefault(normalize_text(texts[i]), []).append(i)
+
+        for langs, by_text in groups.items():
+            indices = list(by_text.values())
+            translated = await self.provider.translate_many([texts[idx[0]] for idx in indices], from_lang, list(langs))
+            self.cache.put_many([
+                (texts[idx[0]], from_lang, lang, value)
+                for idx, item in zip(indices, translated) for lang, value in item.items()
+            ])
+            for idx, item in zip(indices, translated):
+                for i in idx:
+                    results[i].update(item)
+        return results
+
+def _chunk(texts: list[str], n_targets: int, max_elements: int, max_characters: int) -> list[list[str]]:
+    """요청 제한에 맞게 순서를 유지하며 분할 (제한보다 긴 단일 텍스트는 단독 청크)"""
+    chunks, current, chars = [], [], 0
+    for text in texts:
+        cost = len(text) * n_targets
+        if current and (len(current) >= max_elements or chars + cost > max_characters):
+            chunks.append(current)
+            current, chars = [], 0
+        current.append(text)
+        chars += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+def _targets(to: str | list[str]) -> list[str]:
+    targets = [to] if isinstance(to, str) else list(dict.fromkeys(to))
+    if not targets:
+        raise ValueError("번역 대상 언어(to)가 비어 있습니다.")
+    return targets
+
+translation_service = TranslationService(AzureTranslator(), TranslationCache())
@@ -6,7 +6,7 @@ from backend.db.database import get_connection
 router = APIRouter()
 
 @router.get("/asr/latest")
-async def get_latest_asr():
+def get_latest_asr():
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
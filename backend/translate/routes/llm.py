@@ -5,7 +5,7 @@ from backend.db.database import get_connection
 router = APIRouter()
 
 @router.get('/llm/latest')
-async def get_latest_llm():
+def get_latest_llm():
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
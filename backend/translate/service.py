@@ -1,7 +1,8 @@
 # backend/translate/service.py
 from fastapi import APIRouter, Request
 from pydantic import BaseModel
-from backend.db.database import save_translation_result, get_connection
+from backend.db.database import get_connection
+from backend.db import aio as adb
 
 router = APIRouter()
 
@@ -12,7 +13,7 @@ class FavoriteUpdate(BaseModel):
 @router.post('/save_translation')
 async def save_translation(request: Request):
     data = await request.json()
-    save_translation_result(
+    await adb.save_translation_result(
         client_id=data.get('id'),
         original=data.get('original', ''),
         translated=data.get('translated', ''),
@@ -22,7 +23,7 @@ async def save_translation(request: Request):
     return {'status': 'ok'}
 
 @router.patch("/favorite")
-async def toggle_favorite(data: dict):
+def toggle_favorite(data: dict):
     client_id = data["id"]
     favorite = data["favorite"]
 
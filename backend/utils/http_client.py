@@ -0,0 +1,71 @@
+# backend/utils/http_client.py
+
+"""
+프로세스 공용 httpx.AsyncClient 모음.
+
+요청마다 AsyncClient를 새로 만들면 매번 TCP/TLS 연결을 다시 맺으므로,
+대상(upstream)별로 keep-alive 커넥션 풀을 가진 클라이언트를 재사용합니다.
+클라이언트는 처음 사용할 때 생성되고, 앱 lifespan 종료 시 aclose_http_clients()로 닫힙니다.
+"""
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# 대상별 타임아웃 / 커넥션 제한
+_PROFILES = {
+    # llama.cpp 채팅 서버 (:8080) — 스트리밍 응답이므로 read 타임아웃 없음
+    "llm": {
+        "timeout": httpx.Timeout(connect=5.0, read=None, write=30.0, pool=30.0),
+        "limits": httpx.Limits(max_connections=16, max_keepalive_connections=8, keepalive_expiry=120),
+    },
+    # llama.cpp 감정 분석 서버 (:8081)
+    "emotion": {
+        "timeout": httpx.Timeout(60.0, connect=5.0),
+        "limits": httpx.Limits(max_connections=8, max_keepalive_connections=4, keepalive_expiry=120),
+    },
+    # Azure Translator
+    "translator": {
+        "timeout": httpx.Timeout(15.0, connect=5.0),
+        "limits": httpx.Limits(max_connections=16, max_keepalive_connections=8, keepalive_expiry=60),
+    },
+    # 날씨 / 검색 등 외부 도구 API 및 MCP 서버
+    "tools": {
+        "timeout": httpx.Timeout(15.0, connect=5.0),
+        "limits": httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=60),
+    },
+    # 같은 호스트 내 백엔드 간 호출
+    "internal": {
+        "timeout": httpx.Timeout(30.0, connect=2.0),
+        "limits": httpx.Limits(max_connections=16, max_keepalive_connections=8, keepalive_expiry=60),
+    },
+}
+
+_clients: dict[str, httpx.AsyncClient] = {}
+
+def get_http_client(name: str = "tools") -> httpx.AsyncClient:
+    """
+    이름(profile)에 해당하는 공용 AsyncClient를 반환합니다.
+    반환된 클라이언트를 async with로 감싸거나 직접 닫지 마세요.
+    """
+    client = _clients.get(name)
+    if client is None or client.is_closed:
+        profile = _PROFILES.get(name)
+        if profile is None:
+            raise ValueError(f"알 수 없는 HTTP 클라이언트 프로필입니다: {name}")
+        client = httpx.AsyncClient(http2=HTTP2_AVAILABLE, **profile)
+        _clients[name] = client
+    return client
+
+async def aclose_http_clients():
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as e:
+            print(f"[WARN] HTTP 클라이언트 종료 실패: {e}")
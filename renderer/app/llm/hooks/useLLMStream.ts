@@ -23,6 +23,14 @@ type WSInteractionEvent = {
     toolCall?: { integration?: string } & ToolCallPayload
 }
 
+type WSTranslatedPartialEvent = {
+    type: 'translated_partial'
+    index: number
+    source?: string
+    translated?: string
+    ja_translated?: string
+}
+
 type ToolCard = {
     integration: string
     title?: string
@@ -40,6 +48,10 @@ export function useLLMStream() {
     const reconnectTimerRef = useRef<number | null>(null)
     const backoffAttemptRef = useRef(0)
     const manualCloseRef = useRef(false)
+    const sessionIdRef = useRef<string | null>(null)
+    // sessionIdRef가 속한 모델 (모델을 바꾸면 이전 모델의 세션을 이어 쓰지 않음)
+    const sessionModelRef = useRef<string | null>(null)
+    const pendingInputRef = useRef<string | null>(null)
 
     const addMessage = useLLMStore((s) => s.addMessage)
     const addStreamingChunk = useLLMStore((s) => s.addStreamingChunk)
@@ -102,6 +114,16 @@ export function useLLMStream() {
         }
     }
 
+    // 화면의 대화를 서버 세션 이력 형식으로 (마지막 사용자 메시지는 지금 보내는 입력이므로 제외)
+    const buildHistory = () => {
+        const history = useLLMStore
+            .getState()
+            .messages.filter((m) => (m.role === 'user' || m.role === 'assistant') && m.message)
+            .map((m) => ({ role: m.role, content: m.message }))
+        if (history.length && history[history.length - 1].role === 'user') history.pop()
+        return history
+    }
+
     const normalizeToolCard = (toolCall: any, result: any): ToolCard => {
         const integration = toolCall?.integration ?? 'Tool'
         if (result && Array.isArray(result.items)) {
@@ -162,6 +184,54 @@ export function useLLMStream() {
 
             try {
                 const parsed = JSON.parse(data) as unknown
+                if (parsed && typeof parsed === 'object' && (parsed as any).type === 'pong') {
+                    return
+                }
+                if (parsed && typeof parsed === 'object' && (parsed as any).type === 'session') {
+                    // 대화 이력은 서버 세션에 보관되므로 이후에는 새 메시지만 전송
+                    sessionIdRef.current = (parsed as any).session_id ?? null
+                    return
+                }
+                if (parsed && typeof parsed === 'object' && (parsed as any).type === 'session_expired') {
+                    // 서버가 세션 이력을 잃음 (재시작 등) - 화면의 대화를 이력으로 넘겨 새 세션에서 다시 요청
+                    sessionIdRef.current = null
+                    const input = pendingInputRef.current
+                    const modelId = useMCPStore.getState().activeModelId
+                    if (input != null && modelId) {
+                        sessionModelRef.current = modelId
+                        ws.send(JSON.stringify({ model_id: modelId, session_id: null, message: input, history: buildHistory() }))
+                    }
+                    return
+                }
+                if (
+                    parsed &&
+                    typeof parsed === 'object' &&
+                    (parsed as any).type === 'translated_partial'
+                ) {
+                    const evt = parsed as WSTranslatedPartialEvent
+
+                    // 생성 중인 응답의 번역 자막을 문장 단위로 이어 붙임 (최종 번역은 interaction_id에서 덮어씀)
+                    useLLMStore.setState((state) => {
+                        const idx = state.messages.findLastIndex((m) => m.role === 'assistant' && !m.interactionId)
+                        if (idx < 0) return {}
+                        const last = state.messages[idx]
+                        const msgs = [...state.messages]
+                        msgs[idx] = {
+                            ...last,
+                            translatedMessage: evt.translated
+                                ? last.translatedMessage
+                                    ? `${last.translatedMessage} ${evt.translated}`
+                                    : evt.translated
+                                : last.translatedMessage,
+                            jaTranslatedMessage: evt.ja_translated
+                                ? (last.jaTranslatedMessage ?? '') + evt.ja_translated
+                                : last.jaTranslatedMessage,
+                        }
+                        return { messages: msgs }
+                    })
+                    return
+                }
+
                 if (
                     parsed &&
                     typeof parsed === 'object' &&
@@ -189,17 +259,18 @@ export function useLLMStream() {
                     }
 
                     useLLMStore.setState((state) => {
+                        const idx = state.messages.findLastIndex((m) => m.role === 'assistant' && !m.interactionId)
+                        if (idx < 0) {
+                            console.warn('[interaction_id] 마지막 메시지 없음', state.messages)
+                            return {}
+                        }
                         const msgs = [...state.messages]
-                        const last = [...msgs]
-                            .reverse()
-                            .find((m) => m.role === 'assistant' && !m.interactionId)
-                        if (last) {
-                            last.interactionId = evt.id
-                            last.translatedMessage = evt.translated
-                            last.jaTranslatedMessage = evt.ja_translated
-                            last.isFinal = true
-                        } else {
-                            console.warn('[interaction_id] 마지막 메시지 없음', msgs)
+                        msgs[idx] = {
+                            ...msgs[idx],
+                            interactionId: evt.id,
+                            translatedMessage: evt.translated,
+                            jaTranslatedMessage: evt.ja_translated,
+                            isFinal: true,
                         }
                         return { messages: msgs }
                     })
@@ -311,18 +382,25 @@ export function useLLMStream() {
             return
         }
 
+        // 대화가 비워졌으면 새 세션으로 시작
         const messages = useLLMStore.getState().messages
-        const recentWindow = messages
-            .filter((m) => m.role === 'user' || m.role === 'assistant')
-            .slice(-16)
-            .map((m) => ({ role: m.role, content: m.message }))
-
-        recentWindow.push({ role: 'user', content: input })
+        if (!messages.some((m) => m.role === 'assistant')) {
+            sessionIdRef.current = null
+        }
+        // 대화 중 모델을 바꾸면 새 세션을 만들고 화면의 대화를 이력으로 넘김
+        const modelChanged = sessionIdRef.current !== null && sessionModelRef.current !== modelId
+        if (modelChanged) {
+            sessionIdRef.current = null
+        }
+        sessionModelRef.current = modelId
 
         const payload = {
             model_id: modelId,
-            messages: recentWindow,
+            session_id: sessionIdRef.current,
+            message: input,
+            ...(modelChanged ? { history: buildHistory() } : {}),
         }
+        pendingInputRef.current = input
 
         ensureOpenAnd(() => {
             try {